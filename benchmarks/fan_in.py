@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Benchmark validate_spec on a synthetic spec with heavy $ref fan-in.
+
+A handful of definitions are referenced from every response, parameter and
+property of the spec, as in large real world specs sharing common models.
+
+Usage: python benchmarks/fan_in.py [--paths N] [--definitions N] [--repeat N]
+"""
+import argparse
+import copy
+import time
+import warnings
+
+from swagger_spec_validator.validator20 import validate_spec
+
+
+def make_spec(num_paths, num_definitions):
+    definitions = {
+        "Error": {
+            "type": "object",
+            "required": ["code"],
+            "properties": {
+                "code": {"type": "integer"},
+                "message": {"type": "string"},
+            },
+        },
+    }
+    for i in range(num_definitions):
+        definitions[f"Model{i}"] = {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "error": {"$ref": "#/definitions/Error"},
+                "related": {
+                    "type": "array",
+                    "items": {
+                        "$ref": f"#/definitions/Model{(i + 1) % num_definitions}"
+                    },
+                },
+            },
+        }
+
+    paths = {}
+    for i in range(num_paths):
+        model_ref = {"$ref": f"#/definitions/Model{i % num_definitions}"}
+        paths[f"/resource{i}/{{id}}"] = {
+            "parameters": [{"$ref": "#/parameters/Id"}],
+            "get": {
+                "responses": {
+                    "200": {"description": "OK", "schema": model_ref},
+                    "default": {
+                        "description": "Error",
+                        "schema": {"$ref": "#/definitions/Error"},
+                    },
+                },
+            },
+            "put": {
+                "parameters": [
+                    {"name": "body", "in": "body", "schema": dict(model_ref)},
+                ],
+                "responses": {
+                    "204": {"description": "Updated"},
+                    "default": {"$ref": "#/responses/Error"},
+                },
+            },
+        }
+
+    return {
+        "swagger": "2.0",
+        "info": {"title": "Fan-in benchmark", "version": "1.0"},
+        "paths": paths,
+        "definitions": definitions,
+        "parameters": {
+            "Id": {"name": "id", "in": "path", "required": True, "type": "string"},
+        },
+        "responses": {
+            "Error": {
+                "description": "Error",
+                "schema": {"$ref": "#/definitions/Error"},
+            },
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=500)
+    parser.add_argument("--definitions", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spec = make_spec(args.paths, args.definitions)
+    # Warm up the schema caches
+    validate_spec(copy.deepcopy(spec))
+
+    timings = []
+    for _ in range(args.repeat):
+        spec_copy = copy.deepcopy(spec)
+        start = time.perf_counter()
+        validate_spec(spec_copy)
+        timings.append(time.perf_counter() - start)
+
+    print(
+        f"{args.paths} paths, {args.definitions} definitions: "
+        f"best {min(timings):.3f}s, mean {sum(timings) / len(timings):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+"""Benchmark the time it takes to import swagger_spec_validator.
+
+Importing the package only loads common and the standard library modules it
+needs, the rest is loaded on first use. Each run imports it in a fresh
+interpreter with ``-X importtime``.
+
+Usage: python benchmarks/import_time.py [--repeat N]
+"""
+import argparse
+import subprocess
+import sys
+
+
+def time_import(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # Lines look like "import time: <self us> | <cumulative us> | <module>"
+    for line in result.stderr.splitlines():
+        fields = line.split(":", 1)[1].split("|")
+        if fields[2].strip() == module:
+            return int(fields[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    timings = [time_import("swagger_spec_validator") for _ in range(args.repeat)]
+    print(
+        f"import swagger_spec_validator: best {min(timings) / 1000:.1f}ms, "
+        f"mean {sum(timings) / len(timings) / 1000:.1f}ms",
+    )
+
+
+if __name__ == "__main__":
+    main()
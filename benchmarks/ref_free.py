@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""Benchmark validate_spec on a synthetic spec without any $ref.
+
+Generated specs often inline every schema. The same spec is also validated
+with a single unused $ref added, which sends it through the dereferencing
+validators, to show the cost they add.
+
+Usage: python benchmarks/ref_free.py [--paths N] [--repeat N]
+"""
+import argparse
+import copy
+import time
+import warnings
+
+from swagger_spec_validator.validator20 import validate_spec
+
+
+def make_model():
+    return {
+        "type": "object",
+        "required": ["id"],
+        "properties": {
+            "id": {"type": "string"},
+            "count": {"type": "integer", "default": 0},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "error": {
+                "type": "object",
+                "properties": {
+                    "code": {"type": "integer"},
+                    "message": {"type": "string"},
+                },
+            },
+        },
+    }
+
+
+def make_spec(num_paths):
+    paths = {}
+    for i in range(num_paths):
+        paths[f"/resource{i}/{{id}}"] = {
+            "parameters": [
+                {"name": "id", "in": "path", "required": True, "type": "string"},
+            ],
+            "get": {
+                "parameters": [
+                    {"name": "limit", "in": "query", "type": "integer", "default": 10},
+                ],
+                "responses": {
+                    "200": {"description": "OK", "schema": make_model()},
+                    "default": {"description": "Error", "schema": make_model()},
+                },
+            },
+            "put": {
+                "parameters": [
+                    {"name": "body", "in": "body", "schema": make_model()},
+                ],
+                "responses": {"204": {"description": "Updated"}},
+            },
+        }
+
+    return {
+        "swagger": "2.0",
+        "info": {"title": "Ref-free benchmark", "version": "1.0"},
+        "paths": paths,
+        "definitions": {f"Model{i}": make_model() for i in range(10)},
+    }
+
+
+def time_validate_spec(spec, repeat):
+    # Warm up the schema caches
+    validate_spec(copy.deepcopy(spec))
+
+    timings = []
+    for _ in range(repeat):
+        spec_copy = copy.deepcopy(spec)
+        start = time.perf_counter()
+        validate_spec(spec_copy)
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paths", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spec = make_spec(args.paths)
+    spec_with_ref = dict(spec, **{"x-unused": {"$ref": "#/info"}})
+    for label, spec_dict in (("without $ref", spec), ("with a $ref", spec_with_ref)):
+        best, mean = time_validate_spec(spec_dict, args.repeat)
+        print(
+            f"{args.paths} paths, {label}: best {best:.3f}s, mean {mean:.3f}s",
+        )
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    main()
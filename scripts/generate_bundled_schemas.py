@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Generate swagger_spec_validator/_bundled_schemas.py from the json schemas
+in swagger_spec_validator/schemas.
+
+Run it (``make bundled-schemas``) after changing any of the schemas;
+tests/bundled_schemas_test.py fails while the module is out of date.
+"""
+import json
+import os
+import sys
+
+BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+PACKAGE_DIR = os.path.join(BASE_DIR, "swagger_spec_validator")
+OUTPUT_PATH = os.path.join(PACKAGE_DIR, "_bundled_schemas.py")
+
+HEADER = '''\
+# This file is generated by scripts/generate_bundled_schemas.py, do not edit.
+"""The json schemas of swagger_spec_validator/schemas as Python literals.
+
+Importing this module loads them from its compiled bytecode, which is much
+faster than reading and parsing the json files.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+SCHEMAS: dict[str, Any] = {
+'''
+
+
+def iter_schema_paths():
+    schemas_dir = os.path.join(PACKAGE_DIR, "schemas")
+    for version in sorted(os.listdir(schemas_dir)):
+        for name in sorted(os.listdir(os.path.join(schemas_dir, version))):
+            if name.endswith(".json"):
+                yield f"schemas/{version}/{name}"
+
+
+def render():
+    lines = [HEADER]
+    for resource_path in iter_schema_paths():
+        with open(os.path.join(PACKAGE_DIR, resource_path), encoding="utf-8") as f:
+            schema = json.load(f)
+        lines.append(f"    {resource_path!r}: {schema!r},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main():
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write(render())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
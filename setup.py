@@ -35,6 +35,9 @@ setup(
     python_requires=">=3.8",
     include_package_data=True,
     install_requires=install_requires,
+    extras_require={
+        "orjson": ["orjson"],
+    },
     license=about["__license__"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -1,7 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import TYPE_CHECKING
+
 from swagger_spec_validator.common import SwaggerValidationError
-from swagger_spec_validator.util import validate_spec_url
+
+if TYPE_CHECKING:
+    from swagger_spec_validator.util import validate_spec_bytes
+    from swagger_spec_validator.util import validate_spec_url
 
 __all__ = [
     "SwaggerValidationError",
+    "validate_spec_bytes",
     "validate_spec_url",
 ]
+
+# Imported on first access, as they pull in the validators, jsonschema and yaml
+_LAZY_ATTRIBUTES = {
+    "validate_spec_bytes": "swagger_spec_validator.util",
+    "validate_spec_url": "swagger_spec_validator.util",
+}
+# Submodules that importing the package used to import as well, so that they
+# remain available as attributes of the package
+_LAZY_SUBMODULES = frozenset(
+    ("common", "ref_validators", "util", "validator12", "validator20")
+)
+
+
+def __getattr__(name: str) -> Any:
+    import importlib
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        # Importing the submodule also sets it as an attribute of the package
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | _LAZY_SUBMODULES)
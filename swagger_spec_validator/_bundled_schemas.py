@@ -0,0 +1,24 @@
+# This file is generated by scripts/generate_bundled_schemas.py, do not edit.
+"""The json schemas of swagger_spec_validator/schemas as Python literals.
+
+Importing this module loads them from its compiled bytecode, which is much
+faster than reading and parsing the json files.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+SCHEMAS: dict[str, Any] = {
+    'schemas/v1.2/apiDeclaration.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'additionalProperties': False, 'definitions': {'apiObject': {'additionalProperties': False, 'properties': {'description': {'type': 'string'}, 'operations': {'items': {'$ref': 'operationObject.json#'}, 'type': 'array'}, 'path': {'format': 'uri-template', 'pattern': '^/', 'type': 'string'}}, 'required': ['path', 'operations'], 'type': 'object'}, 'mimeTypeArray': {'items': {'format': 'mime-type', 'type': 'string'}, 'type': 'array'}}, 'properties': {'apiVersion': {'type': 'string'}, 'apis': {'items': {'$ref': '#/definitions/apiObject'}, 'type': 'array'}, 'authorizations': {'$ref': 'authorizationObject.json#'}, 'basePath': {'format': 'uri', 'pattern': '^http://', 'type': 'string'}, 'consumes': {'$ref': '#/definitions/mimeTypeArray'}, 'models': {'additionalProperties': {'$ref': 'modelsObject.json#'}, 'type': 'object'}, 'produces': {'$ref': '#/definitions/mimeTypeArray'}, 'resourcePath': {'format': 'uri', 'pattern': '^/', 'type': 'string'}, 'swaggerVersion': {'enum': ['1.2']}}, 'required': ['swaggerVersion', 'basePath', 'apis'], 'type': 'object'},
+    'schemas/v1.2/authorizationObject.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'additionalProperties': {'oneOf': [{'$ref': '#/definitions/basicAuth'}, {'$ref': '#/definitions/apiKey'}, {'$ref': '#/definitions/oauth2'}]}, 'definitions': {'apiKey': {'additionalProperties': False, 'properties': {'keyname': {'type': 'string'}, 'passAs': {'enum': ['header', 'query']}, 'type': {'enum': ['apiKey']}}, 'required': ['type', 'passAs', 'keyname']}, 'basicAuth': {'additionalProperties': False, 'properties': {'type': {'enum': ['basicAuth']}}, 'required': ['type']}, 'oauth2': {'additionalProperties': False, 'properties': {'grantTypes': {'$ref': 'oauth2GrantType.json#'}, 'scopes': {'items': {'$ref': '#/definitions/oauth2Scope'}, 'type': 'array'}, 'type': {'enum': ['oauth2']}}, 'required': ['type', 'grantTypes'], 'type': 'object'}, 'oauth2Scope': {'additionalProperties': False, 'properties': {'description': {'type': 'string'}, 'scope': {'type': 'string'}}, 'required': ['scope'], 'type': 'object'}}, 'type': 'object'},
+    'schemas/v1.2/dataType.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'definitions': {'arrayType': {'additionalProperties': False, 'properties': {'items': {'items': {'$ref': '#/definitions/itemsObject'}, 'type': 'array'}, 'type': {'enum': ['array']}, 'uniqueItems': {'type': 'boolean'}}, 'required': ['type', 'items']}, 'itemsObject': {'oneOf': [{'$ref': '#/definitions/refType'}, {'allOf': [{'$ref': '#/definitions/primitiveType'}, {'additionalProperties': False, 'properties': {'format': {}, 'type': {}}}]}]}, 'modelType': {'additionalProperties': False, 'properties': {'type': {'not': {'enum': ['boolean', 'integer', 'number', 'string', 'array']}, 'type': 'string'}}, 'required': ['type']}, 'primitiveType': {'additionalProperties': False, 'dependencies': {'enum': {'properties': {'type': {'enum': ['string']}}}, 'format': {'oneOf': [{'properties': {'format': {'enum': ['int32', 'int64']}, 'type': {'enum': ['integer']}}}, {'properties': {'format': {'enum': ['float', 'double']}, 'type': {'enum': ['number']}}}, {'properties': {'format': {'enum': ['byte', 'date', 'date-time']}, 'type': {'enum': ['string']}}}]}, 'maximum': {'properties': {'type': {'enum': ['integer', 'number']}}}, 'minimum': {'properties': {'type': {'enum': ['integer', 'number']}}}}, 'properties': {'defaultValue': {'not': {'type': ['array', 'object', 'null']}}, 'enum': {'items': {'type': 'string'}, 'minItems': 1, 'type': 'array', 'uniqueItems': True}, 'format': {'type': 'string'}, 'maximum': {'type': 'string'}, 'minimum': {'type': 'string'}, 'type': {'enum': ['boolean', 'integer', 'number', 'string']}}, 'required': ['type']}, 'refType': {'additionalProperties': False, 'properties': {'$ref': {'type': 'string'}}, 'required': ['$ref']}, 'voidType': {'enum': [{'type': 'void'}]}}, 'description': 'Data type as described by the specification (version 1.2)', 'oneOf': [{'$ref': '#/definitions/refType'}, {'$ref': '#/definitions/voidType'}, {'$ref': '#/definitions/primitiveType'}, {'$ref': '#/definitions/modelType'}, {'$ref': '#/definitions/arrayType'}], 'type': 'object'},
+    'schemas/v1.2/dataTypeBase.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'definitions': {'itemsObject': {'oneOf': [{'additionalProperties': False, 'properties': {'$ref': {'type': 'string'}}, 'required': ['$ref'], 'type': 'object'}, {'allOf': [{'$ref': '#'}, {'additionalProperties': False, 'properties': {'format': {}, 'type': {}}, 'required': ['type']}]}]}}, 'dependencies': {'format': {'oneOf': [{'properties': {'format': {'enum': ['int32', 'int64']}, 'type': {'enum': ['integer']}}}, {'properties': {'format': {'enum': ['float', 'double']}, 'type': {'enum': ['number']}}}, {'properties': {'format': {'enum': ['byte', 'date', 'date-time']}, 'type': {'enum': ['string']}}}]}}, 'description': 'Data type fields (section 4.3.3)', 'oneOf': [{'required': ['type']}, {'required': ['$ref']}], 'properties': {'$ref': {'type': 'string'}, 'defaultValue': {'not': {'type': ['array', 'object', 'null']}}, 'enum': {'items': {'type': 'string'}, 'minItems': 1, 'type': 'array', 'uniqueItems': True}, 'format': {'type': 'string'}, 'items': {'$ref': '#/definitions/itemsObject'}, 'maximum': {'type': 'string'}, 'minimum': {'type': 'string'}, 'type': {'type': 'string'}, 'uniqueItems': {'type': 'boolean'}}, 'type': 'object'},
+    'schemas/v1.2/infoObject.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'additionalProperties': False, 'description': 'info object (section 5.1.3)', 'properties': {'contact': {'format': 'email', 'type': 'string'}, 'description': {'type': 'string'}, 'license': {'type': 'string'}, 'licenseUrl': {'format': 'uri', 'type': 'string'}, 'termsOfServiceUrl': {'format': 'uri', 'type': 'string'}, 'title': {'type': 'string'}}, 'required': ['title', 'description'], 'type': 'object'},
+    'schemas/v1.2/modelsObject.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'definitions': {'propertyObject': {'allOf': [{'not': {'$ref': '#'}}, {'$ref': 'dataTypeBase.json#'}]}}, 'dependencies': {'subTypes': ['discriminator']}, 'properties': {'description': {'type': 'string'}, 'discriminator': {'type': 'string'}, 'id': {'type': 'string'}, 'properties': {'additionalProperties': {'$ref': '#/definitions/propertyObject'}, 'type': 'object'}, 'subTypes': {'items': {'type': 'string'}, 'type': 'array', 'uniqueItems': True}}, 'required': ['id', 'properties'], 'type': 'object'},
+    'schemas/v1.2/oauth2GrantType.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'definitions': {'authorizationCode': {'additionalProperties': False, 'properties': {'tokenEndpoint': {'$ref': '#/definitions/tokenEndpoint'}, 'tokenRequestEndpoint': {'$ref': '#/definitions/tokenRequestEndpoint'}}, 'required': ['tokenEndpoint', 'tokenRequestEndpoint'], 'type': 'object'}, 'implicit': {'additionalProperties': False, 'properties': {'loginEndpoint': {'$ref': '#/definitions/loginEndpoint'}, 'tokenName': {'type': 'string'}}, 'required': ['loginEndpoint'], 'type': 'object'}, 'loginEndpoint': {'additionalProperties': False, 'properties': {'url': {'format': 'uri', 'type': 'string'}}, 'required': ['url'], 'type': 'object'}, 'tokenEndpoint': {'additionalProperties': False, 'properties': {'tokenName': {'type': 'string'}, 'url': {'format': 'uri', 'type': 'string'}}, 'required': ['url'], 'type': 'object'}, 'tokenRequestEndpoint': {'additionalProperties': False, 'properties': {'clientIdName': {'type': 'string'}, 'clientSecretName': {'type': 'string'}, 'url': {'format': 'uri', 'type': 'string'}}, 'required': ['url'], 'type': 'object'}}, 'minProperties': 1, 'properties': {'authorization_code': {'$ref': '#/definitions/authorizationCode'}, 'implicit': {'$ref': '#/definitions/implicit'}}, 'type': 'object'},
+    'schemas/v1.2/operationObject.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'allOf': [{'$ref': 'dataTypeBase.json#'}, {'properties': {'authorizations': {'additionalProperties': {'items': {'$ref': 'authorizationObject.json#/definitions/oauth2Scope'}, 'type': 'array'}, 'type': 'object'}, 'consumes': {'$ref': '#/definitions/mimeTypeArray'}, 'deprecated': {'enum': ['true', 'false']}, 'method': {'enum': ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'HEAD']}, 'nickname': {'pattern': '^[a-zA-Z0-9_]+$', 'type': 'string'}, 'notes': {'type': 'string'}, 'parameters': {'items': {'$ref': 'parameterObject.json#'}, 'type': 'array'}, 'produces': {'$ref': '#/definitions/mimeTypeArray'}, 'responseMessages': {'items': {'$ref': '#/definitions/responseMessageObject'}, 'type': 'array'}, 'summary': {'maxLength': 120, 'type': 'string'}}, 'required': ['method', 'nickname', 'parameters']}], 'definitions': {'mimeTypeArray': {'items': {'format': 'mime-type', 'type': 'string'}, 'type': 'array'}, 'responseMessageObject': {'properties': {'code': {'$ref': '#/definitions/rfc2616section10'}, 'message': {'type': 'string'}, 'responseModel': {'type': 'string'}}, 'required': ['code', 'message'], 'type': 'object'}, 'rfc2616section10': {'exclusiveMaximum': True, 'maximum': 600, 'minimum': 100, 'type': 'integer'}}, 'type': 'object'},
+    'schemas/v1.2/parameterObject.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'allOf': [{'$ref': 'dataTypeBase.json#'}, {'properties': {'allowMultiple': {'type': 'boolean'}, 'description': {'type': 'string'}, 'name': {'type': 'string'}, 'paramType': {'enum': ['path', 'query', 'body', 'header', 'form']}, 'required': {'type': 'boolean'}}, 'required': ['paramType', 'name']}, {'description': 'type File requires special paramType and consumes', 'oneOf': [{'properties': {'type': {'not': {'enum': ['File']}}}}, {'properties': {'consumes': {'enum': ['multipart/form-data']}, 'paramType': {'enum': ['form']}, 'type': {'enum': ['File']}}}]}], 'type': 'object'},
+    'schemas/v1.2/resourceListing.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'properties': {'apiVersion': {'type': 'string'}, 'apis': {'items': {'$ref': 'resourceObject.json#'}, 'type': 'array'}, 'authorizations': {'$ref': 'authorizationObject.json#'}, 'info': {'$ref': 'infoObject.json#'}, 'swaggerVersion': {'enum': ['1.2']}}, 'required': ['swaggerVersion', 'apis'], 'type': 'object'},
+    'schemas/v1.2/resourceObject.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'additionalProperties': False, 'properties': {'description': {'type': 'string'}, 'path': {'format': 'uri', 'type': 'string'}}, 'required': ['path'], 'type': 'object'},
+    'schemas/v2.0/schema.json': {'$schema': 'http://json-schema.org/draft-04/schema#', 'additionalProperties': False, 'definitions': {'apiKeySecurity': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'in': {'enum': ['header', 'query'], 'type': 'string'}, 'name': {'type': 'string'}, 'type': {'enum': ['apiKey'], 'type': 'string'}}, 'required': ['type', 'name', 'in'], 'type': 'object'}, 'basicAuthenticationSecurity': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'type': {'enum': ['basic'], 'type': 'string'}}, 'required': ['type'], 'type': 'object'}, 'bodyParameter': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'description': 'A brief description of the parameter. This could contain examples of use.  GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'in': {'description': 'Determines the location of the parameter.', 'enum': ['body'], 'type': 'string'}, 'name': {'description': 'The name of the parameter.', 'type': 'string'}, 'required': {'default': False, 'description': 'Determines whether or not this parameter is required or optional.', 'type': 'boolean'}, 'schema': {'$ref': '#/definitions/schema'}}, 'required': ['name', 'in', 'schema'], 'type': 'object'}, 'collectionFormat': {'default': 'csv', 'enum': ['csv', 'ssv', 'tsv', 'pipes'], 'type': 'string'}, 'collectionFormatWithMulti': {'default': 'csv', 'enum': ['csv', 'ssv', 'tsv', 'pipes', 'multi'], 'type': 'string'}, 'contact': {'additionalProperties': False, 'description': 'Contact information for the owners of the API.', 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'email': {'description': 'The email address of the contact person/organization.', 'format': 'email', 'type': 'string'}, 'name': {'description': 'The identifying name of the contact person/organization.', 'type': 'string'}, 'url': {'description': 'The URL pointing to the contact information.', 'format': 'uri', 'type': 'string'}}, 'type': 'object'}, 'default': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/default'}, 'definitions': {'additionalProperties': {'$ref': '#/definitions/schema'}, 'description': 'One or more JSON objects describing the schemas being consumed and produced by the API.', 'type': 'object'}, 'description': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/description'}, 'enum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/enum'}, 'examples': {'additionalProperties': True, 'type': 'object'}, 'exclusiveMaximum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/exclusiveMinimum'}, 'externalDocs': {'additionalProperties': False, 'description': 'information about external documentation', 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'url': {'format': 'uri', 'type': 'string'}}, 'required': ['url'], 'type': 'object'}, 'fileSchema': {'additionalProperties': False, 'description': 'A deterministic version of a JSON Schema object.', 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'default': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/default'}, 'description': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/description'}, 'example': {}, 'externalDocs': {'$ref': '#/definitions/externalDocs'}, 'format': {'type': 'string'}, 'readOnly': {'default': False, 'type': 'boolean'}, 'required': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/stringArray'}, 'title': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/title'}, 'type': {'enum': ['file'], 'type': 'string'}}, 'required': ['type'], 'type': 'object'}, 'formDataParameterSubSchema': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'allowEmptyValue': {'default': False, 'description': 'allows sending a parameter by name only or with an empty value.', 'type': 'boolean'}, 'collectionFormat': {'$ref': '#/definitions/collectionFormatWithMulti'}, 'default': {'$ref': '#/definitions/default'}, 'description': {'description': 'A brief description of the parameter. This could contain examples of use.  GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'enum': {'$ref': '#/definitions/enum'}, 'exclusiveMaximum': {'$ref': '#/definitions/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': '#/definitions/exclusiveMinimum'}, 'format': {'type': 'string'}, 'in': {'description': 'Determines the location of the parameter.', 'enum': ['formData'], 'type': 'string'}, 'items': {'$ref': '#/definitions/primitivesItems'}, 'maxItems': {'$ref': '#/definitions/maxItems'}, 'maxLength': {'$ref': '#/definitions/maxLength'}, 'maximum': {'$ref': '#/definitions/maximum'}, 'minItems': {'$ref': '#/definitions/minItems'}, 'minLength': {'$ref': '#/definitions/minLength'}, 'minimum': {'$ref': '#/definitions/minimum'}, 'multipleOf': {'$ref': '#/definitions/multipleOf'}, 'name': {'description': 'The name of the parameter.', 'type': 'string'}, 'pattern': {'$ref': '#/definitions/pattern'}, 'required': {'default': False, 'description': 'Determines whether or not this parameter is required or optional.', 'type': 'boolean'}, 'type': {'enum': ['string', 'number', 'boolean', 'integer', 'array', 'file'], 'type': 'string'}, 'uniqueItems': {'$ref': '#/definitions/uniqueItems'}}}, 'header': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'collectionFormat': {'$ref': '#/definitions/collectionFormat'}, 'default': {'$ref': '#/definitions/default'}, 'description': {'type': 'string'}, 'enum': {'$ref': '#/definitions/enum'}, 'exclusiveMaximum': {'$ref': '#/definitions/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': '#/definitions/exclusiveMinimum'}, 'format': {'type': 'string'}, 'items': {'$ref': '#/definitions/primitivesItems'}, 'maxItems': {'$ref': '#/definitions/maxItems'}, 'maxLength': {'$ref': '#/definitions/maxLength'}, 'maximum': {'$ref': '#/definitions/maximum'}, 'minItems': {'$ref': '#/definitions/minItems'}, 'minLength': {'$ref': '#/definitions/minLength'}, 'minimum': {'$ref': '#/definitions/minimum'}, 'multipleOf': {'$ref': '#/definitions/multipleOf'}, 'pattern': {'$ref': '#/definitions/pattern'}, 'type': {'enum': ['string', 'number', 'integer', 'boolean', 'array'], 'type': 'string'}, 'uniqueItems': {'$ref': '#/definitions/uniqueItems'}}, 'required': ['type'], 'type': 'object'}, 'headerParameterSubSchema': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'collectionFormat': {'$ref': '#/definitions/collectionFormat'}, 'default': {'$ref': '#/definitions/default'}, 'description': {'description': 'A brief description of the parameter. This could contain examples of use.  GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'enum': {'$ref': '#/definitions/enum'}, 'exclusiveMaximum': {'$ref': '#/definitions/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': '#/definitions/exclusiveMinimum'}, 'format': {'type': 'string'}, 'in': {'description': 'Determines the location of the parameter.', 'enum': ['header'], 'type': 'string'}, 'items': {'$ref': '#/definitions/primitivesItems'}, 'maxItems': {'$ref': '#/definitions/maxItems'}, 'maxLength': {'$ref': '#/definitions/maxLength'}, 'maximum': {'$ref': '#/definitions/maximum'}, 'minItems': {'$ref': '#/definitions/minItems'}, 'minLength': {'$ref': '#/definitions/minLength'}, 'minimum': {'$ref': '#/definitions/minimum'}, 'multipleOf': {'$ref': '#/definitions/multipleOf'}, 'name': {'description': 'The name of the parameter.', 'type': 'string'}, 'pattern': {'$ref': '#/definitions/pattern'}, 'required': {'default': False, 'description': 'Determines whether or not this parameter is required or optional.', 'type': 'boolean'}, 'type': {'enum': ['string', 'number', 'boolean', 'integer', 'array'], 'type': 'string'}, 'uniqueItems': {'$ref': '#/definitions/uniqueItems'}}}, 'headers': {'additionalProperties': {'$ref': '#/definitions/header'}, 'type': 'object'}, 'info': {'additionalProperties': False, 'description': 'General information about the API.', 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'contact': {'$ref': '#/definitions/contact'}, 'description': {'description': 'A longer description of the API. Should be different from the title.  GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'license': {'$ref': '#/definitions/license'}, 'termsOfService': {'description': 'The terms of service for the API.', 'type': 'string'}, 'title': {'description': 'A unique and precise title of the API.', 'type': 'string'}, 'version': {'description': 'A semantic version number of the API.', 'type': 'string'}}, 'required': ['version', 'title'], 'type': 'object'}, 'jsonReference': {'additionalProperties': False, 'properties': {'$ref': {'type': 'string'}}, 'required': ['$ref'], 'type': 'object'}, 'license': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'name': {'description': "The name of the license type. It's encouraged to use an OSI compatible license.", 'type': 'string'}, 'url': {'description': 'The URL pointing to the license.', 'format': 'uri', 'type': 'string'}}, 'required': ['name'], 'type': 'object'}, 'maxItems': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveInteger'}, 'maxLength': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveInteger'}, 'maximum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/maximum'}, 'mediaTypeList': {'items': {'$ref': '#/definitions/mimeType'}, 'type': 'array', 'uniqueItems': True}, 'mimeType': {'description': 'The MIME type of the HTTP message.', 'type': 'string'}, 'minItems': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveIntegerDefault0'}, 'minLength': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveIntegerDefault0'}, 'minimum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/minimum'}, 'multipleOf': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/multipleOf'}, 'nonBodyParameter': {'oneOf': [{'$ref': '#/definitions/headerParameterSubSchema'}, {'$ref': '#/definitions/formDataParameterSubSchema'}, {'$ref': '#/definitions/queryParameterSubSchema'}, {'$ref': '#/definitions/pathParameterSubSchema'}], 'required': ['name', 'in', 'type'], 'type': 'object'}, 'oauth2AccessCodeSecurity': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'authorizationUrl': {'format': 'uri', 'type': 'string'}, 'description': {'type': 'string'}, 'flow': {'enum': ['accessCode'], 'type': 'string'}, 'scopes': {'$ref': '#/definitions/oauth2Scopes'}, 'tokenUrl': {'format': 'uri', 'type': 'string'}, 'type': {'enum': ['oauth2'], 'type': 'string'}}, 'required': ['type', 'flow', 'authorizationUrl', 'tokenUrl'], 'type': 'object'}, 'oauth2ApplicationSecurity': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'flow': {'enum': ['application'], 'type': 'string'}, 'scopes': {'$ref': '#/definitions/oauth2Scopes'}, 'tokenUrl': {'format': 'uri', 'type': 'string'}, 'type': {'enum': ['oauth2'], 'type': 'string'}}, 'required': ['type', 'flow', 'tokenUrl'], 'type': 'object'}, 'oauth2ImplicitSecurity': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'authorizationUrl': {'format': 'uri', 'type': 'string'}, 'description': {'type': 'string'}, 'flow': {'enum': ['implicit'], 'type': 'string'}, 'scopes': {'$ref': '#/definitions/oauth2Scopes'}, 'type': {'enum': ['oauth2'], 'type': 'string'}}, 'required': ['type', 'flow', 'authorizationUrl'], 'type': 'object'}, 'oauth2PasswordSecurity': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'flow': {'enum': ['password'], 'type': 'string'}, 'scopes': {'$ref': '#/definitions/oauth2Scopes'}, 'tokenUrl': {'format': 'uri', 'type': 'string'}, 'type': {'enum': ['oauth2'], 'type': 'string'}}, 'required': ['type', 'flow', 'tokenUrl'], 'type': 'object'}, 'oauth2Scopes': {'additionalProperties': {'type': 'string'}, 'type': 'object'}, 'operation': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'consumes': {'$ref': '#/definitions/mediaTypeList', 'description': 'A list of MIME types the API can consume.'}, 'deprecated': {'default': False, 'type': 'boolean'}, 'description': {'description': 'A longer description of the operation, GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'externalDocs': {'$ref': '#/definitions/externalDocs'}, 'operationId': {'description': 'A unique identifier of the operation.', 'type': 'string'}, 'parameters': {'$ref': '#/definitions/parametersList'}, 'produces': {'$ref': '#/definitions/mediaTypeList', 'description': 'A list of MIME types the API can produce.'}, 'responses': {'$ref': '#/definitions/responses'}, 'schemes': {'$ref': '#/definitions/schemesList'}, 'security': {'$ref': '#/definitions/security'}, 'summary': {'description': 'A brief summary of the operation.', 'type': 'string'}, 'tags': {'items': {'type': 'string'}, 'type': 'array', 'uniqueItems': True}}, 'required': ['responses'], 'type': 'object'}, 'parameter': {'oneOf': [{'$ref': '#/definitions/bodyParameter'}, {'$ref': '#/definitions/nonBodyParameter'}]}, 'parameterDefinitions': {'additionalProperties': {'$ref': '#/definitions/parameter'}, 'description': 'One or more JSON representations for parameters', 'type': 'object'}, 'parametersList': {'additionalItems': False, 'description': 'The parameters needed to send a valid API call.', 'items': {'oneOf': [{'$ref': '#/definitions/parameter'}, {'$ref': '#/definitions/jsonReference'}]}, 'type': 'array', 'uniqueItems': True}, 'pathItem': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'$ref': {'type': 'string'}, 'delete': {'$ref': '#/definitions/operation'}, 'get': {'$ref': '#/definitions/operation'}, 'head': {'$ref': '#/definitions/operation'}, 'options': {'$ref': '#/definitions/operation'}, 'parameters': {'$ref': '#/definitions/parametersList'}, 'patch': {'$ref': '#/definitions/operation'}, 'post': {'$ref': '#/definitions/operation'}, 'put': {'$ref': '#/definitions/operation'}}, 'type': 'object'}, 'pathParameterSubSchema': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'collectionFormat': {'$ref': '#/definitions/collectionFormat'}, 'default': {'$ref': '#/definitions/default'}, 'description': {'description': 'A brief description of the parameter. This could contain examples of use.  GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'enum': {'$ref': '#/definitions/enum'}, 'exclusiveMaximum': {'$ref': '#/definitions/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': '#/definitions/exclusiveMinimum'}, 'format': {'type': 'string'}, 'in': {'description': 'Determines the location of the parameter.', 'enum': ['path'], 'type': 'string'}, 'items': {'$ref': '#/definitions/primitivesItems'}, 'maxItems': {'$ref': '#/definitions/maxItems'}, 'maxLength': {'$ref': '#/definitions/maxLength'}, 'maximum': {'$ref': '#/definitions/maximum'}, 'minItems': {'$ref': '#/definitions/minItems'}, 'minLength': {'$ref': '#/definitions/minLength'}, 'minimum': {'$ref': '#/definitions/minimum'}, 'multipleOf': {'$ref': '#/definitions/multipleOf'}, 'name': {'description': 'The name of the parameter.', 'type': 'string'}, 'pattern': {'$ref': '#/definitions/pattern'}, 'required': {'description': 'Determines whether or not this parameter is required or optional.', 'enum': [True], 'type': 'boolean'}, 'type': {'enum': ['string', 'number', 'boolean', 'integer', 'array'], 'type': 'string'}, 'uniqueItems': {'$ref': '#/definitions/uniqueItems'}}, 'required': ['required']}, 'paths': {'additionalProperties': False, 'description': "Relative paths to the individual endpoints. They must be relative to the 'basePath'.", 'patternProperties': {'^/': {'$ref': '#/definitions/pathItem'}, '^x-': {'$ref': '#/definitions/vendorExtension'}}, 'type': 'object'}, 'pattern': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/pattern'}, 'primitivesItems': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'collectionFormat': {'$ref': '#/definitions/collectionFormat'}, 'default': {'$ref': '#/definitions/default'}, 'enum': {'$ref': '#/definitions/enum'}, 'exclusiveMaximum': {'$ref': '#/definitions/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': '#/definitions/exclusiveMinimum'}, 'format': {'type': 'string'}, 'items': {'$ref': '#/definitions/primitivesItems'}, 'maxItems': {'$ref': '#/definitions/maxItems'}, 'maxLength': {'$ref': '#/definitions/maxLength'}, 'maximum': {'$ref': '#/definitions/maximum'}, 'minItems': {'$ref': '#/definitions/minItems'}, 'minLength': {'$ref': '#/definitions/minLength'}, 'minimum': {'$ref': '#/definitions/minimum'}, 'multipleOf': {'$ref': '#/definitions/multipleOf'}, 'pattern': {'$ref': '#/definitions/pattern'}, 'type': {'enum': ['string', 'number', 'integer', 'boolean', 'array'], 'type': 'string'}, 'uniqueItems': {'$ref': '#/definitions/uniqueItems'}}, 'type': 'object'}, 'queryParameterSubSchema': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'allowEmptyValue': {'default': False, 'description': 'allows sending a parameter by name only or with an empty value.', 'type': 'boolean'}, 'collectionFormat': {'$ref': '#/definitions/collectionFormatWithMulti'}, 'default': {'$ref': '#/definitions/default'}, 'description': {'description': 'A brief description of the parameter. This could contain examples of use.  GitHub Flavored Markdown is allowed.', 'type': 'string'}, 'enum': {'$ref': '#/definitions/enum'}, 'exclusiveMaximum': {'$ref': '#/definitions/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': '#/definitions/exclusiveMinimum'}, 'format': {'type': 'string'}, 'in': {'description': 'Determines the location of the parameter.', 'enum': ['query'], 'type': 'string'}, 'items': {'$ref': '#/definitions/primitivesItems'}, 'maxItems': {'$ref': '#/definitions/maxItems'}, 'maxLength': {'$ref': '#/definitions/maxLength'}, 'maximum': {'$ref': '#/definitions/maximum'}, 'minItems': {'$ref': '#/definitions/minItems'}, 'minLength': {'$ref': '#/definitions/minLength'}, 'minimum': {'$ref': '#/definitions/minimum'}, 'multipleOf': {'$ref': '#/definitions/multipleOf'}, 'name': {'description': 'The name of the parameter.', 'type': 'string'}, 'pattern': {'$ref': '#/definitions/pattern'}, 'required': {'default': False, 'description': 'Determines whether or not this parameter is required or optional.', 'type': 'boolean'}, 'type': {'enum': ['string', 'number', 'boolean', 'integer', 'array'], 'type': 'string'}, 'uniqueItems': {'$ref': '#/definitions/uniqueItems'}}}, 'response': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'examples': {'$ref': '#/definitions/examples'}, 'headers': {'$ref': '#/definitions/headers'}, 'schema': {'oneOf': [{'$ref': '#/definitions/schema'}, {'$ref': '#/definitions/fileSchema'}]}}, 'required': ['description'], 'type': 'object'}, 'responseDefinitions': {'additionalProperties': {'$ref': '#/definitions/response'}, 'description': 'One or more JSON representations for parameters', 'type': 'object'}, 'responseValue': {'oneOf': [{'$ref': '#/definitions/response'}, {'$ref': '#/definitions/jsonReference'}]}, 'responses': {'additionalProperties': False, 'description': "Response objects names can either be any valid HTTP status code or 'default'.", 'minProperties': 1, 'not': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'type': 'object'}, 'patternProperties': {'^([0-9]{3})$|^(default)$': {'$ref': '#/definitions/responseValue'}, '^x-': {'$ref': '#/definitions/vendorExtension'}}, 'type': 'object'}, 'schema': {'additionalProperties': False, 'description': 'A deterministic version of a JSON Schema object.', 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'$ref': {'type': 'string'}, 'additionalProperties': {'anyOf': [{'$ref': '#/definitions/schema'}, {'type': 'boolean'}], 'default': {}}, 'allOf': {'items': {'$ref': '#/definitions/schema'}, 'minItems': 1, 'type': 'array'}, 'default': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/default'}, 'description': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/description'}, 'discriminator': {'type': 'string'}, 'enum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/enum'}, 'example': {}, 'exclusiveMaximum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/exclusiveMaximum'}, 'exclusiveMinimum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/exclusiveMinimum'}, 'externalDocs': {'$ref': '#/definitions/externalDocs'}, 'format': {'type': 'string'}, 'items': {'anyOf': [{'$ref': '#/definitions/schema'}, {'items': {'$ref': '#/definitions/schema'}, 'minItems': 1, 'type': 'array'}], 'default': {}}, 'maxItems': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveInteger'}, 'maxLength': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveInteger'}, 'maxProperties': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveInteger'}, 'maximum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/maximum'}, 'minItems': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveIntegerDefault0'}, 'minLength': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveIntegerDefault0'}, 'minProperties': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/positiveIntegerDefault0'}, 'minimum': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/minimum'}, 'multipleOf': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/multipleOf'}, 'pattern': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/pattern'}, 'properties': {'additionalProperties': {'$ref': '#/definitions/schema'}, 'default': {}, 'type': 'object'}, 'readOnly': {'default': False, 'type': 'boolean'}, 'required': {'$ref': 'http://json-schema.org/draft-04/schema#/definitions/stringArray'}, 'title': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/title'}, 'type': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/type'}, 'uniqueItems': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/uniqueItems'}, 'xml': {'$ref': '#/definitions/xml'}}, 'type': 'object'}, 'schemesList': {'description': 'The transfer protocol of the API.', 'items': {'enum': ['http', 'https', 'ws', 'wss'], 'type': 'string'}, 'type': 'array', 'uniqueItems': True}, 'security': {'items': {'$ref': '#/definitions/securityRequirement'}, 'type': 'array', 'uniqueItems': True}, 'securityDefinitions': {'additionalProperties': {'oneOf': [{'$ref': '#/definitions/basicAuthenticationSecurity'}, {'$ref': '#/definitions/apiKeySecurity'}, {'$ref': '#/definitions/oauth2ImplicitSecurity'}, {'$ref': '#/definitions/oauth2PasswordSecurity'}, {'$ref': '#/definitions/oauth2ApplicationSecurity'}, {'$ref': '#/definitions/oauth2AccessCodeSecurity'}]}, 'type': 'object'}, 'securityRequirement': {'additionalProperties': {'items': {'type': 'string'}, 'type': 'array', 'uniqueItems': True}, 'type': 'object'}, 'tag': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'description': {'type': 'string'}, 'externalDocs': {'$ref': '#/definitions/externalDocs'}, 'name': {'type': 'string'}}, 'required': ['name'], 'type': 'object'}, 'title': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/title'}, 'uniqueItems': {'$ref': 'http://json-schema.org/draft-04/schema#/properties/uniqueItems'}, 'vendorExtension': {'additionalItems': True, 'additionalProperties': True, 'description': 'Any property starting with x- is valid.'}, 'xml': {'additionalProperties': False, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'attribute': {'default': False, 'type': 'boolean'}, 'name': {'type': 'string'}, 'namespace': {'type': 'string'}, 'prefix': {'type': 'string'}, 'wrapped': {'default': False, 'type': 'boolean'}}, 'type': 'object'}}, 'patternProperties': {'^x-': {'$ref': '#/definitions/vendorExtension'}}, 'properties': {'basePath': {'description': "The base path to the API. Example: '/api'.", 'pattern': '^/', 'type': 'string'}, 'consumes': {'$ref': '#/definitions/mediaTypeList', 'description': 'A list of MIME types accepted by the API.'}, 'definitions': {'$ref': '#/definitions/definitions'}, 'externalDocs': {'$ref': '#/definitions/externalDocs'}, 'host': {'description': "The host (name or ip) of the API. Example: 'swagger.io'", 'pattern': '^[^{}/ :\\\\]+(?::\\d+)?$', 'type': 'string'}, 'info': {'$ref': '#/definitions/info'}, 'parameters': {'$ref': '#/definitions/parameterDefinitions'}, 'paths': {'$ref': '#/definitions/paths'}, 'produces': {'$ref': '#/definitions/mediaTypeList', 'description': 'A list of MIME types the API can produce.'}, 'responses': {'$ref': '#/definitions/responseDefinitions'}, 'schemes': {'$ref': '#/definitions/schemesList'}, 'security': {'$ref': '#/definitions/security'}, 'securityDefinitions': {'$ref': '#/definitions/securityDefinitions'}, 'swagger': {'description': 'The Swagger version of this document.', 'enum': ['2.0'], 'type': 'string'}, 'tags': {'items': {'$ref': '#/definitions/tag'}, 'type': 'array', 'uniqueItems': True}}, 'required': ['swagger', 'info', 'paths'], 'title': 'A JSON Schema for Swagger 2.0 API.', 'type': 'object'},
+}
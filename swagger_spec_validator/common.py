@@ -2,27 +2,44 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import mmap
 import os
+import pickle
+import re
 import sys
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Any
 from typing import Callable
+from typing import TYPE_CHECKING
 from typing import TypeVar
+from typing import Union
 from urllib.parse import urljoin
-from urllib.request import pathname2url
-from urllib.request import urlopen
+from urllib.parse import urlsplit
 
-import importlib_resources
-import yaml
-from typing_extensions import ParamSpec
+if sys.version_info >= (3, 10):  # pragma: no cover
+    from typing import ParamSpec
+else:  # pragma: no cover
+    from typing_extensions import ParamSpec
 
-try:
-    from yaml import CSafeLoader as SafeLoader
-except ImportError:  # pragma: no cover
-    from yaml import SafeLoader  # type: ignore
+if TYPE_CHECKING:
+    from jsonschema.validators import RefResolver
+
+# NOTE: yaml, importlib_resources, orjson and urllib.request are imported on
+# first use, so that importing the package stays cheap
 
 
 TIMEOUT_SEC = 1.0
+# Maximum total size in bytes of the local documents kept by document_cache
+DOCUMENT_CACHE_MAX_SIZE = 32 * 1024 * 1024
+# Callable used to parse documents that look like JSON, see set_json_loads.
+# None stands for the default, see get_json_loads
+json_loads: Callable[[Any], Any] | None = None
+
+_JSON_START_RE = re.compile(rb"\s*[{\[]")
+# Raw documents: bytes or any object exposing a buffer, eg. a memory-mapped file
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -39,6 +56,8 @@ def wrap_exception(method: Callable[P, T]) -> Callable[P, T]:
 
 
 def get_uri_from_file_path(file_path: str) -> str:
+    from urllib.request import pathname2url
+
     return urljoin("file://", pathname2url(os.path.abspath(file_path)))
 
 
@@ -55,24 +74,289 @@ def read_file(file_path: str) -> dict[str, Any]:
 
 @lru_cache
 def read_resource_file(resource_path: str) -> tuple[dict[str, Any], str]:
+    # The bundled schemas are shipped pre-parsed, see _bundled_schemas
+    from swagger_spec_validator._bundled_schemas import SCHEMAS
+
+    if resource_path in SCHEMAS:
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(package_dir, *resource_path.split("/"))
+        return SCHEMAS[resource_path], path
+
+    import importlib_resources
+
     ref = importlib_resources.files("swagger_spec_validator") / resource_path
     with importlib_resources.as_file(ref) as path:
         return read_file(path), path
 
 
 def read_url(url: str, timeout: float = TIMEOUT_SEC) -> dict[str, Any]:
+    parsed_url = urlsplit(url)
+    if parsed_url.scheme == "file" and parsed_url.netloc in ("", "localhost"):
+        from urllib.request import url2pathname
+
+        return document_cache.load(url2pathname(parsed_url.path))
+
+    if parsed_url.scheme in ("http", "https"):
+        from swagger_spec_validator import http_pool
+
+        return http_pool.read_url(url, timeout=timeout)
+
+    from urllib.request import urlopen
+
     with contextlib.closing(urlopen(url, timeout=timeout)) as fh:
-        # NOTE: JSON is a subset of YAML so it is safe to read JSON as it is YAML
-        return yaml.load(fh.read().decode("utf-8"), Loader=SafeLoader)
+        return load_document(
+            fh.read(), url=url, content_type=fh.headers.get_content_type()
+        )
+
+
+@lru_cache
+def get_default_json_loads() -> Callable[[Any], Any]:
+    """Return ``orjson.loads`` if orjson is installed, ``json.loads``
+    otherwise.
+    """
+    try:
+        from orjson import loads
+    except ImportError:  # pragma: no cover
+        from json import loads  # type: ignore
+    return loads
+
+
+def get_json_loads() -> Callable[[Any], Any]:
+    """Return the callable used to parse JSON documents, see
+    :func:`set_json_loads`.
+    """
+    return get_default_json_loads() if json_loads is None else json_loads
+
+
+def set_json_loads(loads: Callable[[Any], Any] | None) -> None:
+    """Set the callable used to parse JSON documents.
+
+    :param loads: callable taking the raw bytes of a document, eg.
+        ``json.loads``. None restores the default: ``orjson.loads`` if orjson
+        is installed, ``json.loads`` otherwise.
+    """
+    global json_loads
+    json_loads = loads
+
+
+@lru_cache
+def _get_yaml_loader() -> Any:
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader  # type: ignore
+    return SafeLoader
+
+
+def is_json_document(
+    content: Buffer, url: str = "", content_type: str | None = None
+) -> bool:
+    """Guess whether a document is JSON from its url extension, its content
+    type or its first non whitespace character.
+    """
+    if urlsplit(url).path.endswith(".json"):
+        return True
+    if content_type is not None and (
+        content_type == "application/json" or content_type.endswith("+json")
+    ):
+        return True
+    return _JSON_START_RE.match(content) is not None
+
+
+class _BufferReader:
+    """Minimal read-only file object over a buffer. The YAML loaders read it
+    in small chunks instead of needing a full copy of the document.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        self._buffer = buffer
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._position
+        end = len(self._buffer) if size < 0 else min(start + size, len(self._buffer))
+        self._position = end
+        return self._buffer[start:end].tobytes()
+
+
+def _json_loads_buffer(content: bytes | memoryview) -> Any:
+    loads = get_json_loads()
+    try:
+        return loads(content)
+    except TypeError:
+        # json.loads only accepts str, bytes and bytearray
+        return loads(bytes(content))
+
+
+def _load_document(
+    content: bytes | memoryview, url: str, content_type: str | None
+) -> Any:
+    if is_json_document(content, url, content_type):
+        try:
+            return _json_loads_buffer(content)
+        except ValueError:
+            pass
+    # NOTE: JSON is a subset of YAML so it is safe to read JSON as it is YAML
+    stream = content if isinstance(content, bytes) else _BufferReader(content)
+    import yaml
+
+    return yaml.load(stream, Loader=_get_yaml_loader())
+
+
+def load_document(
+    content: Buffer, url: str = "", content_type: str | None = None
+) -> Any:
+    """Parse the raw content of a JSON/YAML document.
+
+    Documents that look like JSON are parsed with :func:`get_json_loads`, which is
+    much faster than the YAML loader, and fall back to YAML if that fails.
+    The content is never decoded to a string first, so parsing a buffer such
+    as a memory-mapped file does not need a copy of the whole document.
+
+    :param content: utf-8 encoded document
+    :param url: url of the document, used to detect JSON documents
+    :param content_type: content type of the document, if known
+    :return: Python representation of the document
+    """
+    if isinstance(content, bytes):
+        return _load_document(content, url, content_type)
+    # Parse errors keep the views alive in their traceback, they are released
+    # explicitly so that the buffer (eg. a memory-mapped file) can be closed
+    # and the parse error is not hidden by a BufferError
+    with memoryview(content) as view, view.cast("B") as byte_view:
+        return _load_document(byte_view, url, content_type)
+
+
+def load_file(path: str) -> Any:
+    """Parse a local JSON/YAML document. The file is memory-mapped rather than
+    read, see :func:`load_document`.
+
+    :param path: path of the file to read
+    :return: Python representation of the document
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return load_document(b"", url=path)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return load_document(mapped, url=path)
+
+
+def _is_json_file(path: str) -> bool:
+    with open(path, "rb") as f:
+        return is_json_document(f.read(64), url=path)
+
+
+class DocumentCache:
+    """Bounded in-process cache of parsed local YAML documents.
+
+    Entries are keyed by absolute path and invalidated when the file's
+    modification time or size changes, so long lived processes only parse
+    again the files that were edited.
+
+    Documents are kept pickled and every load returns a new copy, as callers
+    (and validation itself, see
+    :func:`swagger_spec_validator.ref_validators.attach_scope`) mutate them.
+    JSON documents are not cached: parsing them is about as fast as
+    unpickling them.
+
+    :param max_size: maximum total size in bytes of the pickled documents,
+        least recently used documents are dropped first.
+    """
+
+    def __init__(self, max_size: int = DOCUMENT_CACHE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[tuple[int, int], bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> Any:
+        path = os.path.abspath(path)
+        if _is_json_file(path):
+            return load_file(path)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return pickle.loads(entry[1])
+            self.misses += 1
+
+        document = load_file(path)
+        pickled_document = pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(pickled_document) > self.max_size:
+            return document
+
+        with self._lock:
+            previous_entry = self._entries.pop(path, None)
+            if previous_entry is not None:
+                self._size -= len(previous_entry[1])
+            self._entries[path] = (version, pickled_document)
+            self._size += len(pickled_document)
+            while self._size > self.max_size:
+                _, (_, evicted_document) = self._entries.popitem(last=False)
+                self._size -= len(evicted_document)
+        return document
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+
+document_cache = DocumentCache()
 
 
 class SwaggerValidationError(Exception):
     """Exception raised in case of a validation error."""
 
-    pass
+    # Resolver holding the documents read until the error, set by
+    # validator20.validate_spec
+    resolver: RefResolver | None = None
 
 
 class SwaggerValidationWarning(UserWarning):
     """Warning raised during validation."""
 
     pass
+
+
+class ErrorPath:
+    """Location of a node in a spec, eg. ``#/paths//pets/get``, used in the
+    messages of errors and warnings.
+
+    Each location only holds its last key and a link to the location of its
+    parent, so walking a spec builds one small object per node instead of a
+    string. The location is rendered by ``str`` when a message is formatted.
+
+    :param key: last key of the location. The key of the root location may
+        be an already rendered location, eg. ``#/definitions/Pet``.
+    :param parent: location of the parent, or its rendered string.
+    """
+
+    __slots__ = ("key", "parent")
+
+    def __init__(self, key: str, parent: ErrorPath | str | None = None) -> None:
+        self.key = key
+        self.parent = ErrorPath(parent) if isinstance(parent, str) else parent
+
+    def parts(self) -> tuple[str, ...]:
+        parts = []
+        path: ErrorPath | None = self
+        while path is not None:
+            parts.append(path.key)
+            path = path.parent
+        return tuple(reversed(parts))
+
+    def __str__(self) -> str:
+        return "/".join(self.parts())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
@@ -0,0 +1,316 @@
+"""
+Pool of persistent HTTP connections used to download remote $ref documents.
+
+:func:`urllib.request.urlopen` opens a new connection for every document, so
+specs split over many files on the same host pay for the TCP and TLS setup of
+every single one of them. The pool keeps idle connections per host and reuses
+them for the next requests to that host.
+
+Requests going through a proxy configured in the environment are delegated to
+:func:`urllib.request.urlopen`.
+"""
+from __future__ import annotations
+
+import contextlib
+import gzip
+import http.client
+import logging
+import os
+import threading
+import zlib
+from collections import defaultdict
+from collections import deque
+from email.message import Message
+from typing import Any
+from typing import NamedTuple
+from typing import Tuple
+from urllib.error import HTTPError
+from urllib.error import URLError
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+from urllib.request import proxy_bypass
+from urllib.request import Request
+from urllib.request import urlopen
+
+from swagger_spec_validator import common
+
+
+log = logging.getLogger(__name__)
+
+# Maximum number of idle connections kept per host
+DEFAULT_POOL_SIZE = 4
+# Maximum number of requests in flight to the same host
+DEFAULT_MAX_PER_HOST = 8
+MAX_REDIRECTS = 10
+
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+# Errors raised when the server closed an idle connection
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+_HostKey = Tuple[str, str, int]
+
+
+class Response(NamedTuple):
+    url: str
+    status: int
+    headers: Message
+    body: bytes
+
+
+def decode_body(body: bytes, content_encoding: str | None) -> bytes:
+    """Decode a response body sent with a gzip or deflate Content-Encoding."""
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    if encoding == "identity":
+        return body
+    raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    return scheme in getproxies() and not proxy_bypass(host)
+
+
+class HTTPConnectionPool:
+    """Thread-safe pool of keep-alive HTTP and HTTPS connections.
+
+    :param pool_size: maximum number of idle connections kept per host.
+    :param max_per_host: maximum number of concurrent requests to a host.
+        Other requests wait for a connection to be released.
+    :param timeout: default timeout in seconds of the requests.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        timeout: float = common.TIMEOUT_SEC,
+    ) -> None:
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle: defaultdict[
+            _HostKey, deque[http.client.HTTPConnection]
+        ] = defaultdict(deque)
+        self._host_limits: dict[_HostKey, threading.BoundedSemaphore] = {}
+
+    def _get_host_limit(self, key: _HostKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            limit = self._host_limits.get(key)
+            if limit is None:
+                limit = self._host_limits[key] = threading.BoundedSemaphore(
+                    self.max_per_host
+                )
+            return limit
+
+    def _get_connection(
+        self, key: _HostKey, timeout: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Return an idle connection to the host, or a new one. The boolean is
+        True for reused connections.
+        """
+        with self._lock:
+            idle = self._idle[key]
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+
+        scheme, host, port = key
+        connection_cls = (
+            http.client.HTTPSConnection
+            if scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return connection_cls(host, port, timeout=timeout), False
+
+    def _release(self, key: _HostKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self.pool_size:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _send(
+        self,
+        key: _HostKey,
+        target: str,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str, Message, bytes]:
+        while True:
+            connection, reused = self._get_connection(key, timeout)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except _STALE_CONNECTION_ERRORS as e:
+                connection.close()
+                if not reused:
+                    raise URLError(e) from e
+                # The server closed the idle connection, retry on a new one
+                log.debug("Discarding stale connection to %s", key[1])
+                continue
+            except OSError as e:
+                connection.close()
+                # Same error as urlopen for unreachable hosts
+                raise URLError(e) from e
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            return response.status, response.reason, response.headers, body
+
+    def _urlopen(
+        self, url: str, headers: dict[str, str], timeout: float
+    ) -> tuple[int, str, Message, bytes]:
+        try:
+            with contextlib.closing(
+                urlopen(Request(url, headers=headers), timeout=timeout)
+            ) as fh:
+                return fh.status, fh.reason, fh.headers, fh.read()
+        except HTTPError as e:
+            # Redirects were already followed, only 304 is not an error here
+            if e.code != 304:
+                raise
+            with contextlib.closing(e):
+                return e.code, e.reason, e.headers, b""
+
+    def request(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Response:
+        """Send a GET request, following redirects.
+
+        :param url: http or https url.
+        :param headers: additional request headers.
+        :param timeout: timeout in seconds, defaults to the pool timeout.
+
+        :returns: the response, with a decoded body. Status is 304 for
+            conditional requests of unmodified documents.
+        :raises: :class:`urllib.error.HTTPError` for error statuses.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        request_headers = {"Accept-Encoding": "gzip, deflate"}
+        request_headers.update(headers or {})
+
+        for _ in range(MAX_REDIRECTS + 1):
+            parsed_url = urlsplit(url)
+            if parsed_url.scheme not in ("http", "https"):
+                raise ValueError(f"Unsupported url scheme: {url}")
+            if _uses_proxy(parsed_url.scheme, parsed_url.hostname or ""):
+                status, reason, response_headers, body = self._urlopen(
+                    url, request_headers, timeout
+                )
+            else:
+                port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
+                key = (parsed_url.scheme, parsed_url.hostname or "", port)
+                target = parsed_url.path or "/"
+                if parsed_url.query:
+                    target += "?" + parsed_url.query
+                with self._get_host_limit(key):
+                    status, reason, response_headers, body = self._send(
+                        key, target, request_headers, timeout
+                    )
+
+            if status in _REDIRECT_CODES and "Location" in response_headers:
+                url = urljoin(url, response_headers["Location"])
+                continue
+            if status >= 400:
+                raise HTTPError(url, status, reason, response_headers, None)
+            return Response(
+                url,
+                status,
+                response_headers,
+                decode_body(body, response_headers.get("Content-Encoding"))
+                if body
+                else body,
+            )
+
+        raise HTTPError(url, status, "Too many redirects", response_headers, None)
+
+    def read_url(self, url: str, timeout: float | None = None) -> Any:
+        """Drop-in replacement for :func:`swagger_spec_validator.common.read_url`
+        for http and https urls.
+        """
+        response = self.request(url, timeout=timeout)
+        return common.load_document(
+            response.body, url, response.headers.get_content_type()
+        )
+
+    def close(self) -> None:
+        """Close all the idle connections."""
+        with self._lock:
+            idle_connections = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for connection in idle_connections:
+            connection.close()
+
+
+_default_pool = HTTPConnectionPool()
+
+
+def configure(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    max_per_host: int = DEFAULT_MAX_PER_HOST,
+    timeout: float = common.TIMEOUT_SEC,
+) -> HTTPConnectionPool:
+    """Replace the pool used by :func:`read_url`, and therefore by the default
+    http and https $ref handlers.
+
+    :param pool_size: see :class:`HTTPConnectionPool`.
+    :param max_per_host: see :class:`HTTPConnectionPool`.
+    :param timeout: see :class:`HTTPConnectionPool`.
+
+    :returns: the new pool
+    """
+    global _default_pool
+    previous_pool = _default_pool
+    _default_pool = HTTPConnectionPool(pool_size, max_per_host, timeout)
+    previous_pool.close()
+    return _default_pool
+
+
+def get_default_pool() -> HTTPConnectionPool:
+    return _default_pool
+
+
+def _reset_after_fork() -> None:
+    # The idle connections of a forked process are shared with its parent,
+    # responses would get mixed up if both of them used the same connection.
+    # They are dropped without being closed, as the parent still uses them.
+    global _default_pool
+    _default_pool = HTTPConnectionPool(
+        _default_pool.pool_size, _default_pool.max_per_host, _default_pool.timeout
+    )
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def read_url(url: str, timeout: float = common.TIMEOUT_SEC) -> Any:
+    """Read a remote document through the default connection pool."""
+    return _default_pool.read_url(url, timeout=timeout)
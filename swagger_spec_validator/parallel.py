@@ -0,0 +1,85 @@
+"""
+Validate collections of Swagger specs on a pool of worker processes.
+
+Validation is pure Python and CPU bound, so validating many specs in a single
+process only ever uses one core.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+from typing import NamedTuple
+
+from swagger_spec_validator.common import get_uri_from_file_path
+from swagger_spec_validator.common import read_resource_file
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.ref_validators import get_compiled_schema
+from swagger_spec_validator.util import validate_spec_url
+
+
+log = logging.getLogger(__name__)
+
+# Schemas loaded in every worker before it starts validating
+WARM_SCHEMA_PATHS = (
+    "schemas/v1.2/apiDeclaration.json",
+    "schemas/v1.2/resourceListing.json",
+    "schemas/v2.0/schema.json",
+)
+
+
+class ParallelValidationResult(NamedTuple):
+    """Outcome of validating a single spec with :func:`validate_spec_urls`."""
+
+    spec_url: str
+    error: SwaggerValidationError | None
+    wall_time: float
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
+def _init_worker() -> None:
+    for schema_path in WARM_SCHEMA_PATHS:
+        read_resource_file(schema_path)
+        get_compiled_schema(schema_path)
+
+
+def _validate_spec(spec: str) -> ParallelValidationResult:
+    spec_url = spec if "://" in spec else get_uri_from_file_path(spec)
+    start = time.perf_counter()
+    try:
+        validate_spec_url(spec_url)
+        error = None
+    except Exception as e:
+        log.debug("Validation of %s failed", spec_url, exc_info=True)
+        # Only the message is sent back, the original exception and its
+        # traceback may not be picklable
+        error = SwaggerValidationError(str(e))
+    return ParallelValidationResult(spec_url, error, time.perf_counter() - start)
+
+
+def validate_spec_urls(
+    specs: Iterable[str],
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> list[ParallelValidationResult]:
+    """Validates Swagger specs in parallel on a pool of worker processes.
+
+    :param specs: URLs of the specs to validate. Values without a scheme are
+        treated as local file paths.
+    :param max_workers: number of worker processes. Defaults to the number
+        of processors on the machine.
+    :param chunksize: number of specs sent to a worker at a time. Larger
+        values reduce the inter-process overhead for long lists of small specs.
+
+    :returns: one result per spec, in input order. Validation errors are
+        reported in the results instead of being raised.
+    :rtype: list of :class:`ParallelValidationResult`
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        return list(executor.map(_validate_spec, specs, chunksize=chunksize))
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import functools
 import logging
+import threading
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import Generator
+from typing import Iterator
+from typing import Sequence
 from typing import TYPE_CHECKING
+from urllib.parse import urldefrag
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
 
 from jsonschema import validators
 from jsonschema.validators import Draft4Validator
@@ -18,17 +28,23 @@ if TYPE_CHECKING:
     from jsonschema.validators import _Validator
 
 from swagger_spec_validator import common
+from swagger_spec_validator._bundled_schemas import SCHEMAS
+from swagger_spec_validator import remote_cache
 
 
 log = logging.getLogger(__name__)
 
 
 default_handlers = {
-    "http": common.read_url,
-    "https": common.read_url,
+    "http": remote_cache.read_url,
+    "https": remote_cache.read_url,
     "file": common.read_url,
 }
 
+# Maximum number of remote documents downloaded at the same time by
+# prefetch_remote_refs
+PREFETCH_WORKERS = 8
+
 
 def validate(
     instance: object,
@@ -61,6 +77,243 @@ def validate(
     instance_cls(schema, *args, **kwargs).validate(instance)
 
 
+class CompiledSchema:
+    """A bundled json schema that has already been checked against its
+    meta-schema, together with the validator class and resolver needed to
+    validate documents against it.
+
+    Instances are shared process-wide through :func:`get_compiled_schema`.
+    RefResolver keeps a mutable scope stack while resolving, so each thread
+    gets its own resolver for the schema.
+    """
+
+    def __init__(self, schema: dict[str, Any], schema_path: str) -> None:
+        self.schema = schema
+        self.base_uri = common.get_uri_from_file_path(schema_path)
+        self.validator_cls = validators.validator_for(schema, default=Draft4Validator)
+        self.validator_cls.check_schema(schema)
+        self._local = threading.local()
+
+    @property
+    def resolver(self) -> RefResolver:
+        resolver = getattr(self._local, "resolver", None)
+        if resolver is None:
+            resolver = RefResolver(
+                base_uri=self.base_uri,
+                referrer=self.schema,
+                store=get_bundled_schemas_store(),
+                handlers=default_handlers,
+            )
+            self._local.resolver = resolver
+        return resolver
+
+
+@lru_cache
+def get_bundled_schemas_store() -> dict[str, Any]:
+    """Return all the bundled json schemas keyed by uri, so that refs between
+    them are resolved without reading the schema files.
+    """
+    store = {}
+    for resource_path in SCHEMAS:
+        schema, path = common.read_resource_file(resource_path)
+        store[common.get_uri_from_file_path(path)] = schema
+    return store
+
+
+@lru_cache
+def get_compiled_schema(schema_path: str) -> CompiledSchema:
+    """Load and check the bundled json schema at the given package relative
+    path. The result is cached for the lifetime of the process; use
+    ``get_compiled_schema.cache_clear()`` to reset it.
+
+    :param schema_path: package relative path of the json schema file.
+    """
+    schema, path = common.read_resource_file(schema_path)
+    return CompiledSchema(schema, path)
+
+
+# Keys holding examples and default values rather than schemas, the $refs in
+# them are data and never resolved by validation
+_DATA_KEYS = frozenset(("default", "enum", "example", "examples"))
+
+# Keys of objects mapping names to schemas, parameters, responses or headers,
+# whose keys are never data or vendor extensions
+_NAME_MAP_KEYS = frozenset(
+    (
+        "definitions",
+        "headers",
+        "parameters",
+        "patternProperties",
+        "properties",
+        "responses",
+        "securityDefinitions",
+    )
+)
+
+
+def _is_payload_key(key: Any, is_name_map: bool, is_root: bool) -> bool:
+    if not isinstance(key, str) or is_name_map:
+        return False
+    return key.startswith("x-") or (not is_root and key in _DATA_KEYS)
+
+
+def iter_external_refs(document: Any, base_uri: str) -> Iterator[str]:
+    """Find the uris of all the documents referenced by $refs in document.
+
+    $refs inside examples, default values and vendor extensions are skipped:
+    validation never dereferences them. Only vendor extensions are skipped at
+    the top of document, whose keys can be names in a shared models file.
+
+    :param document: json document in the form of a list or dict.
+    :param base_uri: uri of document, used to resolve relative $refs.
+
+    :returns: iterator over absolute document uris, without fragments. The
+        uri of document itself is never returned.
+    """
+    base_uri = urldefrag(base_uri)[0]
+    stack = [(document, False, True)]
+    while stack:
+        node, is_name_map, is_root = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                uri = urldefrag(urljoin(base_uri, ref))[0]
+                if uri and uri != base_uri:
+                    yield uri
+            stack.extend(
+                (value, not is_name_map and key in _NAME_MAP_KEYS, False)
+                for key, value in node.items()
+                if not _is_payload_key(key, is_name_map, is_root)
+            )
+        elif isinstance(node, list):
+            stack.extend((item, False, False) for item in node)
+
+
+def has_refs(document: Any) -> bool:
+    """Check whether document contains any $ref. The scan stops at the first
+    one, so only documents without $refs are walked completely.
+
+    :param document: json document in the form of a list or dict.
+    """
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return True
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return False
+
+
+def prefetch_remote_refs(
+    document: Any,
+    base_uri: str,
+    handlers: Mapping[str, Callable[[str], Any]],
+    store: Mapping[str, Any] | None = None,
+    max_workers: int = PREFETCH_WORKERS,
+) -> dict[str, Any]:
+    """Download all the documents transitively referenced by document.
+
+    Documents are fetched concurrently on a thread pool, one wave per level
+    of nesting, instead of one at a time while jsonschema walks the spec, so
+    handlers must be thread-safe. Documents that cannot be fetched are
+    skipped; resolving them later will surface the error where the $ref is
+    actually used.
+
+    :param document: json document in the form of a list or dict.
+    :param base_uri: uri of document, used to resolve relative $refs.
+    :param handlers: mapping from uri scheme to a callable that takes a uri
+        and returns the parsed document. Uris with other schemes are skipped.
+    :param store: already available documents, keyed by uri.
+    :param max_workers: maximum number of concurrent downloads.
+
+    :returns: store extended with the downloaded documents
+    """
+    fetched = dict(store or {})
+    seen = set(fetched)
+    pending = []
+    for uri in iter_external_refs(document, base_uri):
+        if uri not in seen:
+            seen.add(uri)
+            pending.append(uri)
+
+    if not pending:
+        return fetched
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            futures = {}
+            for uri in pending:
+                handler = handlers.get(urlsplit(uri).scheme)
+                if handler is not None:
+                    futures[uri] = executor.submit(handler, uri)
+
+            pending = []
+            for uri, future in futures.items():
+                try:
+                    fetched[uri] = future.result()
+                except Exception:
+                    log.debug("Failed to prefetch %s", uri, exc_info=True)
+                    continue
+                for ref_uri in iter_external_refs(fetched[uri], uri):
+                    if ref_uri not in seen:
+                        seen.add(ref_uri)
+                        pending.append(ref_uri)
+
+    return fetched
+
+
+async def prefetch_remote_refs_async(
+    document: Any,
+    base_uri: str,
+    handlers: Mapping[str, Callable[[str], Awaitable[Any]]],
+    store: Mapping[str, Any] | None = None,
+    max_concurrency: int = PREFETCH_WORKERS,
+) -> dict[str, Any]:
+    """Coroutine version of :func:`prefetch_remote_refs`.
+
+    :param handlers: mapping from uri scheme to a coroutine function that
+        takes a uri and returns the parsed document. Uris with other schemes
+        are skipped.
+    :param max_concurrency: maximum number of concurrent downloads.
+
+    See :func:`prefetch_remote_refs` for the other parameters.
+    """
+    fetched = dict(store or {})
+    seen = set(fetched)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(uri: str) -> Any:
+        async with semaphore:
+            return await handlers[urlsplit(uri).scheme](uri)
+
+    pending = []
+    for uri in iter_external_refs(document, base_uri):
+        if uri not in seen:
+            seen.add(uri)
+            pending.append(uri)
+
+    while pending:
+        uris = [uri for uri in pending if urlsplit(uri).scheme in handlers]
+        results = await asyncio.gather(
+            *(fetch(uri) for uri in uris), return_exceptions=True
+        )
+        pending = []
+        for uri, result in zip(uris, results):
+            if isinstance(result, BaseException):
+                log.debug("Failed to prefetch %s", uri, exc_info=result)
+                continue
+            fetched[uri] = result
+            for ref_uri in iter_external_refs(result, uri):
+                if ref_uri not in seen:
+                    seen.add(ref_uri)
+                    pending.append(ref_uri)
+
+    return fetched
+
+
 def create_dereffing_validator(instance_resolver: RefResolver) -> type[_Validator]:
     """Create a customized Draft4Validator that follows $refs in the schema
     being validated (the Swagger spec for a service). This is not to be
@@ -73,6 +326,8 @@ def create_dereffing_validator(instance_resolver: RefResolver) -> type[_Validato
     :rtype: Its complicated. See jsonschema.validators.create()
     """
     visited_refs: dict[str, str] = {}
+    interned_scopes: dict[tuple[str, ...], tuple[str, ...]] = {}
+    validated_refs: dict[tuple[int, Callable, int], tuple[Any, Any]] = {}
 
     validators_to_bound = {
         "$ref",
@@ -96,6 +351,8 @@ def create_dereffing_validator(instance_resolver: RefResolver) -> type[_Validato
             instance_resolver=instance_resolver,
             visited_refs=visited_refs,
             default_validator_callable=v,
+            interned_scopes=interned_scopes,
+            validated_refs=validated_refs,
         )
         if k in validators_to_bound
         else v
@@ -105,6 +362,18 @@ def create_dereffing_validator(instance_resolver: RefResolver) -> type[_Validato
     return validators.extend(Draft4Validator, bound_validators)
 
 
+def get_dereffing_validator(instance_resolver: RefResolver) -> type[_Validator]:
+    """Return the dereffing validator of instance_resolver. It is created once
+    per :class:`IndexedRefResolver`, and on every call for other resolvers.
+
+    :param instance_resolver: resolver for the swagger service's spec
+    :type instance_resolver: :class:`jsonschema.RefResolver`
+    """
+    if isinstance(instance_resolver, IndexedRefResolver):
+        return instance_resolver.dereffing_validator
+    return create_dereffing_validator(instance_resolver)
+
+
 def validate_schema_value(
     schema: Mapping[str, Any],
     value: Any,
@@ -113,10 +382,25 @@ def validate_schema_value(
     # pass resolver to avoid to refetch schema files
     if swagger_resolver is None:
         swagger_resolver = RefResolver.from_schema(schema)
-    create_dereffing_validator(swagger_resolver)(
+
+    validated_values = (
+        swagger_resolver.validated_values
+        if isinstance(swagger_resolver, IndexedRefResolver)
+        else None
+    )
+    key = (id(schema), id(value))
+    if validated_values is not None and key in validated_values:
+        # Shared parameters and properties reach the same default many times
+        return
+
+    get_dereffing_validator(swagger_resolver)(
         schema, resolver=swagger_resolver
     ).validate(value)
 
+    if validated_values is not None:
+        # Keep schema and value alive so that their ids are not reused
+        validated_values[key] = (schema, value)
+
 
 @contextlib.contextmanager
 def visiting(visited_refs: dict[str, str], ref: str) -> Generator[None, None, None]:
@@ -141,6 +425,8 @@ def validator_wrapper(
     instance_resolver: RefResolver,
     visited_refs: dict[str, str],
     default_validator_callable: Callable,
+    interned_scopes: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+    validated_refs: dict[tuple[int, Callable, int], tuple[Any, Any]] | None = None,
 ) -> Generator[_Error, None, None]:
     """Generator function that parameterizes default_validator_callable.
 
@@ -156,6 +442,8 @@ def validator_wrapper(
     :param visited_refs: Keeps track of visisted refs during validation of
         the swagger service spec.
     :param default_validator_callable: jsonschema._validators.* callable
+    :param interned_scopes: see :func:`attach_scope`
+    :param validated_refs: see :func:`deref_and_validate`
     """
     yield from deref_and_validate(
         validator,
@@ -165,6 +453,8 @@ def validator_wrapper(
         instance_resolver,
         visited_refs,
         default_validator_callable,
+        interned_scopes,
+        validated_refs,
     )
 
 
@@ -176,11 +466,17 @@ def deref_and_validate(
     instance_resolver: RefResolver,
     visited_refs: dict[str, str],
     default_validator_callable: Callable,
+    interned_scopes: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+    validated_refs: dict[tuple[int, Callable, int], tuple[Any, Any]] | None = None,
 ) -> Generator[_Error, None, None]:
     """Generator function that dereferences instance if it is a $ref before
     passing it downstream for actual validation. When a cyclic ref is detected,
     short-circuit and return.
 
+    The same $ref target is often referenced from many places and validated
+    against the same schema node each time. Pairs that validated without
+    errors are recorded in validated_refs and are not validated again.
+
     :type validator: :class:`jsonschema.validators.Validator`
     :param schema_element: The schema element that is passed in to each
         specific validator callable aka the 2nd arg in each
@@ -193,6 +489,11 @@ def deref_and_validate(
     :param visited_refs: Keeps track of visisted refs during validation of
         the swagger service spec.
     :param default_validator_callable: jsonschema._validators.* callable
+    :param interned_scopes: see :func:`attach_scope`
+    :param validated_refs: mapping from (id(schema),
+        default_validator_callable, id(target)) to (schema, target) of the
+        $ref targets that validated without errors. Schema and target are
+        kept so that their ids cannot be reused.
     """
     if (
         isinstance(instance, dict)
@@ -203,7 +504,7 @@ def deref_and_validate(
         # Annotate $ref dict with scope - used by custom validations
         # We still need to attach the scope even if this is a cycle, as otherwise there are cases
         # with specs split into multiple files where it can't be dereferenced properly
-        attach_scope(instance, instance_resolver)
+        attach_scope(instance, instance_resolver, interned_scopes)
 
         if ref in visited_refs:
             log.debug("Found cycle in %s", ref)
@@ -211,9 +512,23 @@ def deref_and_validate(
 
         with visiting(visited_refs, ref):
             with instance_resolver.resolving(ref) as target:
-                yield from default_validator_callable(
+                if validated_refs is None:
+                    yield from default_validator_callable(
+                        validator, schema_element, target, schema
+                    )
+                    return
+
+                key = (id(schema), default_validator_callable, id(target))
+                if key in validated_refs:
+                    return
+                valid = True
+                for error in default_validator_callable(
                     validator, schema_element, target, schema
-                )
+                ):
+                    valid = False
+                    yield error
+                if valid:
+                    validated_refs[key] = (schema, target)
 
     else:
         yield from default_validator_callable(
@@ -221,19 +536,60 @@ def deref_and_validate(
         )
 
 
-def attach_scope(ref_dict: dict[str, Any], instance_resolver: RefResolver) -> None:
+def attach_scope(
+    ref_dict: dict[str, Any],
+    instance_resolver: RefResolver,
+    interned_scopes: dict[tuple[str, ...], tuple[str, ...]] | None = None,
+) -> None:
     """Attach scope to each $ref we encounter so that the $ref can be
     resolved by custom validations done outside the scope of jsonscema
     validations.
 
+    The scope is an immutable tuple. Most $refs of a spec share one of a few
+    scopes, so equal scopes are interned through interned_scopes: every $ref
+    with the same scope then points to the same tuple.
+
+    Resolvers with a ``ref_scopes`` side-table (see
+    :class:`IndexedRefResolver`) record the scope there instead of writing it
+    into ref_dict.
+
     :param ref_dict: dict with $ref key
     :type instance_resolver: :class:`jsonschema.RefResolver`
+    :param interned_scopes: mapping from scope to its interned tuple
     """
-    if "x-scope" in ref_dict:
+    if get_scope(ref_dict, instance_resolver) is not None:
         log.debug("Ref %s already has scope attached", ref_dict["$ref"])
         return
     log.debug("Attaching x-scope to %s", ref_dict)
-    ref_dict["x-scope"] = list(instance_resolver._scopes_stack)  # type: ignore
+    scope = tuple(instance_resolver._scopes_stack)  # type: ignore
+    if interned_scopes is not None:
+        scope = interned_scopes.setdefault(scope, scope)
+    ref_scopes = getattr(instance_resolver, "ref_scopes", None)
+    if ref_scopes is None:
+        ref_dict["x-scope"] = scope
+    else:
+        # The ref dict is kept so that its id cannot be reused
+        ref_scopes[id(ref_dict)] = (ref_dict, scope)
+
+
+def get_scope(
+    ref_dict: dict[str, Any], resolver: RefResolver | None
+) -> Sequence[str] | None:
+    """Return the scope attached to ref_dict by :func:`attach_scope`, either
+    as its x-scope or in the ``ref_scopes`` side-table of resolver.
+
+    :param ref_dict: dict with $ref key
+    :type resolver: :class:`jsonschema.RefResolver`
+    :returns: the scope, or None if no scope was attached
+    """
+    scope = ref_dict.get("x-scope")
+    if scope is None:
+        ref_scopes = getattr(resolver, "ref_scopes", None)
+        if ref_scopes:
+            entry = ref_scopes.get(id(ref_dict))
+            if entry is not None and entry[0] is ref_dict:
+                scope = entry[1]
+    return scope
 
 
 @contextlib.contextmanager
@@ -247,12 +603,87 @@ def in_scope(
     :type resolver: :class:`jsonschema.RefResolver
     :type ref_dict: dict
     """
-    if "x-scope" not in ref_dict:
+    scope = get_scope(ref_dict, resolver)
+    if scope is None:
         yield
     else:
         saved_scope_stack = resolver._scopes_stack  # type: ignore
         try:
-            resolver._scopes_stack = ref_dict["x-scope"]  # type: ignore
+            # The resolver pushes to and pops from its scope stack
+            resolver._scopes_stack = list(scope)  # type: ignore
             yield
         finally:
             resolver._scopes_stack = saved_scope_stack  # type: ignore
+
+
+class IndexedRefResolver(RefResolver):
+    """RefResolver that indexes the targets of the refs it resolves.
+
+    A plain RefResolver joins and splits urls and walks the json pointer from
+    the document root on every resolution, and large specs resolve the same
+    few refs (eg. ``#/definitions/Error``) tens of thousands of times. Here
+    each (resolution scope, ref) pair is resolved once and then looked up.
+
+    The index lives as long as the resolver, ie. a single validation run, so
+    documents fetched or edited between runs are never served stale.
+
+    :param mutate_spec: if False, the scopes of $refs are recorded in the
+        ``ref_scopes`` side-table instead of x-scope keys in the spec, see
+        :func:`attach_scope`.
+    :param has_refs: if False, the referrer contains no $ref, see
+        :func:`has_refs`. Its documents are then validated without
+        dereferencing.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        mutate_spec: bool = True,
+        has_refs: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # False when the referrer is known to contain no $ref at all
+        self.has_refs = has_refs
+        # (resolution scope, ref) -> (url, target)
+        self._ref_index: dict[tuple[str, str], tuple[str, Any]] = {}
+        # id(ref dict) -> (ref dict, scope), None when scopes are written
+        # into the spec
+        self.ref_scopes: dict[int, tuple[dict[str, Any], tuple[str, ...]]] | None = (
+            None if mutate_spec else {}
+        )
+        # (id(schema), id(value)) -> (schema, value) of the values that were
+        # successfully validated by validate_schema_value
+        self.validated_values: dict[tuple[int, int], tuple[Any, Any]] = {}
+
+    @functools.cached_property
+    def dereffing_validator(self) -> type[_Validator]:
+        """Dereffing validator bound to this resolver, see
+        :func:`create_dereffing_validator`. Documents without $refs have
+        nothing to dereference, they get the plain Draft4Validator.
+        """
+        if not self.has_refs:
+            return Draft4Validator
+        return create_dereffing_validator(self)
+
+    def resolve(self, ref: str) -> tuple[str, Any]:
+        key = (self.resolution_scope, ref)
+        resolved = self._ref_index.get(key)
+        if resolved is None:
+            resolved = self._ref_index[key] = super().resolve(ref)
+        return resolved
+
+    def resolve_ref_dict(self, ref_dict: dict[str, Any]) -> Any:
+        """Return the target of ref_dict, resolved in its x-scope if it has
+        one. Unlike :func:`in_scope` and :meth:`resolving`, an indexed ref
+        does not touch the scope stack.
+
+        :param ref_dict: dict with a $ref key
+        """
+        scope = get_scope(ref_dict, self)
+        key = (scope[-1] if scope else self.resolution_scope, ref_dict["$ref"])
+        resolved = self._ref_index.get(key)
+        if resolved is None:
+            with in_scope(self, ref_dict):
+                resolved = self._ref_index[key] = super().resolve(ref_dict["$ref"])
+        return resolved[1]
@@ -0,0 +1,229 @@
+"""
+Persistent on-disk cache for remote (http and https) $ref documents.
+
+Parsed documents are stored in a directory, keyed by url, so that repeated
+runs do not have to download and parse the same shared files again. Entries
+younger than the configured ttl are used as is; older entries are revalidated
+with a conditional request using their ``ETag`` / ``Last-Modified`` headers.
+The least recently used entries are evicted once the directory grows over the
+configured size.
+
+The cache is disabled by default. Enable it with :func:`configure` or by
+setting the ``SWAGGER_SPEC_VALIDATOR_CACHE_DIR`` environment variable, which
+is read when the cache is first used.
+
+Documents are stored with :mod:`pickle`; only point the cache at a directory
+that is not writable by untrusted users.
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import NamedTuple
+from urllib.error import HTTPError
+
+from swagger_spec_validator import common
+from swagger_spec_validator import http_pool
+
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "SWAGGER_SPEC_VALIDATOR_CACHE_DIR"
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_TTL = 60 * 60.0
+
+_ENTRY_SUFFIX = ".pickle"
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    document: Any
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+
+class RemoteDocumentCache:
+    """On-disk cache of parsed remote documents.
+
+    :param directory: directory holding the cache entries, created if needed.
+    :param max_size: maximum total size in bytes of the entries. Least
+        recently used entries are evicted above it.
+    :param ttl: number of seconds an entry is used without revalidating it
+        with the server.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+    ) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.ttl = ttl
+        self._eviction_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _entry_path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+
+    def get(self, url: str) -> CacheEntry | None:
+        path = self._entry_path(url)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            # Record the access for the LRU eviction
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            log.debug("Ignoring unreadable cache entry for %s", url, exc_info=True)
+            return None
+        return entry if isinstance(entry, CacheEntry) and entry.url == url else None
+
+    def put(self, entry: CacheEntry) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(entry.url))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in
+        max_size.
+        """
+        with self._eviction_lock:
+            entries = []
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(_ENTRY_SUFFIX):
+                    continue
+                with contextlib.suppress(FileNotFoundError):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                total_size -= size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_ENTRY_SUFFIX):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(entry.path)
+
+    def read_url(self, url: str, timeout: float = common.TIMEOUT_SEC) -> Any:
+        """Drop-in replacement for :func:`swagger_spec_validator.common.read_url`
+        going through the cache.
+        """
+        entry = self.get(url)
+        if entry is not None and time.time() - entry.stored_at < self.ttl:
+            return entry.document
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = http_pool.get_default_pool().request(
+            url, headers=headers, timeout=timeout
+        )
+        if response.status == 304:
+            if entry is None:
+                raise HTTPError(url, 304, "Not Modified", response.headers, None)
+            log.debug("Cached %s is still valid", url)
+            self.put(entry._replace(stored_at=time.time()))
+            return entry.document
+
+        content = response.body
+        content_type = response.headers.get_content_type()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        document = common.load_document(content, url, content_type)
+        self.put(CacheEntry(url, document, etag, last_modified, time.time()))
+        return document
+
+
+_default_cache: RemoteDocumentCache | None = None
+# False until the default cache is configured, explicitly or from the
+# environment on first use
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def configure(
+    directory: str | None,
+    max_size: int = DEFAULT_MAX_SIZE,
+    ttl: float = DEFAULT_TTL,
+) -> RemoteDocumentCache | None:
+    """Configure the cache used by :func:`read_url`, and therefore by the
+    default http and https $ref handlers.
+
+    :param directory: directory of the cache, or None to disable caching.
+    :param max_size: see :class:`RemoteDocumentCache`.
+    :param ttl: see :class:`RemoteDocumentCache`.
+
+    :returns: the configured cache
+    """
+    global _default_cache, _configured
+    with _configure_lock:
+        _default_cache = (
+            None if directory is None else RemoteDocumentCache(directory, max_size, ttl)
+        )
+        _configured = True
+    return _default_cache
+
+
+def _configure_from_environment() -> None:
+    global _default_cache, _configured
+    with _configure_lock:
+        if _configured:
+            return
+        directory = os.environ.get(CACHE_DIR_ENV)
+        if directory:
+            try:
+                _default_cache = RemoteDocumentCache(directory)
+            except (OSError, ValueError) as e:
+                log.warning(
+                    "Remote document cache disabled, cannot use %s: %s", directory, e
+                )
+        _configured = True
+
+
+def get_default_cache() -> RemoteDocumentCache | None:
+    """The cache used by :func:`read_url`. Unless :func:`configure` was
+    called, it is configured from the ``SWAGGER_SPEC_VALIDATOR_CACHE_DIR``
+    environment variable on first use.
+    """
+    if not _configured:
+        _configure_from_environment()
+    return _default_cache
+
+
+def read_url(url: str, timeout: float = common.TIMEOUT_SEC) -> Any:
+    """Read a remote document through the configured cache, if any, and the
+    default connection pool.
+    """
+    cache = get_default_cache()
+    if cache is None:
+        return http_pool.read_url(url, timeout=timeout)
+    return cache.read_url(url, timeout=timeout)
@@ -0,0 +1,379 @@
+"""
+Cache of validation outcomes, to skip validating specs that did not change.
+
+Specs are fingerprinted either from their raw bytes (:meth:`validate_spec_url`)
+or from their canonical JSON form (:meth:`validate_spec`). The documents they
+reference are recorded with a fingerprint, see :func:`fingerprint_url`, that
+is checked again on every hit. Entries are also keyed by the library version
+and the bundled schemas, so upgrading the library invalidates them.
+
+Results are kept in an in-memory LRU and optionally in a local SQLite
+database shared by processes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Mapping
+from typing import NamedTuple
+from urllib.parse import SplitResult
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+import importlib_resources
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import RefResolver
+
+from swagger_spec_validator import http_pool
+from swagger_spec_validator import remote_cache
+from swagger_spec_validator import validator12
+from swagger_spec_validator.__about__ import __version__
+from swagger_spec_validator.common import load_document
+from swagger_spec_validator.common import read_url
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.ref_validators import default_handlers
+from swagger_spec_validator.util import get_validator
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = 1024
+
+
+class CachedResult(NamedTuple):
+    # Error message, None if the spec is valid
+    error: str | None
+    # (url, fingerprint) of every document referenced by the spec
+    dependencies: tuple[tuple[str, str], ...]
+
+
+@lru_cache
+def get_library_fingerprint() -> str:
+    """Fingerprint of the library version and of all the bundled schemas."""
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    schemas = importlib_resources.files("swagger_spec_validator") / "schemas"
+    for version_dir in sorted(schemas.iterdir(), key=lambda p: p.name):
+        for schema in sorted(version_dir.iterdir(), key=lambda p: p.name):
+            digest.update(schema.name.encode("utf-8"))
+            digest.update(schema.read_bytes())
+    return digest.hexdigest()
+
+
+def _canonical_key(key: Any) -> str:
+    return key if isinstance(key, str) else f"\0{type(key).__name__}:{key!r}"
+
+
+def _canonical(document: Any) -> Any:
+    """Copy of document without x-scope annotations and with string keys only,
+    so it can be serialized with sorted keys.
+    """
+    if isinstance(document, dict):
+        return {
+            _canonical_key(key): _canonical(value)
+            for key, value in document.items()
+            if key != "x-scope"
+        }
+    if isinstance(document, (list, tuple)):
+        return [_canonical(value) for value in document]
+    return document
+
+
+def fingerprint_document(document: Any) -> str:
+    """Fingerprint of the canonical JSON form of a parsed document."""
+    canonical_json = json.dumps(
+        _canonical(document), sort_keys=True, separators=(",", ":"), default=repr
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+def _is_local_file(parsed_url: SplitResult) -> bool:
+    return parsed_url.scheme == "file" and parsed_url.netloc in ("", "localhost")
+
+
+def _read_spec(
+    url: str, handlers: Mapping[str, Callable[[str], Any]] | None
+) -> tuple[str, Callable[[], Any]]:
+    """Read the spec at url like its dependencies, see :func:`fingerprint_url`.
+
+    Local files, and remote files while the remote document cache is
+    disabled, are fingerprinted from their raw bytes, so that they are only
+    parsed on cache misses.
+
+    :returns: fingerprint of the spec and a callable returning the parsed spec
+    """
+    parsed_url = urlsplit(url)
+    handler = (handlers or {}).get(parsed_url.scheme)
+    if handler is None:
+        if _is_local_file(parsed_url):
+            with open(url2pathname(parsed_url.path), "rb") as f:
+                content = f.read()
+            return hashlib.sha256(content).hexdigest(), lambda: load_document(
+                content, url=url
+            )
+        if (
+            parsed_url.scheme in ("http", "https")
+            and remote_cache.get_default_cache() is None
+        ):
+            response = http_pool.get_default_pool().request(url)
+            return hashlib.sha256(response.body).hexdigest(), lambda: load_document(
+                response.body, url, response.headers.get_content_type()
+            )
+        handler = default_handlers.get(parsed_url.scheme, read_url)
+
+    spec_dict = handler(url)
+    return fingerprint_document(spec_dict), lambda: spec_dict
+
+
+def fingerprint_url(
+    url: str, handlers: Mapping[str, Callable[[str], Any]] | None = None
+) -> str:
+    """Fingerprint of the document at url, used to detect changed
+    dependencies.
+
+    Local files are fingerprinted from their modification time and size,
+    without reading them. Other documents are read with the handler for
+    their scheme, which by default goes through the remote document cache
+    and the connection pool, and fingerprinted from their parsed content.
+
+    :param url: url of the document.
+    :param handlers: mapping from uri scheme to a callable that takes a uri
+        and returns the parsed document, defaults to the $ref handlers.
+    """
+    parsed_url = urlsplit(url)
+    if _is_local_file(parsed_url):
+        stat = os.stat(url2pathname(parsed_url.path))
+        return f"stat:{stat.st_mtime_ns}:{stat.st_size}"
+
+    handler: Callable[[str], Any] = (handlers or default_handlers).get(
+        parsed_url.scheme, read_url
+    )
+    return fingerprint_document(handler(url))
+
+
+@lru_cache
+def _meta_schema_uris() -> frozenset[str]:
+    return frozenset(RefResolver("", {}).store)
+
+
+def _get_dependencies(
+    validator: ModuleType,
+    spec_dict: dict[str, Any],
+    spec_url: str,
+    resolver: RefResolver | None,
+) -> list[str]:
+    if validator is validator12:
+        return [
+            validator12.get_resource_path(spec_url, api["path"])
+            for api in spec_dict.get("apis", ())
+        ]
+    if resolver is None:
+        raise ValueError("The documents read by the validation are unknown")
+    return [
+        uri
+        for uri, document in resolver.store.items()
+        if document is not spec_dict and uri not in _meta_schema_uris()
+    ]
+
+
+def _is_cacheable(error: SwaggerValidationError) -> bool:
+    # Errors from downloading $refs may be transient, only errors in the spec
+    # itself are cached
+    return len(error.args) < 2 or isinstance(error.args[1], ValidationError)
+
+
+class ValidationResultCache:
+    """Cache of validation outcomes keyed by spec content.
+
+    On a cache hit no validation happens: valid specs return immediately and
+    invalid ones raise :class:`SwaggerValidationError` with the original
+    message. Note that x-scope annotations are not attached to the spec in
+    that case.
+
+    :param maxsize: maximum number of results kept in memory.
+    :param sqlite_path: optional path of a SQLite database persisting the
+        results across processes.
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_MAXSIZE, sqlite_path: str | None = None
+    ) -> None:
+        self.maxsize = maxsize
+        self.sqlite_path = sqlite_path
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[str, CachedResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _get_connection(self) -> sqlite3.Connection | None:
+        if self.sqlite_path is None:
+            return None
+        if self._connection is None:
+            connection = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results "
+                    "(key TEXT PRIMARY KEY, library TEXT, result TEXT)"
+                )
+                # Results of other library versions can never be hit again
+                connection.execute(
+                    "DELETE FROM results WHERE library != ?",
+                    (get_library_fingerprint(),),
+                )
+            self._connection = connection
+        return self._connection
+
+    def _get(self, key: str) -> CachedResult | None:
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                return result
+
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            row = connection.execute(
+                "SELECT result FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            error, dependencies = json.loads(row[0])
+            result = CachedResult(error, tuple(map(tuple, dependencies)))
+            self._put_in_memory(key, result)
+            return result
+
+    def _put_in_memory(self, key: str, result: CachedResult) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def _put(self, key: str, result: CachedResult) -> None:
+        with self._lock:
+            self._put_in_memory(key, result)
+            connection = self._get_connection()
+            if connection is not None:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                        (key, get_library_fingerprint(), json.dumps(result)),
+                    )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            connection = self._get_connection()
+            if connection is not None:
+                with connection:
+                    connection.execute("DELETE FROM results")
+
+    def _is_up_to_date(
+        self,
+        result: CachedResult,
+        handlers: Mapping[str, Callable[[str], Any]] | None,
+    ) -> bool:
+        try:
+            return all(
+                fingerprint_url(url, handlers) == fingerprint
+                for url, fingerprint in result.dependencies
+            )
+        except Exception:
+            log.debug("Failed to check cached dependencies", exc_info=True)
+            return False
+
+    def _validate(
+        self,
+        spec_fingerprint: str,
+        load_spec: Callable[[], Any],
+        spec_url: str,
+        validate_kwargs: dict[str, Any],
+    ) -> None:
+        key_parts = (get_library_fingerprint(), spec_url, spec_fingerprint)
+        key = hashlib.sha256("\0".join(key_parts).encode("utf-8")).hexdigest()
+
+        http_handlers = validate_kwargs.get("http_handlers")
+        handlers = None if http_handlers is None else dict(http_handlers)
+        cached_result = self._get(key)
+        if cached_result is not None and self._is_up_to_date(cached_result, handlers):
+            self.hits += 1
+            if cached_result.error is not None:
+                raise SwaggerValidationError(cached_result.error)
+            return
+        self.misses += 1
+
+        spec_dict = load_spec()
+        validator = get_validator(spec_dict, spec_url)
+        error = None
+        try:
+            resolver = validator.validate_spec(spec_dict, spec_url, **validate_kwargs)
+        except SwaggerValidationError as e:
+            if not _is_cacheable(e):
+                raise
+            error = e
+            # Errors are also found in referenced documents, the result of
+            # a failed run depends on the documents read until the error
+            resolver = e.resolver
+
+        try:
+            dependencies = tuple(
+                (url, fingerprint_url(url, handlers))
+                for url in _get_dependencies(validator, spec_dict, spec_url, resolver)
+            )
+        except Exception:
+            log.debug("Not caching result for %s", spec_url, exc_info=True)
+        else:
+            self._put(
+                key,
+                CachedResult(str(error) if error is not None else None, dependencies),
+            )
+
+        if error is not None:
+            raise error
+
+    def validate_spec(
+        self, spec_dict: dict[str, Any], spec_url: str = "", **kwargs: Any
+    ) -> None:
+        """Validates a Swagger 1.2 or 2.0 spec unless an identical spec was
+        already validated.
+
+        :param spec_dict: the json dict of the swagger spec.
+        :param spec_url: url from which spec_dict was retrieved.
+        :param kwargs: passed to the version specific ``validate_spec``.
+
+        :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
+        """
+        self._validate(
+            fingerprint_document(spec_dict), lambda: spec_dict, spec_url, kwargs
+        )
+
+    def validate_spec_url(self, spec_url: str, **kwargs: Any) -> None:
+        """Validates the Swagger 1.2 or 2.0 spec at spec_url unless a spec with
+        identical content was already validated. On a cache hit local specs
+        are not even parsed.
+
+        :param spec_url: the URL of the spec.
+        :param kwargs: passed to the version specific ``validate_spec``. The
+            spec is read with the ``http_handlers`` entry for its scheme, if
+            any.
+
+        :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
+        """
+        http_handlers = kwargs.get("http_handlers")
+        try:
+            spec_fingerprint, load_spec = _read_spec(
+                spec_url, None if http_handlers is None else dict(http_handlers)
+            )
+        except Exception as e:
+            raise SwaggerValidationError(str(e), e)
+
+        self._validate(spec_fingerprint, load_spec, spec_url, kwargs)
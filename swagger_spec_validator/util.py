@@ -3,9 +3,14 @@ from __future__ import annotations
 import logging
 from types import ModuleType
 from typing import Any
+from typing import Callable
+from typing import Mapping
+from urllib.parse import urlsplit
 
 from swagger_spec_validator import validator12
 from swagger_spec_validator import validator20
+from swagger_spec_validator.common import Buffer
+from swagger_spec_validator.common import load_document
 from swagger_spec_validator.common import read_url
 from swagger_spec_validator.common import SwaggerValidationError
 from swagger_spec_validator.common import wrap_exception
@@ -48,7 +53,10 @@ def get_validator(spec_json: dict[str, Any], origin: str = "unknown") -> ModuleT
 
 
 @wrap_exception
-def validate_spec_url(spec_url: str) -> None:
+def validate_spec_url(
+    spec_url: str,
+    http_handlers: Mapping[str, Callable[[str], Any]] | None = None,
+) -> None:
     """Validates a Swagger spec given its URL.
 
     :param spec_url:
@@ -56,7 +64,32 @@ def validate_spec_url(spec_url: str) -> None:
         For Swagger 2.0, this is the URL to swagger.json in api-docs.
         If given as ``file://``, this must be an absolute url for cross-refs
         to work correctly.
+    :param http_handlers: mapping from uri scheme to a callable that takes a
+        uri and returns the document, used to download the spec and all the
+        documents it references. Urls of other schemes are read with
+        :func:`swagger_spec_validator.common.read_url`.
     """
-    spec_json = read_url(spec_url)
+    handler = None
+    if http_handlers is not None:
+        handler = http_handlers.get(urlsplit(spec_url).scheme)
+    spec_json = (handler or read_url)(spec_url)
     validator = get_validator(spec_json, spec_url)
+    validator.validate_spec(spec_json, spec_url, http_handlers=http_handlers)
+
+
+@wrap_exception
+def validate_spec_bytes(data: Buffer, spec_url: str = "") -> None:
+    """Validates a Swagger spec given its raw content.
+
+    The content is parsed without being decoded to a string first, so large
+    specs can be validated straight from a memory-mapped file or any other
+    buffer.
+
+    :param data: utf-8 encoded JSON or YAML spec, as bytes or a buffer such as
+        a memoryview.
+    :param spec_url: url from which data was retrieved. Used for
+        dereferencing refs and detecting JSON specs.
+    """
+    spec_json = load_document(data, url=spec_url)
+    validator = get_validator(spec_json, spec_url or "unknown")
     validator.validate_spec(spec_json, spec_url)
@@ -12,17 +12,17 @@ from __future__ import annotations
 import logging
 import os
 from typing import Any
+from typing import Callable
+from typing import Mapping
 from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-import jsonschema
-from jsonschema import RefResolver
+from jsonschema.exceptions import best_match
 
-from swagger_spec_validator.common import get_uri_from_file_path
-from swagger_spec_validator.common import read_resource_file
 from swagger_spec_validator.common import read_url
 from swagger_spec_validator.common import SwaggerValidationError
 from swagger_spec_validator.common import wrap_exception
-from swagger_spec_validator.ref_validators import default_handlers
+from swagger_spec_validator.ref_validators import get_compiled_schema
 
 log = logging.getLogger(__name__)
 
@@ -58,8 +58,20 @@ def get_resource_path(url: str, resource: str) -> str:
     return path
 
 
+def _read_url(
+    url: str, http_handlers: Mapping[str, Callable[[str], Any]] | None
+) -> Any:
+    handler = None
+    if http_handlers is not None:
+        handler = http_handlers.get(urlsplit(url).scheme)
+    return (handler or read_url)(url)
+
+
 @wrap_exception
-def validate_spec_url(url: str) -> None:
+def validate_spec_url(
+    url: str,
+    http_handlers: Mapping[str, Callable[[str], Any]] | None = None,
+) -> None:
     """Simple utility function to perform recursive validation of a Resource
     Listing and all associated API Declarations.
 
@@ -69,6 +81,7 @@ def validate_spec_url(url: str) -> None:
     encouraged to write your own version of this if required.
 
     :param url: the URL of the Resource Listing.
+    :param http_handlers: see :py:func:`validate_spec`.
 
     :returns: `None` in case of success, otherwise raises an exception.
 
@@ -76,10 +89,14 @@ def validate_spec_url(url: str) -> None:
     """
 
     log.info("Validating %s", url)
-    validate_spec(read_url(url), url)
+    validate_spec(_read_url(url, http_handlers), url, http_handlers)
 
 
-def validate_spec(resource_listing: dict[str, Any], url: str) -> None:
+def validate_spec(
+    resource_listing: dict[str, Any],
+    url: str,
+    http_handlers: Mapping[str, Callable[[str], Any]] | None = None,
+) -> None:
     """
     Validates the resource listing, fetches the api declarations and
     consequently validates them as well.
@@ -88,6 +105,10 @@ def validate_spec(resource_listing: dict[str, Any], url: str) -> None:
     :param url: url serving the resource listing; needed to resolve api
                 declaration path.
     :type url: string
+    :param http_handlers: mapping from uri scheme to a callable that takes a
+        uri and returns the document, used to fetch the api declarations.
+        Urls of other schemes are read with
+        :func:`swagger_spec_validator.common.read_url`.
 
     :returns: `None` in case of success, otherwise raises an exception.
 
@@ -98,7 +119,7 @@ def validate_spec(resource_listing: dict[str, Any], url: str) -> None:
     for api in resource_listing["apis"]:
         path = get_resource_path(url, api["path"])
         log.info("Validating %s", path)
-        validate_api_declaration(read_url(path))
+        validate_api_declaration(_read_url(path, http_handlers))
 
 
 def validate_data_type(
@@ -269,11 +290,11 @@ def validate_json(json_document: list[Any] | dict[str, Any], schema_path: str) -
     :param json_document: json document in the form of a list or dict.
     :param schema_path: package relative path of the json schema file.
     """
-    schema, schema_path = read_resource_file(schema_path)
-
-    resolver = RefResolver(
-        base_uri=get_uri_from_file_path(schema_path),
-        referrer=schema,
-        handlers=default_handlers,
+    compiled_schema = get_compiled_schema(schema_path)
+    validator = compiled_schema.validator_cls(
+        compiled_schema.schema, resolver=compiled_schema.resolver
     )
-    jsonschema.validate(json_document, schema, resolver=resolver)
+    # Like jsonschema.validate, report the most relevant error
+    error = best_match(validator.iter_errors(json_document))
+    if error is not None:
+        raise error
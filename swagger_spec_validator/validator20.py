@@ -1,38 +1,67 @@
 from __future__ import annotations
 
+import asyncio
 import functools
-import json
 import logging
 import string
 import warnings
 from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import cast
 from typing import Iterable
+from typing import Mapping
+from typing import NamedTuple
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from _typeshed import SupportsKeysAndGetItem
     from jsonschema.validators import _Handler
-from jsonschema.validators import Draft4Validator
 from jsonschema.validators import RefResolver
 
 from swagger_spec_validator import ref_validators
-from swagger_spec_validator.common import get_uri_from_file_path
-from swagger_spec_validator.common import read_resource_file
+from swagger_spec_validator.common import ErrorPath
 from swagger_spec_validator.common import read_url
 from swagger_spec_validator.common import SwaggerValidationError
 from swagger_spec_validator.common import SwaggerValidationWarning
 from swagger_spec_validator.common import wrap_exception
 from swagger_spec_validator.ref_validators import default_handlers
+from swagger_spec_validator.ref_validators import get_compiled_schema
+from swagger_spec_validator.ref_validators import get_scope
 from swagger_spec_validator.ref_validators import in_scope
+from swagger_spec_validator.ref_validators import IndexedRefResolver
+from swagger_spec_validator.ref_validators import prefetch_remote_refs
+from swagger_spec_validator.ref_validators import prefetch_remote_refs_async
 from swagger_spec_validator.ref_validators import validate_schema_value
+from swagger_spec_validator.walker import merge_rules
+from swagger_spec_validator.walker import Node
+from swagger_spec_validator.walker import OPERATION
+from swagger_spec_validator.walker import PARAMETER
+from swagger_spec_validator.walker import PATH_ITEM
+from swagger_spec_validator.walker import REF
+from swagger_spec_validator.walker import Rule
+from swagger_spec_validator.walker import SCHEMA
+from swagger_spec_validator.walker import SpecWalker
 
 
 log = logging.getLogger(__name__)
 
 
-def validate_ref(ref_dict: dict[str, Any], path: list[str]) -> None:
+def _render_path(path: list[str] | ErrorPath) -> str:
+    return str(path) if isinstance(path, ErrorPath) else "/".join(path)
+
+
+def _child_path(def_name: str | ErrorPath | None, key: str) -> ErrorPath:
+    # Lazy version of f"{def_name}/{key}"
+    return ErrorPath(
+        key, def_name if isinstance(def_name, ErrorPath) else f"{def_name}"
+    )
+
+
+def validate_ref(ref_dict: dict[str, Any], path: list[str] | ErrorPath) -> None:
     """Check if a ref_dict has siblings that will be overwritten by $ref or $ref is None.
 
     While the siblings case does not contradict the spec, it may cause confusion and mislead
@@ -51,7 +80,7 @@ def validate_ref(ref_dict: dict[str, Any], path: list[str]) -> None:
                 'Found "$ref: {}" with siblings that will be overwritten. '
                 "See https://stackoverflow.com/a/48114924 for more information. (path {})".format(
                     ref_dict["$ref"],
-                    "/".join(path),
+                    _render_path(path),
                 )
             ),
         )
@@ -61,53 +90,41 @@ def validate_ref(ref_dict: dict[str, Any], path: list[str]) -> None:
             SwaggerValidationWarning(
                 "Identified $ref with None value. This is usually an error, "
                 "although technically it might be allowed. (path: {})".format(
-                    "/".join(path)
+                    _render_path(path)
                 ),
             ),
         )
 
 
+def has_scope(ref_dict: Any, deref: Callable) -> bool:
+    # Scopes are in the side-table of the resolver when the spec is not
+    # mutated, see ``validate_spec``
+    resolver = getattr(deref, "keywords", {}).get("resolver", None)
+    return get_scope(ref_dict, resolver) is not None
+
+
 def validate_references(
     raw_spec: dict[Any, Any] | list[Any],
     deref: Callable,
     path: list[str] | None = None,
     visited_spec_ids: set[int] | None = None,
 ) -> None:
-    if path is None:
-        path = ["#"]
+    """Warn about suspicious $refs in raw_spec, see :func:`validate_ref`.
 
-    if visited_spec_ids is None:
-        visited_spec_ids = set()
+    $refs are only followed if jsonschema already followed them during the
+    validation against the Swagger 2.0 schema, ie. if they have a scope.
+    This is the walk :func:`validate_spec` does with :data:`RULES`.
 
-    if id(raw_spec) in visited_spec_ids:
-        return
-
-    # Register raw_spec into visited_spec_ids to prevent unbounded recursion
-    visited_spec_ids.add(id(raw_spec))
-
-    if isinstance(raw_spec, dict) and "$ref" in raw_spec:
-        # The additional check is needed as `is_ref` will consider raw_spec dictionaries with `$ref`
-        # attribute and string value.
-        # The goal of validate_ref is to ensure that objects that looks like a reference is actually
-        # valid by warning users about those cases.
-        # Due to _looks like_ we need to almost duplicate the check by removing the string enforcement
-        validate_ref(ref_dict=raw_spec, path=path)
-
-    if is_ref(raw_spec) and "x-scope" in raw_spec:
-        # Ensure that we're following references only if they were already
-        # descended by jsonschema during initial schema validation (x-scope is present)
-        # This is mostly done to ensure that we're not causing RefResolutionError
-        # due to the fact that the reference is relative and we have no information
-        # about the base path.
-        # This could be handled differently but we thought that checking references that
-        # were actively part of the specs is a valid trade-off here
-        validate_references(deref(raw_spec), deref, path, visited_spec_ids)
-    elif isinstance(raw_spec, dict):
-        for k, v in sorted(raw_spec.items()):
-            validate_references(v, deref, path + [k], visited_spec_ids)
-    elif isinstance(raw_spec, list):
-        for k, v in enumerate(raw_spec):
-            validate_references(v, deref, path + [str(k)], visited_spec_ids)
+    :param raw_spec: json document in the form of a list or dict.
+    :param deref: callable that dereferences $refs
+    :param path: location of raw_spec, defaults to the root of the spec.
+    :param visited_spec_ids: ids of the nodes already walked, updated with
+        the nodes of raw_spec.
+    """
+    spec_walker = SpecWalker(deref, {REF: [ref_rule]})
+    spec_walker.walk_references(
+        raw_spec, ErrorPath("#" if path is None else "/".join(path)), visited_spec_ids
+    )
 
 
 def deref(
@@ -128,24 +145,42 @@ def deref(
         return ref_dict
 
     ref = ref_dict["$ref"]
+    if isinstance(resolver, IndexedRefResolver):
+        log.debug("Resolving %s", ref)
+        return resolver.resolve_ref_dict(ref_dict)
+
     with in_scope(resolver, ref_dict):
         with resolver.resolving(ref) as target:
             log.debug("Resolving %s", ref)
             return target
 
 
+def _identity_deref(ref_dict: Any, resolver: RefResolver) -> Any:
+    """:func:`deref` for specs without $refs, see :func:`validate_spec`."""
+    return ref_dict
+
+
 @wrap_exception
-def validate_spec_url(spec_url: str) -> RefResolver:
+def validate_spec_url(
+    spec_url: str,
+    http_handlers: Mapping[str, Callable[[str], Any]] | None = None,
+) -> RefResolver:
     """Validates a Swagger 2.0 API Specification at the given URL.
 
     :param spec_url: the URL of the service's swagger spec.
+    :param http_handlers: used to download the spec and any remote $refs in
+        it, see :func:`validate_spec`.
 
     :returns: The resolver (with cached remote refs) used during validation
     :rtype: :class:`jsonschema.RefResolver`
     :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
     """
     log.info("Validating %s", spec_url)
-    return validate_spec(read_url(spec_url), spec_url)
+    handler = None
+    if http_handlers is not None:
+        handler = http_handlers.get(urlsplit(spec_url).scheme)
+    spec_dict = (handler or read_url)(spec_url)
+    return validate_spec(spec_dict, spec_url, http_handlers=http_handlers)
 
 
 def validate_spec(
@@ -154,6 +189,10 @@ def validate_spec(
     http_handlers: SupportsKeysAndGetItem[str, _Handler]
     | Iterable[tuple[str, _Handler]]
     | None = None,
+    store: Mapping[str, Any] | None = None,
+    prefetch: bool = True,
+    mutate_spec: bool = True,
+    extra_rules: Mapping[str, Iterable[Rule]] | None = None,
 ) -> RefResolver:
     """Validates a Swagger 2.0 API Specification given a Swagger Spec.
 
@@ -167,32 +206,174 @@ def validate_spec(
         http client built into jsonschema's RefResolver is used. This
         is a mapping from uri scheme to a callable that takes a
         uri.
+    :param store: mapping from uri to already parsed remote documents that
+        the resolver can use instead of downloading them again.
+    :param prefetch: concurrently download all the remote documents
+        referenced by spec_dict before validating it, see
+        :func:`swagger_spec_validator.ref_validators.prefetch_remote_refs`.
+        Ignored when http_handlers is given.
+    :param mutate_spec: attach the scope of every $ref to it as an x-scope
+        key. If False, spec_dict is left untouched and the scopes are kept in
+        the ``ref_scopes`` side-table of the returned resolver instead.
+    :param extra_rules: mapping from node kind to additional semantic checks,
+        run in the same walk of the spec as the built-in :data:`RULES`. See
+        :class:`swagger_spec_validator.walker.SpecWalker`.
 
     :returns: the resolver (with cached remote refs) used during validation
     :rtype: :class:`jsonschema.RefResolver`
-    :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
+    :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`, with
+        the resolver holding the documents read until the error as its
+        ``resolver`` attribute.
     """
-    swagger_resolver = validate_json(
-        spec_dict,
-        "schemas/v2.0/schema.json",
-        spec_url=spec_url,
-        http_handlers=http_handlers,
+    # Generated specs often have no $ref at all, they skip the prefetch and
+    # all the dereferencing
+    spec_has_refs = ref_validators.has_refs(spec_dict)
+    # Custom handlers were never required to be thread-safe, only the built-in
+    # ones are called from the prefetch threads
+    if prefetch and spec_has_refs and http_handlers is None:
+        store = prefetch_remote_refs(spec_dict, spec_url, default_handlers, store)
+
+    swagger_resolver = _create_resolver(
+        spec_dict, spec_url, http_handlers, store, mutate_spec, spec_has_refs
     )
+    try:
+        validate_json(spec_dict, "schemas/v2.0/schema.json", resolver=swagger_resolver)
 
-    bound_deref = functools.partial(deref, resolver=swagger_resolver)
-    spec_dict = cast("dict[Any, Any]", bound_deref(spec_dict))
-    apis = bound_deref(spec_dict["paths"])
-    definitions = bound_deref(spec_dict.get("definitions", {}))
-    validate_apis(cast("dict[Any, Any]", apis), bound_deref)
-    validate_definitions(cast("dict[Any, Any]", definitions), bound_deref)
-    validate_parameters(
-        cast("dict[Any, Any]", bound_deref(spec_dict.get("parameters", {}))),
-        bound_deref,
-    )
-    validate_references(spec_dict, bound_deref)
+        bound_deref = functools.partial(
+            deref if spec_has_refs else _identity_deref, resolver=swagger_resolver
+        )
+        # All the semantic checks share a single walk of the spec
+        spec_walker = SpecWalker(bound_deref, merge_rules(RULES, extra_rules))
+        spec_walker.walk(bound_deref(spec_dict))
+    except SwaggerValidationError as e:
+        e.resolver = swagger_resolver
+        raise
     return swagger_resolver
 
 
+async def validate_spec_url_async(
+    spec_url: str,
+    async_handlers: Mapping[str, Callable[[str], Awaitable[Any]]] | None = None,
+    executor: Executor | None = None,
+) -> RefResolver:
+    """Coroutine version of :func:`validate_spec_url`.
+
+    :param spec_url: the URL of the service's swagger spec.
+    :param async_handlers: see :func:`validate_spec_async`. The spec itself
+        is fetched with the handler for the scheme of spec_url if there is
+        one, otherwise it is read in the executor.
+    :param executor: see :func:`validate_spec_async`.
+
+    :returns: The resolver (with cached remote refs) used during validation
+    :rtype: :class:`jsonschema.RefResolver`
+    :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
+    """
+    log.info("Validating %s", spec_url)
+    handler = (async_handlers or {}).get(urlsplit(spec_url).scheme)
+    try:
+        if handler is not None:
+            spec_dict = await handler(spec_url)
+        else:
+            loop = asyncio.get_running_loop()
+            spec_dict = await loop.run_in_executor(executor, read_url, spec_url)
+    except Exception as e:
+        raise SwaggerValidationError(str(e), e)
+    return await validate_spec_async(spec_dict, spec_url, async_handlers, executor)
+
+
+async def validate_spec_async(
+    spec_dict: dict[Any, Any],
+    spec_url: str = "",
+    async_handlers: Mapping[str, Callable[[str], Awaitable[Any]]] | None = None,
+    executor: Executor | None = None,
+) -> RefResolver:
+    """Coroutine version of :func:`validate_spec`.
+
+    Remote $refs are downloaded concurrently on the event loop with
+    async_handlers, then the CPU bound validation runs in executor so the
+    event loop is not blocked.
+
+    :param spec_dict: the json dict of the swagger spec.
+    :param spec_url: url from which spec_dict was retrieved. Used for
+        dereferencing refs. eg: file:///foo/swagger.json
+    :param async_handlers: mapping from uri scheme to a coroutine function
+        that takes a uri and returns the parsed document. Documents with other
+        schemes, or that could not be downloaded, are fetched in the executor
+        with the default handlers.
+    :param executor: executor running the validation. Defaults to the event
+        loop's default executor.
+
+    :returns: the resolver (with cached remote refs) used during validation
+    :rtype: :class:`jsonschema.RefResolver`
+    :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
+    """
+    store = await prefetch_remote_refs_async(spec_dict, spec_url, async_handlers or {})
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(validate_spec, spec_dict, spec_url, store=store),
+    )
+
+
+class SpecValidationResult(NamedTuple):
+    """Outcome of validating a single spec with :func:`validate_specs`."""
+
+    spec_url: str
+    resolver: RefResolver | None
+    error: SwaggerValidationError | None
+
+    @property
+    def is_valid(self) -> bool:
+        return self.error is None
+
+
+def validate_specs(
+    specs: Iterable[tuple[dict[Any, Any], str]],
+    http_handlers: SupportsKeysAndGetItem[str, _Handler]
+    | Iterable[tuple[str, _Handler]]
+    | None = None,
+) -> list[SpecValidationResult]:
+    """Validates many Swagger 2.0 API Specifications in one go.
+
+    Remote documents downloaded while validating one spec are handed to the
+    resolvers of the following specs, so files shared by several specs are
+    only fetched and parsed once.
+
+    :param specs: iterable of (spec_dict, spec_url) tuples, see
+        :func:`validate_spec`.
+    :param http_handlers: see :func:`validate_spec`.
+
+    :returns: one result per spec, in input order. Validation errors are
+        reported in the results instead of being raised.
+    :rtype: list of :class:`SpecValidationResult`
+    """
+    store: dict[str, Any] = {}
+    results = []
+    for spec_dict, spec_url in specs:
+        try:
+            resolver = validate_spec(
+                spec_dict, spec_url, http_handlers=http_handlers, store=store
+            )
+        except Exception as e:
+            log.debug("Validation of %s failed", spec_url, exc_info=True)
+            error = (
+                e
+                if isinstance(e, SwaggerValidationError)
+                else SwaggerValidationError(str(e), e)
+            )
+            results.append(SpecValidationResult(spec_url, None, error))
+            continue
+
+        # Share everything but the spec itself with the next resolvers
+        store.update(
+            (uri, document)
+            for uri, document in resolver.store.items()
+            if document is not spec_dict
+        )
+        results.append(SpecValidationResult(spec_url, resolver, None))
+    return results
+
+
 @wrap_exception
 def validate_json(
     spec_dict: list[Any] | dict[str, Any],
@@ -201,6 +382,10 @@ def validate_json(
     http_handlers: SupportsKeysAndGetItem[str, _Handler]
     | Iterable[tuple[str, _Handler]]
     | None = None,
+    store: Mapping[str, Any] | None = None,
+    mutate_spec: bool = True,
+    has_refs: bool | None = None,
+    resolver: IndexedRefResolver | None = None,
 ) -> RefResolver:
     """Validate a json document against a json schema.
 
@@ -213,37 +398,60 @@ def validate_json(
         http client built into jsonschema's RefResolver is used. This
         is a mapping from uri scheme to a callable that takes a
         uri.
+    :param store: mapping from uri to already parsed remote documents used
+        to pre-populate the RefResolver.
+    :param mutate_spec: see :func:`validate_spec`.
+    :param has_refs: whether spec_dict contains any $ref, detected with
+        :func:`swagger_spec_validator.ref_validators.has_refs` if None.
+        Documents without $refs are validated with the plain json schema
+        validator.
+    :param resolver: resolver for spec_dict to validate it with, instead of
+        one created from the parameters above.
 
     :return: RefResolver for spec_dict with cached remote $refs used during
         validation.
     :rtype: :class:`jsonschema.RefResolver`
     """
-    schema, schema_path = read_resource_file(schema_path)
+    compiled_schema = get_compiled_schema(schema_path)
+    spec_resolver = resolver
+    if spec_resolver is None:
+        if has_refs is None:
+            has_refs = ref_validators.has_refs(spec_dict)
+        spec_resolver = _create_resolver(
+            spec_dict, spec_url, http_handlers, store, mutate_spec, has_refs
+        )
 
-    schema_resolver = RefResolver(
-        base_uri=get_uri_from_file_path(schema_path),
-        referrer=schema,
-        handlers=default_handlers,
+    # The schema was already checked when it was compiled, so only the
+    # instance needs validating here.
+    instance_cls = ref_validators.get_dereffing_validator(spec_resolver)
+    instance_cls(compiled_schema.schema, resolver=compiled_schema.resolver).validate(
+        spec_dict
     )
 
-    spec_resolver = RefResolver(
+    # Since remote $refs were downloaded, pass the resolver back to the caller
+    # so that its cached $refs can be re-used.
+    return spec_resolver
+
+
+def _create_resolver(
+    spec_dict: list[Any] | dict[str, Any],
+    spec_url: str,
+    http_handlers: SupportsKeysAndGetItem[str, _Handler]
+    | Iterable[tuple[str, _Handler]]
+    | None,
+    store: Mapping[str, Any] | None,
+    mutate_spec: bool,
+    has_refs: bool,
+) -> IndexedRefResolver:
+    return IndexedRefResolver(
         base_uri=spec_url,
         referrer=cast("dict[str, Any]", spec_dict),
         handlers=http_handlers or default_handlers,
+        store=store or {},
+        mutate_spec=mutate_spec,
+        has_refs=has_refs,
     )
 
-    ref_validators.validate(
-        instance=spec_dict,
-        schema=schema,
-        resolver=schema_resolver,
-        instance_cls=ref_validators.create_dereffing_validator(spec_resolver),
-        cls=Draft4Validator,
-    )
-
-    # Since remote $refs were downloaded, pass the resolver back to the caller
-    # so that its cached $refs can be re-used.
-    return spec_resolver
-
 
 @wrap_exception
 def validate_value_type(schema: dict[str, Any], value: Any, deref: Callable) -> None:
@@ -292,9 +500,7 @@ def validate_defaults_in_parameters(params_spec: list[Any], deref: Callable) ->
         validate_default_in_parameter(param_spec, deref)
 
 
-def validate_responses(
-    api: str, http_verb: str, responses_dict: dict[str, Any], deref: Callable
-) -> None:
+def check_responses(api: str, http_verb: str, responses_dict: Any) -> None:
     if is_ref(responses_dict):
         raise SwaggerValidationError(
             "{http_verb} {api} does not have a valid responses section. "
@@ -303,6 +509,19 @@ def validate_responses(
                 api=api,
             )
         )
+
+
+def validate_responses(
+    api: str,
+    http_verb: str,
+    responses_dict: dict[str, Any],
+    deref: Callable,
+    visited_definitions: set[int] | None = None,
+) -> None:
+    check_responses(api, http_verb, responses_dict)
+    responses_path = ErrorPath(
+        "responses", ErrorPath(http_verb, ErrorPath(api, ErrorPath("paths", "#")))
+    )
     for response_status, response_spec in responses_dict.items():
         response_schema = response_spec.get("schema")
         if response_schema is None:
@@ -310,17 +529,15 @@ def validate_responses(
         validate_definition(
             definition=response_schema,
             deref=deref,
-            def_name="#/paths/{api}/{http_verb}/responses/{status_code}".format(
-                http_verb=http_verb,
-                api=api,
-                status_code=response_status,
-            ),
-            visited_definitions=set(),
+            def_name=ErrorPath(str(response_status), responses_path),
+            visited_definitions=set()
+            if visited_definitions is None
+            else visited_definitions,
         )
 
 
 def validate_non_body_parameter(
-    param: dict[str, Any], deref: Callable, def_name: str
+    param: dict[str, Any], deref: Callable, def_name: str | ErrorPath
 ) -> None:
     if "type" not in param:
         raise SwaggerValidationError(
@@ -337,9 +554,7 @@ def validate_non_body_parameter(
         )
 
 
-def validate_body_parameter(
-    param: dict[str, Any], deref: Callable, def_name: str
-) -> None:
+def check_body_parameter(param: dict[str, Any], def_name: str | ErrorPath) -> None:
     if "schema" not in param:
         raise SwaggerValidationError(
             "Body parameter in `{def_name}` does not specify `schema`.".format(
@@ -347,47 +562,75 @@ def validate_body_parameter(
             )
         )
 
+
+def validate_body_parameter(
+    param: dict[str, Any],
+    deref: Callable,
+    def_name: str | ErrorPath,
+    visited_definitions: set[int] | None = None,
+) -> None:
+    check_body_parameter(param, def_name)
     validate_definition(
         definition=param["schema"],
         deref=deref,
-        def_name=f"{def_name}/schema",
-        visited_definitions=set(),
+        def_name=_child_path(def_name, "schema"),
+        visited_definitions=set()
+        if visited_definitions is None
+        else visited_definitions,
     )
 
 
-def validate_parameter(param: dict[str, Any], deref: Callable, def_name: str) -> None:
+def validate_parameter(
+    param: dict[str, Any],
+    deref: Callable,
+    def_name: str | ErrorPath,
+    visited_definitions: set[int] | None = None,
+) -> None:
     validate_default_in_parameter(param, deref)
 
     if not is_ref(param):
         if param["in"] == "body":
-            validate_body_parameter(param, deref, def_name)
+            validate_body_parameter(param, deref, def_name, visited_definitions)
         else:
             validate_non_body_parameter(param, deref, def_name)
 
 
-def validate_apis(apis: dict[str, Any], deref: Callable) -> None:
+def validate_apis(
+    apis: dict[str, Any],
+    deref: Callable,
+    visited_definitions: set[int] | None = None,
+) -> None:
     """Validates semantic errors in #/paths.
 
     :param apis: dict of all the #/paths
     :param deref: callable that dereferences $refs
+    :param visited_definitions: ids of the definitions already validated,
+        shared by all the responses and body parameters. See
+        :func:`validate_definition`.
 
     :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
     :raises: :py:class:`jsonschema.exceptions.ValidationError`
     """
+    if visited_definitions is None:
+        visited_definitions = set()
     operation_id_set = set()
+    paths_path = ErrorPath("paths", "#")
 
     for api_name, api_body in apis.items():
+        api_path = ErrorPath(api_name, paths_path)
         api_body = deref(api_body)
         api_params = deref(api_body.get("parameters", []))
-        validate_duplicate_param(api_params, deref)
+        # Shared by all the operations of the path item
+        deref_api_params = [deref(param) for param in api_params]
+        validate_duplicate_param(deref_api_params, deref)
+        api_path_param_names = set(get_path_param_names(deref_api_params, deref))
+        api_params_path = ErrorPath("parameters", api_path)
         for idx, param in enumerate(api_params):
             validate_parameter(
                 param=param,
                 deref=deref,
-                def_name="#/paths/{api_name}/parameters/{idx}".format(
-                    api_name=api_name,
-                    idx=idx,
-                ),
+                def_name=ErrorPath(str(idx), api_params_path),
+                visited_definitions=visited_definitions,
             )
 
         for oper_name in api_body:
@@ -408,26 +651,30 @@ def validate_apis(apis: dict[str, Any], deref: Callable) -> None:
                 operation_id_set.add(operation_id)
 
             oper_params = deref(oper_body.get("parameters", []))
-            validate_duplicate_param(oper_params, deref)
+            deref_oper_params = [deref(param) for param in oper_params]
+            validate_duplicate_param(deref_oper_params, deref)
             all_path_params = list(
-                set(
-                    get_path_param_names(api_params, deref)
-                    + get_path_param_names(oper_params, deref),
+                api_path_param_names.union(
+                    get_path_param_names(deref_oper_params, deref)
                 )
             )
             validate_unresolvable_path_params(api_name, all_path_params)
+            oper_params_path = ErrorPath("parameters", ErrorPath(oper_name, api_path))
             for idx, param in enumerate(oper_params):
                 validate_parameter(
                     param=param,
                     deref=deref,
-                    def_name="#/paths/{api_name}/{oper_name}/parameters/{idx}".format(
-                        api_name=api_name,
-                        oper_name=oper_name,
-                        idx=idx,
-                    ),
+                    def_name=ErrorPath(str(idx), oper_params_path),
+                    visited_definitions=visited_definitions,
                 )
             # Responses validation
-            validate_responses(api_name, oper_name, oper_body["responses"], deref)
+            validate_responses(
+                api_name,
+                oper_name,
+                oper_body["responses"],
+                deref,
+                visited_definitions,
+            )
 
 
 def get_collapsed_properties_type_mappings(
@@ -441,28 +688,29 @@ def get_collapsed_properties_type_mappings(
     :return: (required properties type mapping, not required properties type mapping)
     :type: tuple
     """
-    definition = deref(definition)
     required_properties = {}
     not_required_properties = {}
-    if definition.get("allOf"):
-        for inner_definition in definition["allOf"]:
-            (
-                inner_required_properties,
-                inner_not_required_properties,
-            ) = get_collapsed_properties_type_mappings(inner_definition, deref)
-            required_properties.update(inner_required_properties)
-            not_required_properties.update(inner_not_required_properties)
-    else:
-        properties = {
-            prop_name: prop_schema.get("type", "object")
-            for prop_name, prop_schema in definition.get("properties", {}).items()
-        }
+    # The allOf tree is walked depth first, collecting the properties of its
+    # leaves in order. Definitions are expanded once, which also stops
+    # recursive allOf.
+    visited_definitions: set[int] = set()
+    stack = [definition]
+    while stack:
+        definition = deref(stack.pop())
+        if id(definition) in visited_definitions:
+            continue
+        visited_definitions.add(id(definition))
+
+        if definition.get("allOf"):
+            stack.extend(reversed(definition["allOf"]))
+            continue
+
         required_properties_set = set(definition.get("required", []))
-        for k, v in properties.items():
-            if k in required_properties_set:
-                required_properties[k] = v
+        for prop_name, prop_schema in definition.get("properties", {}).items():
+            if prop_name in required_properties_set:
+                required_properties[prop_name] = prop_schema.get("type", "object")
             else:
-                not_required_properties[k] = v
+                not_required_properties[prop_name] = prop_schema.get("type", "object")
 
     return required_properties, not_required_properties
 
@@ -501,8 +749,8 @@ def validate_defaults_in_definition(
 def validate_arrays_in_definition(
     definition_spec: dict[str, Any],
     deref: Callable,
-    def_name: str | None = None,
-    visited_definitions: set[str] | None = None,
+    def_name: str | ErrorPath | None = None,
+    visited_definitions: set[int] | None = None,
 ) -> None:
     if definition_spec.get("type") == "array":
         if "items" not in definition_spec:
@@ -514,34 +762,25 @@ def validate_arrays_in_definition(
         validate_definition(
             definition=definition_spec["items"],
             deref=deref,
-            def_name=f"{def_name}/items",
+            def_name=_child_path(def_name, "items"),
             visited_definitions=visited_definitions,
         )
 
 
-def validate_definition(
+def check_definition(
     definition: dict[str, Any],
     deref: Callable,
-    def_name: str | None = None,
-    visited_definitions: set[str] | None = None,
+    def_name: str | ErrorPath | None = None,
 ) -> None:
-    """
-    :param visited_definitions: set of already visited definitions
-                                    This is used to cut recursion in case of recursive definitions
-    :type visited_definitions: set
-    """
-    if visited_definitions is not None:
-        # Remove x-scope or else no two definitions will be the same
-        stripped_definition = json.dumps(
-            {key: definition[key] for key in definition if key != "x-scope"},
-            sort_keys=True,
-        )
-        if stripped_definition in visited_definitions:
-            return
-        visited_definitions.add(stripped_definition)
+    """Validates the semantic errors of a single dereferenced definition,
+    without the definitions nested in it.
 
-    definition = deref(definition)
+    :param definition: the definition
+    :param deref: callable that dereferences $refs
+    :param def_name: location of the definition, used in the error messages
 
+    :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
+    """
     swagger_type = definition.get("type")
     if isinstance(swagger_type, list):
         # not valid Swagger; see https://github.com/OAI/OpenAPI-Specification/issues/458
@@ -551,15 +790,7 @@ def validate_definition(
             )
         )
 
-    if "allOf" in definition:
-        for idx, inner_definition in enumerate(definition["allOf"]):
-            validate_definition(
-                definition=inner_definition,
-                deref=deref,
-                def_name=f"{def_name}/{str(idx)}",
-                visited_definitions=visited_definitions,
-            )
-    else:
+    if "allOf" not in definition:
         required = definition.get("required", [])
         props = definition.get("properties", {}).keys()
         extra_props = list(set(required) - set(props))
@@ -572,28 +803,11 @@ def validate_definition(
             )
 
         validate_defaults_in_definition(definition, deref)
-        validate_arrays_in_definition(
-            definition_spec=definition,
-            deref=deref,
-            def_name=def_name,
-            visited_definitions=visited_definitions,
-        )
-
-        for property_name, property_spec in definition.get("properties", {}).items():
-            validate_definition(
-                definition=property_spec,
-                deref=deref,
-                def_name=f"{def_name}/properties/{property_name}",
-                visited_definitions=visited_definitions,
-            )
-
-    if "additionalProperties" in definition:
-        if definition.get("additionalProperties") not in (True, False):
-            validate_definition(
-                definition=cast("dict[str, Any]", definition["additionalProperties"]),
-                deref=deref,
-                def_name=f"{def_name}/additionalProperties",
-                visited_definitions=visited_definitions,
+        if swagger_type == "array" and "items" not in definition:
+            raise SwaggerValidationError(
+                "Definition of type array must define `items` property{}.".format(
+                    "" if not def_name else f" (definition {def_name})",
+                ),
             )
 
     if "discriminator" in definition:
@@ -624,31 +838,105 @@ def validate_definition(
             )
 
 
-def validate_definitions(definitions: dict[str, Any], deref: Callable) -> None:
+def validate_definition(
+    definition: dict[str, Any],
+    deref: Callable,
+    def_name: str | ErrorPath | None = None,
+    visited_definitions: set[int] | None = None,
+) -> None:
+    """
+    :param visited_definitions: ids of the already visited (dereferenced)
+                                    definitions. This is used to cut recursion in case
+                                    of recursive definitions
+    :type visited_definitions: set
+    """
+    if visited_definitions is None:
+        # Recursive definitions would be walked forever otherwise
+        visited_definitions = set()
+
+    # Depth first walk with an explicit stack, like SpecWalker. The
+    # root keeps def_name as is for the messages of its own errors.
+    stack: list[tuple[Any, str | ErrorPath | None]] = [(definition, def_name)]
+    while stack:
+        definition, def_path = stack.pop()
+        definition = deref(definition)
+
+        # All the $refs to a definition resolve to the same object, so
+        # definitions are tracked by identity
+        if id(definition) in visited_definitions:
+            continue
+        visited_definitions.add(id(definition))
+
+        check_definition(definition, deref, def_path)
+
+        children: list[tuple[Any, str | ErrorPath | None]] = []
+        if "allOf" in definition:
+            children.extend(
+                (inner_definition, _child_path(def_path, str(idx)))
+                for idx, inner_definition in enumerate(definition["allOf"])
+            )
+        else:
+            if definition.get("type") == "array":
+                children.append((definition["items"], _child_path(def_path, "items")))
+            if definition.get("properties"):
+                properties_path = _child_path(def_path, "properties")
+                children.extend(
+                    (property_spec, ErrorPath(property_name, properties_path))
+                    for property_name, property_spec in definition["properties"].items()
+                )
+
+        if "additionalProperties" in definition:
+            if definition.get("additionalProperties") not in (True, False):
+                children.append(
+                    (
+                        definition["additionalProperties"],
+                        _child_path(def_path, "additionalProperties"),
+                    )
+                )
+
+        # Pushed in reverse to be validated in document order
+        stack.extend(reversed(children))
+
+
+def validate_definitions(
+    definitions: dict[str, Any],
+    deref: Callable,
+    visited_definitions: set[int] | None = None,
+) -> None:
     """Validates the semantic errors in #/definitions.
 
     :param definitions: dict of all the definitions
     :param deref: callable that dereferences $refs
+    :param visited_definitions: ids of the definitions already validated,
+        see :func:`validate_definition`.
 
     :raises: :py:class:`swagger_spec_validator.SwaggerValidationError`
     :raises: :py:class:`jsonschema.exceptions.ValidationError`
     """
-    visited_definitions: set[str] = set()
+    if visited_definitions is None:
+        visited_definitions = set()
+    definitions_path = ErrorPath("definitions", "#")
     for def_name, definition in definitions.items():
         validate_definition(
             definition=definition,
             deref=deref,
-            def_name=f"#/definitions/{def_name}",
+            def_name=ErrorPath(def_name, definitions_path),
             visited_definitions=visited_definitions,
         )
 
 
-def validate_parameters(parameters: dict[str, Any], deref: Callable) -> None:
+def validate_parameters(
+    parameters: dict[str, Any],
+    deref: Callable,
+    visited_definitions: set[int] | None = None,
+) -> None:
+    parameters_path = ErrorPath("parameters", "#")
     for param_name, param_spec in parameters.items():
         validate_parameter(
             param=param_spec,
             deref=deref,
-            def_name=f"#/parameters/{param_name}",
+            def_name=ErrorPath(param_name, parameters_path),
+            visited_definitions=visited_definitions,
         )
 
 
@@ -660,7 +948,7 @@ def get_path_param_names(params: list[Any], deref: Callable) -> list[str]:
 
     :returns: list of the name of the path params
     """
-    return [deref(param)["name"] for param in params if deref(param)["in"] == "path"]
+    return [param["name"] for param in map(deref, params) if param["in"] == "path"]
 
 
 def validate_duplicate_param(params: list[Any], deref: Callable) -> None:
@@ -713,3 +1001,73 @@ def validate_unresolvable_path_params(path_name: str, path_params: list[str]) ->
 
 def is_ref(spec_dict: dict[Any, Any] | list[Any]) -> bool:
     return isinstance(spec_dict, dict) and isinstance(spec_dict.get("$ref"), str)
+
+
+def path_item_rule(node: Node, spec_walker: SpecWalker) -> None:
+    params = [
+        spec_walker.deref(param)
+        for param in spec_walker.deref(node.value.get("parameters", []))
+    ]
+    validate_duplicate_param(params, spec_walker.deref)
+    # Shared by all the operations of the path item, see operation_rule
+    spec_walker.state.setdefault("path_param_names", {})[id(node.value)] = set(
+        get_path_param_names(params, spec_walker.deref)
+    )
+
+
+def operation_rule(node: Node, spec_walker: SpecWalker) -> None:
+    path_item = cast(Node, node.parent)
+    api_name = path_item.def_path.key
+    oper_name = node.def_path.key
+    oper_body = node.value
+
+    # Check that, if this operation has an operationId defined,
+    # no other operation also has that operationId.
+    operation_id = oper_body.get("operationId")
+    if operation_id is not None:
+        operation_id_set = spec_walker.state.setdefault("operation_ids", set())
+        if operation_id in operation_id_set:
+            raise SwaggerValidationError(f"Duplicate operationId: {operation_id}")
+        operation_id_set.add(operation_id)
+
+    oper_params = [
+        spec_walker.deref(param)
+        for param in spec_walker.deref(oper_body.get("parameters", []))
+    ]
+    validate_duplicate_param(oper_params, spec_walker.deref)
+    api_path_param_names = spec_walker.state["path_param_names"][id(path_item.value)]
+    all_path_params = list(
+        api_path_param_names.union(get_path_param_names(oper_params, spec_walker.deref))
+    )
+    validate_unresolvable_path_params(api_name, all_path_params)
+    check_responses(api_name, oper_name, oper_body["responses"])
+
+
+def parameter_rule(node: Node, spec_walker: SpecWalker) -> None:
+    param = node.value
+    validate_default_in_parameter(param, spec_walker.deref)
+    # Parameters given by a $ref are checked where they are defined
+    if is_ref(param):
+        return
+    if param["in"] == "body":
+        check_body_parameter(param, node.def_path)
+    else:
+        validate_non_body_parameter(param, spec_walker.deref, node.def_path)
+
+
+def schema_rule(node: Node, spec_walker: SpecWalker) -> None:
+    check_definition(node.value, spec_walker.deref, node.def_path)
+
+
+def ref_rule(node: Node, spec_walker: SpecWalker) -> None:
+    validate_ref(node.value, node.path)
+
+
+# Semantic checks run by validate_spec, keyed by the kind of node they check
+RULES: dict[str, list[Rule]] = {
+    PATH_ITEM: [path_item_rule],
+    OPERATION: [operation_rule],
+    PARAMETER: [parameter_rule],
+    SCHEMA: [schema_rule],
+    REF: [ref_rule],
+}
@@ -0,0 +1,308 @@
+"""
+Single pass traversal of a Swagger 2.0 spec for the semantic checks.
+
+The walker visits every node of the spec once, dereferencing the $refs the
+checks need to follow, and calls the rules registered for the kind of each
+node (path item, operation, parameter, response, schema or $ref). The checks
+of :mod:`swagger_spec_validator.validator20` and any additional rules share
+the same walk, see :func:`swagger_spec_validator.validator20.validate_spec`.
+"""
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Mapping
+from typing import NamedTuple
+from urllib.parse import unquote
+from urllib.parse import urldefrag
+from urllib.parse import urljoin
+
+from swagger_spec_validator.common import ErrorPath
+from swagger_spec_validator.ref_validators import get_scope
+
+
+# Kinds of the nodes rules can be registered for
+PATH_ITEM = "path_item"
+OPERATION = "operation"
+PARAMETER = "parameter"
+RESPONSE = "response"
+SCHEMA = "schema"
+REF = "ref"
+
+# Kinds of the containers holding the nodes above
+_SPEC = "_spec"
+_PATHS = "_paths"
+_PARAMETER_LIST = "_parameter_list"
+_PARAMETERS = "_parameters"
+_RESPONSES = "_responses"
+_DEFINITIONS = "_definitions"
+_SCHEMA_LIST = "_schema_list"
+_SCHEMA_MAP = "_schema_map"
+
+# Sections of the spec, walked first and in this order, which is the order
+# the checks have always been run in
+_SPEC_SECTIONS = {
+    "paths": _PATHS,
+    "definitions": _DEFINITIONS,
+    "parameters": _PARAMETERS,
+}
+# Keys walked before the other children of the nodes of some kinds
+_FIRST_KEYS = {
+    _SPEC: {key: idx for idx, key in enumerate(_SPEC_SECTIONS)},
+    # Path level parameters are checked before the operations, and the
+    # parameters of an operation before its responses
+    PATH_ITEM: {"parameters": 0},
+    OPERATION: {"parameters": 0},
+}
+
+# Path items and operations are checked in the context of their path, so they
+# are visited every time they are reached
+_CONTEXTUAL_KINDS = frozenset((PATH_ITEM, OPERATION))
+# Parameters and responses given by a $ref are visited as the $ref dict where
+# they are used, their targets are only checked where they are defined
+_UNFOLLOWED_KINDS = frozenset((PARAMETER, RESPONSE))
+
+
+class Node(NamedTuple):
+    """Node of the spec passed to the rules."""
+
+    kind: str
+    # Dereferenced value of the node, or the $ref dict itself for REF nodes
+    # and for parameters and responses given by a $ref
+    value: Any
+    # Location of the node in its document, eg. #/paths//pets/get. Nodes of
+    # other documents are located from the $ref they were first reached by
+    path: ErrorPath
+    # Location used in the error messages of the checks: where the node was
+    # first reached from, and schemas in allOf and in responses are named
+    # after their parent
+    def_path: ErrorPath
+    # Closest ancestor node with a kind, None for the nodes of the top level
+    # sections
+    parent: Node | None
+
+    @property
+    def def_name(self) -> str:
+        return str(self.def_path)
+
+
+Rule = Callable[[Node, "SpecWalker"], None]
+
+
+def merge_rules(
+    *rule_sets: Mapping[str, Iterable[Rule]] | None
+) -> dict[str, list[Rule]]:
+    """Merge mappings from node kind to rules, keeping the rules in order.
+
+    :param rule_sets: mappings from node kind to rules, None is ignored.
+    """
+    merged: dict[str, list[Rule]] = {}
+    for rules in rule_sets:
+        for kind, kind_rules in (rules or {}).items():
+            merged.setdefault(kind, []).extend(kind_rules)
+    return merged
+
+
+def _child_kind(kind: str | None, value: Any, key: str) -> tuple[str | None, bool]:
+    """Kind of the child key of a node, and whether key is part of the
+    def_name of the child.
+    """
+    if kind is None:
+        return None, True
+    if kind == _SPEC:
+        return _SPEC_SECTIONS.get(key), True
+    if kind == _PATHS:
+        return (None if key.startswith("x-") else PATH_ITEM), True
+    if kind == PATH_ITEM or kind == OPERATION:
+        if key == "parameters":
+            return _PARAMETER_LIST, True
+        if kind == OPERATION:
+            return (_RESPONSES if key == "responses" else None), True
+        return (None if key.startswith("x-") else OPERATION), True
+    if kind == _PARAMETER_LIST or kind == _PARAMETERS:
+        return PARAMETER, True
+    if kind == PARAMETER:
+        is_body_schema = key == "schema" and value.get("in") == "body"
+        return (SCHEMA if is_body_schema else None), True
+    if kind == _RESPONSES:
+        return (None if key.startswith("x-") else RESPONSE), True
+    if kind == RESPONSE:
+        return (SCHEMA, False) if key == "schema" else (None, True)
+    if kind == _DEFINITIONS or kind == _SCHEMA_LIST or kind == _SCHEMA_MAP:
+        return SCHEMA, True
+    if kind == SCHEMA:
+        if key == "allOf":
+            return _SCHEMA_LIST, False
+        if key == "additionalProperties":
+            return SCHEMA, True
+        if "allOf" in value:
+            # Like jsonschema, properties next to allOf are ignored
+            return None, True
+        if key == "properties":
+            return _SCHEMA_MAP, True
+        if key == "items" and value.get("type") == "array":
+            return SCHEMA, True
+    return None, True
+
+
+class SpecWalker:
+    """Walks a spec calling rules on its nodes.
+
+    Every node is visited once, in document order except for the paths,
+    definitions and parameters sections which are walked first, and for the
+    parameters of path items and operations which are walked before their
+    other children. Schemas reached through several $refs are visited once,
+    at the first location they are reached from. Path items and operations
+    are visited once per location.
+
+    $refs to path items, operations and schemas are followed. Parameters and
+    responses given by a $ref are visited as the $ref dict itself, and only
+    checked where they are defined, eg. in #/parameters. Other $refs are
+    followed only if jsonschema already followed them during the validation
+    against the Swagger 2.0 schema, ie. if they have a scope.
+
+    :param deref: callable that dereferences $refs, bound to the resolver of
+        the spec.
+    :param rules: mapping from node kind to the rules to call on the nodes of
+        that kind. A rule takes the node and the walker, and raises
+        :class:`swagger_spec_validator.SwaggerValidationError` for invalid
+        nodes.
+    """
+
+    def __init__(self, deref: Callable, rules: Mapping[str, Iterable[Rule]]) -> None:
+        self.deref = deref
+        self.resolver = getattr(deref, "keywords", {}).get("resolver", None)
+        self.rules = {kind: list(kind_rules) for kind, kind_rules in rules.items()}
+        # Free for the rules to keep data across nodes, eg. operation ids
+        self.state: dict[str, Any] = {}
+        self._base_uri = "" if self.resolver is None else self.resolver.base_uri
+        # Location of the targets of the $refs to the spec itself, by fragment
+        self._target_paths: dict[str, ErrorPath] = {}
+
+    def _target_path(self, ref_dict: dict[str, Any], path: ErrorPath) -> ErrorPath:
+        """Location of the target of ref_dict, or path for targets in other
+        documents.
+        """
+        scope = get_scope(ref_dict, self.resolver)
+        url, fragment = urldefrag(
+            urljoin(scope[-1] if scope else self._base_uri, ref_dict["$ref"])
+        )
+        if url != self._base_uri:
+            return path
+
+        target_path = self._target_paths.get(fragment)
+        if target_path is None:
+            target_path = ErrorPath("#")
+            for part in unquote(fragment).split("/")[1:]:
+                key = part.replace("~1", "/").replace("~0", "~")
+                target_path = ErrorPath(key, target_path)
+            self._target_paths[fragment] = target_path
+        return target_path
+
+    def _apply_rules(self, node: Node) -> None:
+        for rule in self.rules.get(node.kind, ()):
+            rule(node, self)
+
+    def walk(self, spec_dict: Any) -> None:
+        """Walk spec_dict, calling the rules on its nodes.
+
+        :param spec_dict: the json dict of the swagger spec.
+
+        :raises: the exceptions raised by the rules.
+        """
+        self._walk(spec_dict, _SPEC, ErrorPath("#"), set())
+
+    def walk_references(
+        self, document: Any, path: ErrorPath, seen: set[int] | None = None
+    ) -> None:
+        """Walk any part of a spec, only calling the rules of the $refs.
+
+        :param document: json document in the form of a list or dict.
+        :param path: location of document.
+        :param seen: ids of the nodes already walked, updated with the nodes
+            of document.
+
+        :raises: the exceptions raised by the rules.
+        """
+        self._walk(document, None, path, set() if seen is None else seen)
+
+    def _walk(
+        self, root: Any, root_kind: str | None, root_path: ErrorPath, seen: set[int]
+    ) -> None:
+        # seen holds the ids of the nodes visited with any kind, and visited
+        # the (id, kind) of the nodes visited with a kind
+        visited: set[tuple[int, str]] = set()
+        stack: list[tuple[Any, str | None, ErrorPath, ErrorPath, Node | None]] = [
+            (root, root_kind, root_path, root_path, None)
+        ]
+        while stack:
+            value, kind, path, def_path, parent = stack.pop()
+            if not isinstance(value, (dict, list)):
+                # eg. the target of a $ref
+                continue
+
+            value_id = id(value)
+            if kind is None:
+                if value_id in seen:
+                    continue
+            elif kind not in _CONTEXTUAL_KINDS:
+                if (value_id, kind) in visited:
+                    continue
+                visited.add((value_id, kind))
+            first_visit = value_id not in seen
+            seen.add(value_id)
+
+            if isinstance(value, dict) and "$ref" in value:
+                if first_visit:
+                    self._apply_rules(Node(REF, value, path, def_path, parent))
+                if kind in _UNFOLLOWED_KINDS:
+                    self._apply_rules(Node(kind, value, path, def_path, parent))
+                    kind = None
+                if isinstance(value["$ref"], str) and (
+                    kind is not None or get_scope(value, self.resolver) is not None
+                ):
+                    target_path = self._target_path(value, path)
+                    stack.append(
+                        (
+                            self.deref(value),
+                            kind,
+                            target_path,
+                            def_path if kind is not None else target_path,
+                            parent,
+                        )
+                    )
+                    continue
+
+            if kind is not None and not kind.startswith("_"):
+                parent = Node(kind, value, path, def_path, parent)
+                self._apply_rules(parent)
+
+            # Only dicts and lists can hold $refs or nodes to check
+            if isinstance(value, dict):
+                children = [
+                    (str(key), child)
+                    for key, child in value.items()
+                    if isinstance(child, (dict, list))
+                ]
+                first_keys = _FIRST_KEYS.get(kind) if kind is not None else None
+                if first_keys is not None:
+                    children.sort(
+                        key=lambda item: first_keys.get(item[0], len(first_keys))
+                    )
+            else:
+                children = [
+                    (str(idx), child)
+                    for idx, child in enumerate(value)
+                    if isinstance(child, (dict, list))
+                ]
+
+            # Pushed in reverse to be popped in document order
+            for key, child in reversed(children):
+                child_kind, named = _child_kind(kind, value, key)
+                child_path = ErrorPath(key, path)
+                if child_kind is None:
+                    child_def_path = child_path
+                else:
+                    child_def_path = ErrorPath(key, def_path) if named else def_path
+                stack.append((child, child_kind, child_path, child_def_path, parent))
@@ -0,0 +1,51 @@
+import json
+import os
+
+from swagger_spec_validator import common
+from swagger_spec_validator._bundled_schemas import SCHEMAS
+from swagger_spec_validator.ref_validators import get_bundled_schemas_store
+from swagger_spec_validator.ref_validators import get_compiled_schema
+
+PACKAGE_DIR = os.path.dirname(common.__file__)
+
+
+def schema_files():
+    schemas_dir = os.path.join(PACKAGE_DIR, "schemas")
+    return {
+        f"schemas/{version}/{name}"
+        for version in os.listdir(schemas_dir)
+        for name in os.listdir(os.path.join(schemas_dir, version))
+    }
+
+
+def test_bundled_schemas_are_up_to_date():
+    # Run scripts/generate_bundled_schemas.py if this fails
+    assert set(SCHEMAS) == schema_files()
+    for resource_path, schema in SCHEMAS.items():
+        with open(os.path.join(PACKAGE_DIR, resource_path), encoding="utf-8") as f:
+            assert schema == json.load(f), resource_path
+
+
+def fail(url):
+    raise AssertionError(f"read {url}")
+
+
+def test_read_resource_file_uses_bundled_schemas(monkeypatch):
+    common.read_resource_file.cache_clear()
+    monkeypatch.setattr(common, "read_file", fail)
+    try:
+        schema, path = common.read_resource_file("schemas/v2.0/schema.json")
+    finally:
+        common.read_resource_file.cache_clear()
+
+    assert schema is SCHEMAS["schemas/v2.0/schema.json"]
+    assert path == os.path.join(PACKAGE_DIR, "schemas", "v2.0", "schema.json")
+
+
+def test_refs_between_bundled_schemas_are_not_read(monkeypatch):
+    resolver = get_compiled_schema("schemas/v1.2/apiDeclaration.json").resolver
+    monkeypatch.setitem(resolver.handlers, "file", fail)
+
+    with resolver.resolving("operationObject.json#") as operation_schema:
+        assert operation_schema is SCHEMAS["schemas/v1.2/operationObject.json"]
+    assert len(get_bundled_schemas_store()) == len(SCHEMAS)
@@ -1,10 +1,23 @@
+import json
 import uuid
 from unittest import mock
 
 import importlib_resources
+import pytest
+import yaml
 
+from swagger_spec_validator.common import DocumentCache
+from swagger_spec_validator.common import ErrorPath
+from swagger_spec_validator.common import get_default_json_loads
+from swagger_spec_validator.common import get_json_loads
+from swagger_spec_validator.common import get_uri_from_file_path
+from swagger_spec_validator.common import is_json_document
+from swagger_spec_validator.common import load_document
+from swagger_spec_validator.common import load_file
 from swagger_spec_validator.common import read_file
 from swagger_spec_validator.common import read_resource_file
+from swagger_spec_validator.common import read_url
+from swagger_spec_validator.common import set_json_loads
 
 
 def test_read_file():
@@ -21,3 +34,163 @@ def test_read_resource_file(monkeypatch):
     m.assert_called_once_with(
         importlib_resources.files("swagger_spec_validator") / resource_path
     )
+
+
+def test_document_cache_hits_and_misses(tmp_path):
+    cache = DocumentCache()
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("foo: 1\n")
+
+    assert cache.load(str(spec_path)) == {"foo": 1}
+    assert cache.load(str(spec_path)) == {"foo": 1}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_document_cache_reloads_changed_files(tmp_path):
+    cache = DocumentCache()
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("foo: 1\n")
+    cache.load(str(spec_path))
+
+    spec_path.write_text("foo: 22\n")
+
+    assert cache.load(str(spec_path)) == {"foo": 22}
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_document_cache_returns_copies(tmp_path):
+    cache = DocumentCache()
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("foo: 1\n")
+
+    cache.load(str(spec_path))["foo"] = 2
+
+    assert cache.load(str(spec_path)) == {"foo": 1}
+
+
+def test_document_cache_is_bounded(tmp_path):
+    # Room for a single document
+    cache = DocumentCache(max_size=30)
+    for name in ("a", "b", "a"):
+        spec_path = tmp_path / (name + ".yaml")
+        spec_path.write_text(name + ": 1\n")
+        cache.load(str(spec_path))
+
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_document_cache_skips_documents_larger_than_max_size(tmp_path):
+    cache = DocumentCache(max_size=30)
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("foo: " + "a" * 100 + "\n")
+
+    assert cache.load(str(spec_path)) == cache.load(str(spec_path))
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_document_cache_skips_json_documents(tmp_path):
+    cache = DocumentCache()
+    spec_path = tmp_path / "spec"
+    spec_path.write_text('{"foo": 1}')
+
+    assert cache.load(str(spec_path)) == cache.load(str(spec_path)) == {"foo": 1}
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_read_url_uses_document_cache(monkeypatch, tmp_path):
+    cache = DocumentCache()
+    monkeypatch.setattr("swagger_spec_validator.common.document_cache", cache)
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("foo: 1\n")
+    url = get_uri_from_file_path(str(spec_path))
+
+    assert read_url(url) == read_url(url)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "content, url, content_type, expected",
+    [
+        (b"foo: 1", "file:///spec.json", None, True),
+        (b"foo: 1", "http://host/spec", "application/json", True),
+        (b"foo: 1", "http://host/spec", "application/problem+json", True),
+        (b' \n {"foo": 1}', "http://host/spec.yaml", "text/plain", True),
+        (b"[1, 2]", "", None, True),
+        (b"foo: 1", "http://host/spec.yaml", "application/x-yaml", False),
+    ],
+)
+def test_is_json_document(content, url, content_type, expected):
+    assert is_json_document(content, url, content_type) is expected
+
+
+def test_load_document_uses_json_loads(monkeypatch):
+    mock_json_loads = mock.Mock(return_value={"foo": 1})
+    monkeypatch.setattr("swagger_spec_validator.common.json_loads", mock_json_loads)
+
+    assert load_document(b'{"foo": 1}') == {"foo": 1}
+    mock_json_loads.assert_called_once_with(b'{"foo": 1}')
+
+
+def test_load_document_falls_back_to_yaml():
+    # Flow style YAML mapping, not valid JSON
+    assert load_document(b"{foo: bar}", url="spec.json") == {"foo": "bar"}
+    assert load_document(b"foo: bar") == {"foo": "bar"}
+
+
+def test_set_json_loads():
+    try:
+        set_json_loads(json.loads)
+        assert get_json_loads() is json.loads
+    finally:
+        set_json_loads(None)
+    assert get_json_loads() is get_default_json_loads()
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b'{"foo": [1, 2]}', {"foo": [1, 2]}),
+        (b"foo:\n  - 1\n  - 2\n", {"foo": [1, 2]}),
+        (b"", None),
+    ],
+)
+def test_load_file(tmp_path, content, expected):
+    spec_path = tmp_path / "spec"
+    spec_path.write_bytes(content)
+
+    assert load_file(str(spec_path)) == expected
+
+
+@pytest.mark.parametrize(
+    "file_name, content",
+    [
+        ("spec.yaml", b"foo: [1\nbar: {"),
+        ("spec.json", b'{"foo": [1,'),
+    ],
+)
+def test_read_url_reports_parse_errors_of_malformed_files(tmp_path, file_name, content):
+    spec_path = tmp_path / file_name
+    spec_path.write_bytes(content)
+
+    # The parse error is not hidden by the memory-mapped file failing to close
+    with pytest.raises(yaml.YAMLError):
+        read_url(get_uri_from_file_path(str(spec_path)))
+
+
+def test_load_document_from_buffer(monkeypatch):
+    monkeypatch.setattr("swagger_spec_validator.common.json_loads", json.loads)
+
+    assert load_document(memoryview(b'{"foo": 1}')) == {"foo": 1}
+    assert load_document(bytearray(b"foo: 1")) == {"foo": 1}
+
+
+def test_error_path():
+    path = ErrorPath("get", ErrorPath("/pets", ErrorPath("paths", "#")))
+
+    assert path.parts() == ("#", "paths", "/pets", "get")
+    assert str(path) == "#/paths//pets/get"
+    assert repr(path) == "ErrorPath('#/paths//pets/get')"
+
+
+def test_error_path_from_rendered_parent():
+    assert str(ErrorPath("schema", "#/parameters/body")) == "#/parameters/body/schema"
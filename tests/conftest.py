@@ -1,4 +1,9 @@
+import gzip
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 
 import pytest
 
@@ -29,3 +34,96 @@ def change_dir():
         yield
     finally:
         os.chdir(current_directory)
+
+
+# Spec with transitive remote $refs, served by the server fixture
+DOCUMENTS = {
+    "/swagger.json": {
+        "swagger": "2.0",
+        "info": {"title": "Test", "version": "1.0"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "pets",
+                            "schema": {"$ref": "definitions.json#/Pet"},
+                        },
+                    },
+                },
+            },
+        },
+    },
+    "/definitions.json": {
+        "Pet": {
+            "type": "object",
+            "properties": {"owner": {"$ref": "people.json#/Person"}},
+        },
+    },
+    "/people.json": {
+        "Person": {"type": "object", "properties": {"name": {"type": "string"}}},
+    },
+}
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serves DOCUMENTS over persistent connections, compressed if asked to"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path == "/redirect.json":
+            self.send_response(302)
+            self.send_header("Location", "/people.json")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path not in DOCUMENTS and self.path != "/close.json":
+            self.send_error(404)
+            return
+
+        if self.path == "/close.json":
+            # Close the connection without telling the client
+            self.close_connection = True
+            self.path = "/people.json"
+
+        body = json.dumps(DOCUMENTS[self.path]).encode()
+        accept_encoding = self.headers.get("Accept-Encoding", "")
+        self.send_response(200)
+        if "gzip" in accept_encoding:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = []
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
@@ -0,0 +1,150 @@
+import gzip
+import json
+import os
+import threading
+import zlib
+from unittest import mock
+from urllib.error import HTTPError
+
+import pytest
+
+from swagger_spec_validator import http_pool
+from swagger_spec_validator.http_pool import decode_body
+from swagger_spec_validator.http_pool import HTTPConnectionPool
+from swagger_spec_validator.util import validate_spec_url
+from tests.conftest import DOCUMENTS
+
+
+@pytest.fixture
+def pool():
+    pool = HTTPConnectionPool()
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+def test_connections_are_reused(server, base_url, pool):
+    for path in ("/swagger.json", "/definitions.json", "/people.json"):
+        assert pool.read_url(base_url + path) == DOCUMENTS[path]
+
+    assert server.connections == 1
+    assert len(server.requests) == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_processes_do_not_share_connections(server, base_url):
+    http_pool.read_url(base_url + "/people.json")
+    parent_pool = http_pool.get_default_pool()
+    assert any(parent_pool._idle.values())
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        child_pool = http_pool.get_default_pool()
+        is_reset = child_pool is not parent_pool and not any(child_pool._idle.values())
+        os.write(write_fd, b"1" if is_reset else b"0")
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"1"
+    os.close(read_fd)
+    os.close(write_fd)
+    assert any(parent_pool._idle.values())
+    parent_pool.close()
+
+
+def test_no_idle_connections_kept_with_empty_pool(server, base_url):
+    pool = HTTPConnectionPool(pool_size=0)
+
+    pool.read_url(base_url + "/people.json")
+    pool.read_url(base_url + "/people.json")
+
+    assert server.connections == 2
+
+
+def test_stale_connection_is_replaced(server, base_url, pool):
+    pool.read_url(base_url + "/close.json")
+
+    assert pool.read_url(base_url + "/people.json") == DOCUMENTS["/people.json"]
+    assert server.connections == 2
+
+
+def test_gzip_response_is_decoded(server, base_url, pool):
+    response = pool.request(base_url + "/people.json")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(response.body) == DOCUMENTS["/people.json"]
+
+
+def test_redirect_is_followed(server, base_url, pool):
+    response = pool.request(base_url + "/redirect.json")
+
+    assert response.url == base_url + "/people.json"
+    assert json.loads(response.body) == DOCUMENTS["/people.json"]
+    assert server.connections == 1
+
+
+def test_error_status_raises_http_error(server, base_url, pool):
+    with pytest.raises(HTTPError) as excinfo:
+        pool.read_url(base_url + "/missing.json")
+    assert excinfo.value.code == 404
+
+
+def test_concurrent_requests_are_limited_per_host(server, base_url):
+    pool = HTTPConnectionPool(max_per_host=2)
+    threads = [
+        threading.Thread(target=pool.read_url, args=(base_url + "/people.json",))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(server.requests) == 8
+    assert server.connections <= 2
+    pool.close()
+
+
+@pytest.mark.parametrize(
+    "body, content_encoding",
+    [
+        (b"foo", None),
+        (b"foo", "identity"),
+        (gzip.compress(b"foo"), "gzip"),
+        (zlib.compress(b"foo"), "deflate"),
+        (zlib.compress(b"foo")[2:-4], "deflate"),
+    ],
+)
+def test_decode_body(body, content_encoding):
+    assert decode_body(body, content_encoding) == b"foo"
+
+
+def test_decode_body_unsupported_encoding():
+    with pytest.raises(ValueError):
+        decode_body(b"foo", "br")
+
+
+def test_validate_spec_url_reuses_connections(server, base_url):
+    with mock.patch.object(http_pool, "_default_pool", HTTPConnectionPool()):
+        validate_spec_url(base_url + "/swagger.json")
+
+    assert sorted(server.requests) == [
+        "/definitions.json",
+        "/people.json",
+        "/swagger.json",
+    ]
+    assert server.connections == 1
+
+
+def test_validate_spec_url_with_custom_handlers(server, base_url, pool):
+    handler = mock.Mock(side_effect=pool.read_url)
+
+    validate_spec_url(base_url + "/swagger.json", http_handlers={"http": handler})
+
+    assert [call[0][0] for call in handler.call_args_list] == [
+        base_url + "/swagger.json",
+        base_url + "/definitions.json",
+        base_url + "/people.json",
+    ]
@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import pytest
+
+import swagger_spec_validator
+
+
+HEAVY_MODULES = (
+    "importlib_resources",
+    "jsonschema",
+    "orjson",
+    "swagger_spec_validator.util",
+    "urllib.request",
+    "yaml",
+)
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def test_heavy_modules_are_not_imported():
+    result = run_python(
+        "import sys, swagger_spec_validator\n" "print('\\n'.join(sorted(sys.modules)))"
+    )
+
+    imported_modules = set(result.stdout.split())
+    assert "swagger_spec_validator.common" in imported_modules
+    assert imported_modules.isdisjoint(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("name", ["validate_spec_bytes", "validate_spec_url"])
+def test_lazy_attributes(name):
+    from swagger_spec_validator import util
+
+    assert getattr(swagger_spec_validator, name) is getattr(util, name)
+    assert name in dir(swagger_spec_validator)
+
+
+@pytest.mark.parametrize(
+    "name", ["common", "ref_validators", "util", "validator12", "validator20"]
+)
+def test_submodules_are_attributes_after_a_plain_import(name):
+    result = run_python(
+        "import swagger_spec_validator\n"
+        f"print(swagger_spec_validator.{name}.__name__)"
+    )
+
+    assert result.stdout.strip() == f"swagger_spec_validator.{name}"
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        swagger_spec_validator.foo
@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from swagger_spec_validator.common import get_uri_from_file_path
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.parallel import validate_spec_urls
+
+
+def test_validate_spec_urls(tmp_path):
+    invalid_spec = tmp_path / "invalid.json"
+    invalid_spec.write_text('{"swagger": "2.0"}')
+    specs = [
+        "./tests/data/v2.0/petstore.json",
+        str(invalid_spec),
+        get_uri_from_file_path("./tests/data/v1.2/foo/swagger_api.json"),
+        "./tests/data/v2.0/minimal.yaml",
+    ]
+
+    results = validate_spec_urls(specs, max_workers=2)
+
+    assert [result.spec_url for result in results] == [
+        get_uri_from_file_path(spec) if "://" not in spec else spec for spec in specs
+    ]
+    assert [result.is_valid for result in results] == [True, False, True, True]
+    assert isinstance(results[1].error, SwaggerValidationError)
+    assert "'info' is a required property" in str(results[1].error)
+    assert all(result.wall_time > 0 for result in results)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3])
+def test_validate_spec_urls_chunksize(chunksize):
+    spec = os.path.abspath("./tests/data/v2.0/petstore.json")
+
+    results = validate_spec_urls([spec] * 5, max_workers=2, chunksize=chunksize)
+
+    assert len(results) == 5
+    assert all(result.is_valid for result in results)
@@ -0,0 +1,374 @@
+import json
+import threading
+from unittest import mock
+
+import pytest
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import Draft4Validator
+from jsonschema.validators import RefResolver
+
+from swagger_spec_validator.common import get_uri_from_file_path
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.ref_validators import attach_scope
+from swagger_spec_validator.ref_validators import create_dereffing_validator
+from swagger_spec_validator.ref_validators import get_compiled_schema
+from swagger_spec_validator.ref_validators import has_refs
+from swagger_spec_validator.ref_validators import in_scope
+from swagger_spec_validator.ref_validators import IndexedRefResolver
+from swagger_spec_validator.ref_validators import iter_external_refs
+from swagger_spec_validator.ref_validators import prefetch_remote_refs
+from swagger_spec_validator.ref_validators import validate_schema_value
+from swagger_spec_validator.validator12 import validate_json as validate_json12
+from swagger_spec_validator.validator20 import validate_json as validate_json20
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_schemas():
+    get_compiled_schema.cache_clear()
+    yield
+    get_compiled_schema.cache_clear()
+
+
+def test_get_compiled_schema_is_cached():
+    compiled_schema = get_compiled_schema("schemas/v2.0/schema.json")
+    assert get_compiled_schema("schemas/v2.0/schema.json") is compiled_schema
+    assert compiled_schema.schema["title"] == "A JSON Schema for Swagger 2.0 API."
+
+
+def test_get_compiled_schema_cache_clear():
+    compiled_schema = get_compiled_schema("schemas/v2.0/schema.json")
+    get_compiled_schema.cache_clear()
+    assert get_compiled_schema("schemas/v2.0/schema.json") is not compiled_schema
+
+
+def test_compiled_schema_resolver_is_per_thread():
+    compiled_schema = get_compiled_schema("schemas/v2.0/schema.json")
+    resolvers = []
+    thread = threading.Thread(target=lambda: resolvers.append(compiled_schema.resolver))
+    thread.start()
+    thread.join()
+
+    assert compiled_schema.resolver is compiled_schema.resolver
+    assert resolvers[0] is not compiled_schema.resolver
+
+
+def test_validate_json_checks_schema_once():
+    with open("./tests/data/v2.0/petstore.json") as f:
+        petstore_dict = json.load(f)
+
+    with mock.patch(
+        "swagger_spec_validator.ref_validators.Draft4Validator.check_schema",
+    ) as m:
+        validate_json20(petstore_dict, "schemas/v2.0/schema.json")
+        validate_json20(petstore_dict, "schemas/v2.0/schema.json")
+        validate_json12(
+            {"swaggerVersion": "1.2", "apis": []}, "schemas/v1.2/resourceListing.json"
+        )
+        validate_json12(
+            {"swaggerVersion": "1.2", "apis": []}, "schemas/v1.2/resourceListing.json"
+        )
+
+    assert m.call_count == 2
+
+
+def test_iter_external_refs():
+    document = {
+        "a": {"$ref": "#/definitions/local"},
+        "b": [{"$ref": "other.json#/x"}, {"$ref": "other.json#/y"}],
+        "c": {"d": {"$ref": "http://example.com/remote.yaml"}},
+        "e": {"$ref": "file:///base/spec.json#/definitions/local"},
+    }
+
+    assert sorted(iter_external_refs(document, "file:///base/spec.json")) == [
+        "file:///base/other.json",
+        "file:///base/other.json",
+        "http://example.com/remote.yaml",
+    ]
+
+
+def test_iter_external_refs_skips_payloads():
+    document = {
+        "x-vendor": {"$ref": "vendor.json"},
+        "definitions": {
+            "Pet": {
+                "example": {"$ref": "example.json"},
+                "default": {"$ref": "default.json"},
+                "enum": [{"$ref": "enum.json"}],
+                "x-extra": {"$ref": "extra.json"},
+                "properties": {
+                    "example": {"$ref": "property.json"},
+                    "x-name": {"$ref": "x-property.json"},
+                },
+            },
+        },
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "default": {"schema": {"$ref": "response.json"}},
+                        "200": {"examples": {"a": {"$ref": "examples.json"}}},
+                    },
+                },
+            },
+        },
+    }
+
+    assert sorted(iter_external_refs(document, "file:///base/spec.json")) == [
+        "file:///base/property.json",
+        "file:///base/response.json",
+        "file:///base/x-property.json",
+    ]
+
+
+def test_iter_external_refs_follows_names_at_the_top_of_documents():
+    document = {"default": {"$ref": "default.json"}, "x-a": {"$ref": "a.json"}}
+
+    assert list(iter_external_refs(document, "file:///base/models.json")) == [
+        "file:///base/default.json",
+    ]
+
+
+def test_prefetch_remote_refs_is_transitive():
+    documents = {
+        "http://example.com/a.json": {"a": {"$ref": "b.json#/b"}},
+        "http://example.com/b.json": {"b": {"$ref": "#/c"}, "c": {}},
+    }
+    handler = mock.Mock(side_effect=documents.__getitem__)
+
+    store = prefetch_remote_refs(
+        {"$ref": "a.json"}, "http://example.com/spec.json", {"http": handler}
+    )
+
+    assert store == documents
+    assert handler.call_count == 2
+
+
+def test_prefetch_remote_refs_skips_known_and_failing_documents():
+    handler = mock.Mock(side_effect=ValueError)
+    known = {"http://example.com/known.json": {}}
+
+    store = prefetch_remote_refs(
+        [{"$ref": "known.json"}, {"$ref": "missing.json"}, {"$ref": "ftp://x/y"}],
+        "http://example.com/spec.json",
+        {"http": handler},
+        store=known,
+    )
+
+    assert store == known
+    handler.assert_called_once_with("http://example.com/missing.json")
+
+
+def test_indexed_ref_resolver_resolves_each_ref_once():
+    document = {"definitions": {"Error": {"type": "object"}}}
+    resolver = IndexedRefResolver("file:///spec.json", document)
+
+    with mock.patch.object(
+        RefResolver, "resolve", autospec=True, side_effect=RefResolver.resolve
+    ) as mock_resolve:
+        for _ in range(3):
+            with resolver.resolving("#/definitions/Error") as target:
+                assert target is document["definitions"]["Error"]
+                assert resolver.resolution_scope == (
+                    "file:///spec.json#/definitions/Error"
+                )
+            assert resolver.resolution_scope == "file:///spec.json"
+
+    assert mock_resolve.call_count == 1
+
+
+def test_indexed_ref_resolver_index_is_per_scope():
+    store = {
+        "file:///a/common.json": {"Error": {"title": "a"}},
+        "file:///b/common.json": {"Error": {"title": "b"}},
+    }
+    resolver = IndexedRefResolver("file:///spec.json", {}, store=store)
+
+    targets = []
+    for scope in ("file:///a/spec.json", "file:///b/spec.json"):
+        resolver.push_scope(scope)
+        with resolver.resolving("common.json#/Error") as target:
+            targets.append(target["title"])
+        resolver.pop_scope()
+
+    assert targets == ["a", "b"]
+
+
+def test_indexed_ref_resolver_resolve_ref_dict():
+    store = {"file:///a/common.json": {"Error": {"title": "a"}}}
+    resolver = IndexedRefResolver("file:///spec.json", {}, store=store)
+    ref_dict = {"$ref": "common.json#/Error", "x-scope": ["file:///a/spec.json"]}
+
+    assert resolver.resolve_ref_dict(ref_dict) == {"title": "a"}
+    assert (
+        resolver.resolve_ref_dict(ref_dict) is store["file:///a/common.json"]["Error"]
+    )
+    assert resolver._scopes_stack == ["file:///spec.json"]
+
+
+def test_attach_scope_interns_scopes():
+    resolver = RefResolver("file:///spec.json", {})
+    interned_scopes = {}
+    ref_dicts = [{"$ref": "#/definitions/Error"} for _ in range(3)]
+
+    for ref_dict in ref_dicts:
+        attach_scope(ref_dict, resolver, interned_scopes)
+
+    assert ref_dicts[0]["x-scope"] == ("file:///spec.json",)
+    assert all(ref_dict["x-scope"] is ref_dicts[0]["x-scope"] for ref_dict in ref_dicts)
+
+
+def test_in_scope_with_interned_scope():
+    resolver = RefResolver("file:///spec.json", {})
+    ref_dict = {"$ref": "common.json#/Error", "x-scope": ("file:///a/spec.json",)}
+
+    with in_scope(resolver, ref_dict):
+        assert resolver.resolution_scope == "file:///a/spec.json"
+        # The resolver can still push scopes, the tuple is left untouched
+        resolver.push_scope("common.json")
+        resolver.pop_scope()
+
+    assert resolver.resolution_scope == "file:///spec.json"
+    assert ref_dict["x-scope"] == ("file:///a/spec.json",)
+
+
+def test_validation_shares_scopes_between_refs():
+    spec_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    with open(spec_path) as f:
+        spec_dict = json.load(f)
+
+    validate_json20(
+        spec_dict, "schemas/v2.0/schema.json", get_uri_from_file_path(spec_path)
+    )
+
+    scopes = [
+        value["x-scope"]
+        for path_item in spec_dict["paths"].values()
+        for value in iter_ref_dicts(path_item)
+    ]
+    assert scopes
+    assert len({id(scope) for scope in scopes}) == len(set(scopes))
+
+
+def iter_ref_dicts(document):
+    if isinstance(document, dict):
+        if "x-scope" in document:
+            yield document
+        for value in document.values():
+            yield from iter_ref_dicts(value)
+    elif isinstance(document, list):
+        for value in document:
+            yield from iter_ref_dicts(value)
+
+
+def make_fan_in_spec(num_paths):
+    return {
+        "swagger": "2.0",
+        "info": {"title": "Test", "version": "1.0"},
+        "paths": {
+            f"/pets{i}": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "pets",
+                            "schema": {"$ref": "#/definitions/Pet"},
+                        },
+                    },
+                },
+            }
+            for i in range(num_paths)
+        },
+        "definitions": {
+            "Pet": {"type": "object", "properties": {"name": {"type": "string"}}},
+        },
+    }
+
+
+def count_pet_validations(num_paths):
+    spec_dict = make_fan_in_spec(num_paths)
+    pet = spec_dict["definitions"]["Pet"]
+    properties = Draft4Validator.VALIDATORS["properties"]
+    validated_instances = []
+
+    def spy_properties(validator, properties_schema, instance, schema):
+        validated_instances.append(instance)
+        return properties(validator, properties_schema, instance, schema)
+
+    with mock.patch.dict(Draft4Validator.VALIDATORS, properties=spy_properties):
+        validate_json20(spec_dict, "schemas/v2.0/schema.json")
+
+    return len([instance for instance in validated_instances if instance is pet])
+
+
+def test_repeated_ref_targets_are_validated_once():
+    # Pet is validated once per schema node it is checked against, however
+    # many responses refer to it
+    assert count_pet_validations(10) == count_pet_validations(1)
+
+
+def test_repeated_invalid_ref_targets_are_reported():
+    spec_dict = make_fan_in_spec(3)
+    spec_dict["definitions"]["Pet"]["required"] = "name"
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_json20(spec_dict, "schemas/v2.0/schema.json")
+    assert "'name' is not of type 'array'" in str(excinfo.value)
+
+
+def test_dereffing_validator_is_created_once_per_resolver():
+    resolver = IndexedRefResolver("", {})
+
+    with mock.patch(
+        "swagger_spec_validator.ref_validators.create_dereffing_validator",
+        wraps=create_dereffing_validator,
+    ) as mock_create:
+        validate_schema_value({"type": "integer"}, 1, resolver)
+        validate_schema_value({"type": "string"}, "a", resolver)
+
+    assert mock_create.call_count == 1
+
+
+def test_validate_schema_value_skips_validated_values():
+    resolver = IndexedRefResolver("", {})
+    schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+    value = {"a": 1}
+
+    validate_schema_value(schema, value, resolver)
+    with mock.patch.object(
+        IndexedRefResolver, "dereffing_validator", new_callable=mock.PropertyMock
+    ) as mock_validator:
+        validate_schema_value(schema, value, resolver)
+        validate_schema_value(schema, {"a": 1}, resolver)
+
+    # Only the pair that was not validated yet is validated again
+    assert mock_validator.call_count == 1
+
+
+def test_validate_schema_value_failure_is_not_remembered():
+    resolver = IndexedRefResolver("", {})
+    schema = {"type": "integer"}
+    value = "a"
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate_schema_value(schema, value, resolver)
+
+
+@pytest.mark.parametrize(
+    "document, expected",
+    [
+        ({"a": [{"b": 1}], "c": "$ref"}, False),
+        ({"a": [{"b": {"$ref": "#/c"}}]}, True),
+        ([{"$ref": None}], True),
+        ("$ref", False),
+    ],
+)
+def test_has_refs(document, expected):
+    assert has_refs(document) is expected
+
+
+def test_resolver_without_refs_validates_with_draft4_validator():
+    resolver = IndexedRefResolver("", {}, has_refs=False)
+
+    assert resolver.dereffing_validator is Draft4Validator
+    with pytest.raises(ValidationError):
+        validate_schema_value({"type": "integer"}, "a", resolver)
@@ -0,0 +1,151 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from swagger_spec_validator import remote_cache
+from swagger_spec_validator.ref_validators import default_handlers
+from swagger_spec_validator.remote_cache import RemoteDocumentCache
+
+
+class DocumentHandler(BaseHTTPRequestHandler):
+    """Serves {"path": <request path>} with ETag and Last-Modified headers"""
+
+    etag = '"v1"'
+    last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", self.last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DocumentHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_fresh_entry_is_not_revalidated(tmp_path, server, base_url):
+    cache = RemoteDocumentCache(str(tmp_path))
+
+    assert cache.read_url(base_url + "/a.json") == {"path": "/a.json"}
+    assert cache.read_url(base_url + "/a.json") == {"path": "/a.json"}
+    # A new cache instance on the same directory, as in a new process
+    assert RemoteDocumentCache(str(tmp_path)).read_url(base_url + "/a.json") == {
+        "path": "/a.json"
+    }
+
+    assert len(server.requests) == 1
+
+
+def test_stale_entry_is_revalidated(tmp_path, server, base_url):
+    cache = RemoteDocumentCache(str(tmp_path), ttl=0)
+
+    cache.read_url(base_url + "/a.json")
+    assert cache.read_url(base_url + "/a.json") == {"path": "/a.json"}
+
+    assert len(server.requests) == 2
+    conditional_headers = server.requests[1][1]
+    assert conditional_headers["If-None-Match"] == DocumentHandler.etag
+    assert conditional_headers["If-Modified-Since"] == DocumentHandler.last_modified
+
+
+def test_lru_eviction(tmp_path, base_url):
+    cache = RemoteDocumentCache(str(tmp_path))
+    cache.read_url(base_url + "/a.json")
+    entry_size = sum(entry.stat().st_size for entry in os.scandir(str(tmp_path)))
+
+    cache.max_size = 2 * entry_size
+    cache.read_url(base_url + "/b.json")
+    # a.json was used first, then b.json, long ago
+    os.utime(cache._entry_path(base_url + "/a.json"), (1000, 1000))
+    os.utime(cache._entry_path(base_url + "/b.json"), (2000, 2000))
+    # Reading a.json again makes it more recently used than b.json
+    cache.read_url(base_url + "/a.json")
+    cache.read_url(base_url + "/c.json")
+
+    assert cache.get(base_url + "/a.json") is not None
+    assert cache.get(base_url + "/b.json") is None
+    assert cache.get(base_url + "/c.json") is not None
+
+
+def test_default_handlers_use_configured_cache(tmp_path, server, base_url):
+    remote_cache.configure(str(tmp_path))
+    try:
+        default_handlers["http"](base_url + "/a.json")
+        default_handlers["http"](base_url + "/a.json")
+    finally:
+        remote_cache.configure(None)
+
+    assert len(server.requests) == 1
+    assert remote_cache.get_default_cache() is None
+
+
+@pytest.fixture
+def unconfigured(monkeypatch):
+    monkeypatch.setattr(remote_cache, "_default_cache", None)
+    monkeypatch.setattr(remote_cache, "_configured", False)
+
+
+def test_environment_is_read_on_first_use(tmp_path, monkeypatch, unconfigured):
+    directory = tmp_path / "cache"
+    monkeypatch.setenv(remote_cache.CACHE_DIR_ENV, str(directory))
+    assert not directory.exists()
+
+    cache = remote_cache.get_default_cache()
+
+    assert cache is not None
+    assert cache.directory == str(directory)
+    assert directory.is_dir()
+
+
+def test_unusable_directory_disables_the_cache(
+    tmp_path, monkeypatch, unconfigured, caplog
+):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    monkeypatch.setenv(remote_cache.CACHE_DIR_ENV, str(not_a_directory))
+
+    assert remote_cache.get_default_cache() is None
+    assert "Remote document cache disabled" in caplog.text
+
+
+def test_import_does_not_create_the_directory(tmp_path):
+    directory = tmp_path / "cache"
+    subprocess.check_call(
+        [sys.executable, "-c", "import swagger_spec_validator.validator20"],
+        env=dict(os.environ, **{remote_cache.CACHE_DIR_ENV: str(directory)}),
+    )
+
+    assert not directory.exists()
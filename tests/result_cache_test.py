@@ -0,0 +1,251 @@
+import copy
+import json
+import shutil
+from email.message import Message
+from unittest import mock
+
+import pytest
+
+from swagger_spec_validator import validator20
+from swagger_spec_validator.common import get_uri_from_file_path
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.http_pool import HTTPConnectionPool
+from swagger_spec_validator.http_pool import Response
+from swagger_spec_validator.result_cache import fingerprint_document
+from swagger_spec_validator.result_cache import ValidationResultCache
+
+
+@pytest.fixture
+def petstore_dict():
+    with open("./tests/data/v2.0/petstore.json") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def minimal_swagger_dict():
+    return {
+        "swagger": "2.0",
+        "info": {"title": "Test", "version": "1.0"},
+        "paths": {},
+    }
+
+
+@pytest.fixture
+def mock_validate_spec():
+    with mock.patch(
+        "swagger_spec_validator.validator20.validate_spec",
+        wraps=validator20.validate_spec,
+    ) as m:
+        yield m
+
+
+def test_fingerprint_document_ignores_x_scope():
+    assert fingerprint_document({"a": {"$ref": "#/b"}, "b": 1}) == (
+        fingerprint_document({"b": 1, "a": {"$ref": "#/b", "x-scope": ["file:///"]}})
+    )
+    assert fingerprint_document({"a": 1}) != fingerprint_document({"a": 2})
+
+
+def test_valid_spec_is_validated_once(petstore_dict, mock_validate_spec):
+    cache = ValidationResultCache()
+
+    cache.validate_spec(petstore_dict)
+    cache.validate_spec(petstore_dict)
+
+    assert mock_validate_spec.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_invalid_spec_is_validated_once(mock_validate_spec):
+    cache = ValidationResultCache()
+
+    for _ in range(2):
+        with pytest.raises(SwaggerValidationError) as excinfo:
+            cache.validate_spec({"swagger": "2.0"})
+        assert "'info' is a required property" in str(excinfo.value)
+
+    assert mock_validate_spec.call_count == 1
+
+
+def test_changed_spec_is_validated_again(petstore_dict, mock_validate_spec):
+    cache = ValidationResultCache()
+
+    cache.validate_spec(petstore_dict)
+    petstore_dict["info"]["title"] = "Changed"
+    cache.validate_spec(petstore_dict)
+
+    assert mock_validate_spec.call_count == 2
+
+
+def test_changed_dependency_is_validated_again(tmp_path, mock_validate_spec):
+    spec_dir = tmp_path / "test_complicated_refs"
+    shutil.copytree("./tests/data/v2.0/test_complicated_refs", str(spec_dir))
+    spec_url = get_uri_from_file_path(str(spec_dir / "swagger.json"))
+    cache = ValidationResultCache()
+
+    cache.validate_spec_url(spec_url)
+    cache.validate_spec_url(spec_url)
+    assert mock_validate_spec.call_count == 1
+
+    with open(str(spec_dir / "definitions" / "pet.yaml"), "a") as f:
+        f.write("\n# edited\n")
+    cache.validate_spec_url(spec_url)
+    assert mock_validate_spec.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("invalid", "valid"),
+    (
+        # Semantic error
+        (
+            {"type": "object", "required": ["zz"]},
+            {"type": "object", "required": ["zz"], "properties": {"zz": {}}},
+        ),
+        # Error against the Swagger 2.0 schema
+        ({"type": "object", "required": []}, {"type": "object"}),
+    ),
+)
+def test_invalid_dependency_is_validated_again_once_fixed(
+    tmp_path, minimal_swagger_dict, mock_validate_spec, invalid, valid
+):
+    minimal_swagger_dict["definitions"] = {
+        "D": {"$ref": "common.json#/definitions/D"},
+    }
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(minimal_swagger_dict))
+    common_path = tmp_path / "common.json"
+    common_path.write_text(json.dumps({"definitions": {"D": invalid}}))
+    spec_url = get_uri_from_file_path(str(spec_path))
+    cache = ValidationResultCache()
+
+    for _ in range(2):
+        with pytest.raises(SwaggerValidationError):
+            cache.validate_spec_url(spec_url)
+    assert mock_validate_spec.call_count == 1
+
+    common_path.write_text(json.dumps({"definitions": {"D": valid}}))
+    cache.validate_spec_url(spec_url)
+    assert mock_validate_spec.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_local_dependencies_are_not_read_on_hits(tmp_path, mock_validate_spec):
+    spec_dir = tmp_path / "test_complicated_refs"
+    shutil.copytree("./tests/data/v2.0/test_complicated_refs", str(spec_dir))
+    spec_url = get_uri_from_file_path(str(spec_dir / "swagger.json"))
+    cache = ValidationResultCache()
+    cache.validate_spec_url(spec_url)
+
+    with mock.patch(
+        "swagger_spec_validator.result_cache.open", wraps=open
+    ) as mock_open, mock.patch(
+        "swagger_spec_validator.common.load_file"
+    ) as mock_load_file:
+        cache.validate_spec_url(spec_url)
+
+    # Only the spec itself is read, and not parsed
+    assert mock_open.call_count == 1
+    assert not mock_load_file.called
+    assert cache.hits == 1
+
+
+def test_remote_spec_is_read_with_the_connection_pool(
+    minimal_swagger_dict, mock_validate_spec
+):
+    headers = Message()
+    headers["Content-Type"] = "application/json"
+    response = Response(
+        "http://host/spec.json",
+        200,
+        headers,
+        json.dumps(minimal_swagger_dict).encode("utf-8"),
+    )
+    cache = ValidationResultCache()
+
+    with mock.patch.object(
+        HTTPConnectionPool, "request", autospec=True, return_value=response
+    ) as mock_request:
+        for _ in range(2):
+            cache.validate_spec_url("http://host/spec.json")
+
+    assert mock_request.call_count == 2
+    assert mock_validate_spec.call_count == 1
+
+
+def test_spec_is_read_with_the_handlers(minimal_swagger_dict, mock_validate_spec):
+    handler = mock.Mock(side_effect=lambda url: copy.deepcopy(minimal_swagger_dict))
+    cache = ValidationResultCache()
+
+    for _ in range(2):
+        cache.validate_spec_url(
+            "custom://host/spec.json", http_handlers={"custom": handler}
+        )
+
+    assert handler.call_count == 2
+    assert mock_validate_spec.call_count == 1
+
+
+def test_remote_dependencies_are_read_with_the_handlers(
+    minimal_swagger_dict, mock_validate_spec
+):
+    models = {"Pet": {"type": "object"}}
+    handler = mock.Mock(side_effect=lambda url: copy.deepcopy(models))
+    minimal_swagger_dict["definitions"] = {
+        "Pet": {"$ref": "custom://host/models.json#/Pet"},
+    }
+    cache = ValidationResultCache()
+
+    for _ in range(2):
+        cache.validate_spec(
+            copy.deepcopy(minimal_swagger_dict), http_handlers={"custom": handler}
+        )
+    assert mock_validate_spec.call_count == 1
+
+    models["Pet"]["type"] = "string"
+    cache.validate_spec(
+        copy.deepcopy(minimal_swagger_dict), http_handlers={"custom": handler}
+    )
+    assert mock_validate_spec.call_count == 2
+    assert {call[0][0] for call in handler.call_args_list} == {
+        "custom://host/models.json"
+    }
+
+
+def test_sqlite_tier(tmp_path, petstore_dict, mock_validate_spec):
+    sqlite_path = str(tmp_path / "results.sqlite")
+
+    ValidationResultCache(sqlite_path=sqlite_path).validate_spec(petstore_dict)
+    cache = ValidationResultCache(sqlite_path=sqlite_path)
+    cache.validate_spec(petstore_dict)
+
+    assert mock_validate_spec.call_count == 1
+    assert cache.hits == 1
+
+
+def test_library_upgrade_invalidates_results(
+    tmp_path, petstore_dict, mock_validate_spec
+):
+    sqlite_path = str(tmp_path / "results.sqlite")
+    ValidationResultCache(sqlite_path=sqlite_path).validate_spec(petstore_dict)
+
+    with mock.patch(
+        "swagger_spec_validator.result_cache.get_library_fingerprint",
+        return_value="upgraded",
+    ):
+        ValidationResultCache(sqlite_path=sqlite_path).validate_spec(petstore_dict)
+
+    assert mock_validate_spec.call_count == 2
+
+
+def test_swagger12_spec_url():
+    spec_url = get_uri_from_file_path("./tests/data/v1.2/foo/swagger_api.json")
+    cache = ValidationResultCache()
+
+    with mock.patch(
+        "swagger_spec_validator.validator12.validate_api_declaration"
+    ) as mock_validate_api_declaration:
+        cache.validate_spec_url(spec_url)
+        cache.validate_spec_url(spec_url)
+
+    assert mock_validate_api_declaration.call_count == 1
+    assert cache.hits == 1
@@ -0,0 +1,52 @@
+import mmap
+from unittest import mock
+
+import pytest
+
+from swagger_spec_validator.common import get_uri_from_file_path
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.util import validate_spec_bytes
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "./tests/data/v2.0/petstore.json",
+        "./tests/data/v2.0/minimal.yaml",
+        "./tests/data/v2.0/test_complicated_refs/swagger.json",
+    ],
+)
+def test_success(file_path):
+    with open(file_path, "rb") as f:
+        data = f.read()
+    validate_spec_bytes(data, get_uri_from_file_path(file_path))
+
+
+def test_success_memoryview():
+    with open("./tests/data/v2.0/petstore.json", "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                validate_spec_bytes(view)
+
+
+def test_yaml_memoryview():
+    with open("./tests/data/v2.0/minimal.yaml", "rb") as f:
+        validate_spec_bytes(memoryview(f.read()))
+
+
+def test_failure():
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec_bytes(b'{"swagger": "2.0"}')
+    assert "'info' is a required property" in str(excinfo.value)
+
+
+@mock.patch("swagger_spec_validator.util.get_validator")
+def test_uses_validator_for_version(mock_get_validator):
+    validate_spec_bytes(b"swaggerVersion: '1.2'", "http://localhost/api-docs")
+
+    mock_get_validator.assert_called_once_with(
+        {"swaggerVersion": "1.2"}, "http://localhost/api-docs"
+    )
+    mock_get_validator.return_value.validate_spec.assert_called_once_with(
+        {"swaggerVersion": "1.2"}, "http://localhost/api-docs"
+    )
@@ -20,3 +20,17 @@ def test_failure():
     with pytest.raises(SwaggerValidationError) as excinfo:
         validate_json({}, "schemas/v1.2/apiDeclaration.json")
     assert "'swaggerVersion' is a required property" in str(excinfo.value)
+
+
+def test_failure_reports_best_match():
+    api_declaration = {
+        "swaggerVersion": "1.2",
+        "basePath": "http://localhost",
+        "resourcePath": 5,
+        "apis": [{"path": 7, "operations": 3}],
+    }
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_json(api_declaration, "schemas/v1.2/apiDeclaration.json")
+
+    assert excinfo.value.args[1].message == "5 is not of type 'string'"
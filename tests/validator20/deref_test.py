@@ -4,6 +4,7 @@ import pytest
 from jsonschema.exceptions import RefResolutionError
 from jsonschema.validators import RefResolver
 
+from swagger_spec_validator.ref_validators import IndexedRefResolver
 from swagger_spec_validator.validator20 import deref
 
 
@@ -32,3 +33,14 @@ def test_ref_not_found():
     with pytest.raises(RefResolutionError) as excinfo:
         deref(ref_dict, RefResolver("", definitions))
     assert "Unresolvable JSON pointer" in str(excinfo.value)
+
+
+def test_ref_indexed_resolver():
+    ref_dict = {"$ref": "#/definitions/Foo"}
+    definitions = {"definitions": {"Foo": "bar"}}
+    resolver = IndexedRefResolver("", definitions)
+
+    assert deref(ref_dict, resolver) == "bar"
+    assert resolver._ref_index == {
+        ("", "#/definitions/Foo"): ("#/definitions/Foo", "bar")
+    }
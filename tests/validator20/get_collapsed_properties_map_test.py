@@ -61,3 +61,19 @@ def test_get_collapsed_properties_type_mapping_allOf_add_not_required_property()
     )
     assert required_parameters == {"type": "string", "weight": "integer"}
     assert not_required_parameters == {"name": "string", "color": "string"}
+
+
+def test_get_collapsed_properties_type_mapping_deeply_nested_allOf():
+    definition = {"properties": {"name": {"type": "string"}}, "required": ["name"]}
+    for idx in range(5000):
+        definition = {
+            "allOf": [definition, {"properties": {f"prop{idx}": {"type": "integer"}}}]
+        }
+
+    (
+        required_parameters,
+        not_required_parameters,
+    ) = get_collapsed_properties_type_mappings(definition=definition, deref=lambda x: x)
+
+    assert required_parameters == {"name": "string"}
+    assert len(not_required_parameters) == 5000
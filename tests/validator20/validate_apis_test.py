@@ -346,3 +346,36 @@ def test_invalid_inline_models_in_api_body_parameters_fails():
         str(excinfo.value) == "Definition of type array must define `items` property "
         "(definition #/paths//endpoint/parameters/0/schema/properties/prop)."
     )
+
+
+def test_path_level_params_are_dereferenced_once_per_path():
+    parameters = {
+        "tag-name": {"in": "path", "name": "tag-name", "type": "string"},
+        "limit": {"in": "query", "name": "limit", "type": "integer"},
+    }
+    apis = {
+        "/tags/{tag-name}": {
+            "parameters": [{"$ref": "#/parameters/tag-name"}],
+            **{
+                http_verb: {
+                    "parameters": [{"$ref": "#/parameters/limit"}],
+                    "responses": RESPONSES,
+                }
+                for http_verb in ("get", "put", "post", "delete")
+            },
+        },
+    }
+    resolved_refs = []
+
+    def deref(spec):
+        if isinstance(spec, dict) and "$ref" in spec:
+            resolved_refs.append(spec["$ref"])
+            return parameters[spec["$ref"].rsplit("/", 1)[1]]
+        return spec
+
+    validate_apis(apis, deref)
+
+    # Once to collect the path item parameters and once to validate it
+    assert resolved_refs.count("#/parameters/tag-name") == 2
+    # Once per operation to collect its parameters and once to validate it
+    assert resolved_refs.count("#/parameters/limit") == 8
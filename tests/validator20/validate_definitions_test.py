@@ -1,6 +1,10 @@
+from unittest import mock
+
 import pytest
 
+from swagger_spec_validator.common import ErrorPath
 from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.validator20 import validate_definition
 from swagger_spec_validator.validator20 import validate_definitions
 
 
@@ -157,3 +161,98 @@ def test_inline_model_is_not_valid_validation_fails():
         str(excinfo.value) == "Definition of type array must define `items` property "
         "(definition #/definitions/definition_1/properties/property)."
     )
+
+
+def make_deref(definitions):
+    def deref(definition):
+        if isinstance(definition, dict) and "$ref" in definition:
+            return definitions[definition["$ref"].split("/")[-1]]
+        return definition
+
+    return deref
+
+
+def test_recursive_definitions():
+    definitions = {
+        "Node": {
+            "type": "object",
+            "properties": {
+                "children": {"type": "array", "items": {"$ref": "#/definitions/Node"}},
+                "parent": {"$ref": "#/definitions/Node"},
+            },
+        },
+    }
+
+    validate_definitions(definitions, make_deref(definitions))
+
+
+def test_shared_definition_is_validated_once():
+    definitions = {
+        "Error": {"type": "object", "properties": {"code": {"type": "integer"}}},
+        "Pets": {
+            "type": "object",
+            "properties": {
+                f"error{i}": {"$ref": "#/definitions/Error"} for i in range(10)
+            },
+        },
+    }
+    deref = make_deref(definitions)
+    visited_definitions = set()
+
+    with mock.patch(
+        "swagger_spec_validator.validator20.validate_defaults_in_definition"
+    ) as mock_validate_defaults:
+        for def_name, definition in definitions.items():
+            validate_definition(
+                definition,
+                deref,
+                def_name=f"#/definitions/{def_name}",
+                visited_definitions=visited_definitions,
+            )
+
+    validated_definitions = [
+        call[0][0] for call in mock_validate_defaults.call_args_list
+    ]
+    assert validated_definitions.count(definitions["Error"]) == 1
+    assert id(definitions["Error"]) in visited_definitions
+
+
+def test_deep_definitions_are_not_serialized():
+    definition = {"type": "string"}
+    for _ in range(200):
+        definition = {"type": "object", "properties": {"child": definition}}
+
+    with mock.patch("json.dumps") as mock_dumps:
+        validate_definitions({"Deep": definition}, lambda x: x)
+
+    assert not mock_dumps.called
+
+
+def test_deeply_nested_definitions():
+    definition = {"type": "array"}
+    for _ in range(5000):
+        definition = {"type": "object", "properties": {"child": definition}}
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_definition(definition, lambda x: x, def_name="#/definitions/Deep")
+
+    assert str(excinfo.value).endswith(
+        "(definition #/definitions/Deep{}).".format("/properties/child" * 5000)
+    )
+
+
+def test_error_paths_are_only_rendered_on_errors():
+    definitions = {
+        "Pet": {
+            "type": "object",
+            "properties": {
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "owner": {"allOf": [{"type": "object"}]},
+            },
+        },
+    }
+
+    with mock.patch.object(ErrorPath, "__str__") as mock_str:
+        validate_definitions(definitions, lambda x: x)
+
+    assert not mock_str.called
@@ -3,13 +3,15 @@ import json
 import pytest
 
 from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.ref_validators import IndexedRefResolver
 from swagger_spec_validator.validator20 import validate_json
 
 
 def test_success():
     with open("./tests/data/v2.0/petstore.json") as f:
         petstore_spec = json.load(f)
-    validate_json(petstore_spec, "schemas/v2.0/schema.json")
+    resolver = validate_json(petstore_spec, "schemas/v2.0/schema.json")
+    assert isinstance(resolver, IndexedRefResolver)
 
 
 def test_failure():
@@ -66,3 +66,16 @@ def test_validate_references_to_warn(raw_spec, expected_warning_messages):
     assert sorted(expected_warning_messages) == sorted(
         str(warning.message) for warning in warninfo.list
     )
+
+
+def test_validate_references_deeply_nested_spec():
+    raw_spec = {"$ref": None}
+    for _ in range(5000):
+        raw_spec = {"nested": [raw_spec]}
+
+    with pytest.warns(SwaggerValidationWarning) as warninfo:
+        validate_references(raw_spec=raw_spec, deref=lambda x: x)
+
+    assert str(warninfo.list[0].message).endswith(
+        "(path: #{})".format("/nested/0" * 5000)
+    )
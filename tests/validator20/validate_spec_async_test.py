@@ -0,0 +1,71 @@
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.validator20 import validate_spec_async
+from swagger_spec_validator.validator20 import validate_spec_url_async
+from tests.conftest import DOCUMENTS
+
+
+class AsyncFetcher:
+    def __init__(self):
+        self.requested = []
+
+    async def __call__(self, uri):
+        self.requested.append(uri)
+        parsed = urlsplit(uri)
+        reader, writer = await asyncio.open_connection(parsed.hostname, parsed.port)
+        writer.write(f"GET {parsed.path} HTTP/1.0\r\n\r\n".encode())
+        response = await reader.read()
+        writer.close()
+        status_line, _, body = response.partition(b"\r\n\r\n")
+        if b" 200 " not in status_line:
+            raise OSError(f"Failed to fetch {uri}: {status_line.decode()}")
+        return json.loads(body)
+
+
+def test_validate_spec_url_async(base_url):
+    fetcher = AsyncFetcher()
+
+    resolver = asyncio.run(
+        validate_spec_url_async(
+            f"{base_url}/swagger.json", async_handlers={"http": fetcher}
+        )
+    )
+
+    assert [urlsplit(uri).path for uri in fetcher.requested] == [
+        "/swagger.json",
+        "/definitions.json",
+        "/people.json",
+    ]
+    assert len([uri for uri in resolver.store if uri.startswith("http://127")]) == 3
+
+
+def test_validate_spec_async_failure(base_url):
+    spec_dict = json.loads(json.dumps(DOCUMENTS["/swagger.json"]))
+    spec_dict["paths"]["/pets"]["get"]["responses"]["200"]["schema"] = {
+        "$ref": "missing.json#/Pet"
+    }
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        asyncio.run(
+            validate_spec_async(
+                spec_dict,
+                f"{base_url}/swagger.json",
+                async_handlers={"http": AsyncFetcher()},
+            )
+        )
+    assert "404" in str(excinfo.value)
+
+
+def test_validate_spec_url_async_fetch_failure(base_url):
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        asyncio.run(
+            validate_spec_url_async(
+                f"{base_url}/missing.json", async_handlers={"http": AsyncFetcher()}
+            )
+        )
+    assert "404 Not Found" in str(excinfo.value)
@@ -1,9 +1,17 @@
+import copy
 import json
+import threading
+from unittest import mock
 
 import pytest
 from jsonschema.validators import RefResolver
 
+from swagger_spec_validator.common import read_url
 from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.common import SwaggerValidationWarning
+from swagger_spec_validator.ref_validators import get_scope
+from swagger_spec_validator.ref_validators import IndexedRefResolver
+from swagger_spec_validator.validator20 import validate_apis
 from swagger_spec_validator.validator20 import validate_spec
 from tests.validator20.conftest import get_spec_json_and_url
 
@@ -499,3 +507,281 @@ def test_array_items_validated(minimal_swagger_dict, default_checks_spec_dict):
 
     with pytest.raises(SwaggerValidationError):
         validate_spec(minimal_swagger_dict)
+
+
+def test_errors_expose_the_documents_read():
+    file_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    swagger_dict, origin_url = get_spec_json_and_url(file_path)
+    swagger_dict["info"] = None
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(swagger_dict, spec_url=origin_url)
+
+    assert excinfo.value.resolver.resolution_scope == origin_url
+    assert any(uri.endswith("pet.yaml") for uri in excinfo.value.resolver.store)
+
+
+def test_complicated_refs_are_prefetched():
+    file_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    swagger_dict, origin_url = get_spec_json_and_url(file_path)
+
+    with mock.patch(
+        "swagger_spec_validator.ref_validators.IndexedRefResolver.__init__",
+        autospec=True,
+        side_effect=IndexedRefResolver.__init__,
+    ) as mock_init:
+        validate_spec(swagger_dict, spec_url=origin_url)
+
+    # All the referenced files are available before structural validation
+    store = mock_init.call_args[1]["store"]
+    assert len([uri for uri in store if uri.startswith("file://")]) == 6
+
+
+def test_complicated_refs_without_prefetch():
+    file_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    swagger_dict, origin_url = get_spec_json_and_url(file_path)
+
+    resolver = validate_spec(swagger_dict, spec_url=origin_url, prefetch=False)
+
+    assert len([uri for uri in resolver.store.keys() if uri.startswith("file://")]) == 7
+
+
+def test_complicated_refs_with_custom_handlers_are_not_prefetched():
+    file_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    swagger_dict, origin_url = get_spec_json_and_url(file_path)
+    threads = set()
+
+    def handler(uri):
+        threads.add(threading.current_thread())
+        return read_url(uri)
+
+    validate_spec(swagger_dict, spec_url=origin_url, http_handlers={"file": handler})
+
+    assert threads == {threading.current_thread()}
+
+
+@pytest.mark.parametrize(
+    "file_path",
+    [
+        "./tests/data/v2.0/petstore.json",
+        "./tests/data/v2.0/test_complicated_refs/swagger.json",
+    ],
+)
+def test_success_without_mutating_spec(file_path):
+    swagger_dict, origin_url = get_spec_json_and_url(file_path)
+    original_swagger_dict = copy.deepcopy(swagger_dict)
+
+    resolver = validate_spec(swagger_dict, spec_url=origin_url, mutate_spec=False)
+
+    assert swagger_dict == original_swagger_dict
+    assert "x-scope" not in json.dumps(
+        [document for uri, document in resolver.store.items() if "file:" in uri]
+    )
+    assert resolver.ref_scopes
+
+
+def test_complicated_refs_scopes_without_mutating_spec():
+    file_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    swagger_dict, origin_url = get_spec_json_and_url(file_path)
+    mutated_swagger_dict = copy.deepcopy(swagger_dict)
+
+    resolver = validate_spec(swagger_dict, spec_url=origin_url, mutate_spec=False)
+    validate_spec(mutated_swagger_dict, spec_url=origin_url)
+
+    ref_dict = swagger_dict["paths"]["/ping"]
+    assert get_scope(ref_dict, resolver) == (origin_url,)
+    assert (
+        get_scope(ref_dict, resolver)
+        == mutated_swagger_dict["paths"]["/ping"]["x-scope"]
+    )
+
+
+def test_failure_without_mutating_spec(minimal_swagger_dict, node_spec):
+    minimal_swagger_dict["definitions"]["Node"] = node_spec
+    node_spec["properties"]["foo"] = {"$ref": "#/definitions/Foo"}
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(minimal_swagger_dict, mutate_spec=False)
+    assert "Unresolvable JSON pointer" in str(excinfo.value)
+    assert "x-scope" not in node_spec["properties"]["foo"]
+
+
+def make_spec_with_shared_definition(minimal_swagger_dict, definition):
+    minimal_swagger_dict["definitions"] = {"Shared": definition}
+    minimal_swagger_dict["paths"] = {
+        f"/pets{i}": {
+            "post": {
+                "parameters": [
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "schema": {"$ref": "#/definitions/Shared"},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "description": "ok",
+                        "schema": {"$ref": "#/definitions/Shared"},
+                    },
+                },
+            },
+        }
+        for i in range(5)
+    }
+    return minimal_swagger_dict
+
+
+def test_shared_definition_is_validated_once_per_spec(minimal_swagger_dict):
+    definition = {"type": "object", "properties": {"name": {"type": "string"}}}
+    spec_dict = make_spec_with_shared_definition(minimal_swagger_dict, definition)
+
+    with mock.patch(
+        "swagger_spec_validator.validator20.validate_defaults_in_definition"
+    ) as mock_validate_defaults:
+        validate_spec(spec_dict)
+
+    validated_definitions = [
+        call[0][0] for call in mock_validate_defaults.call_args_list
+    ]
+    assert validated_definitions.count(definition) == 1
+
+
+def test_shared_definition_error_reports_first_path(minimal_swagger_dict):
+    spec_dict = make_spec_with_shared_definition(
+        minimal_swagger_dict, {"type": "array"}
+    )
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(spec_dict)
+
+    assert str(excinfo.value) == (
+        "Definition of type array must define `items` property "
+        "(definition #/paths//pets0/post/parameters/0/schema)."
+    )
+
+
+def test_remote_definition_error_reports_first_path(tmp_path, minimal_swagger_dict):
+    models = tmp_path / "models.json"
+    models.write_text(json.dumps({"Shared": {"type": "array"}}))
+    spec_dict = make_spec_with_shared_definition(minimal_swagger_dict, {})
+    del spec_dict["definitions"]["Shared"]
+    for path_item in spec_dict["paths"].values():
+        operation = path_item["post"]
+        operation["parameters"][0]["schema"]["$ref"] = "models.json#/Shared"
+        operation["responses"]["200"]["schema"]["$ref"] = "models.json#/Shared"
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(spec_dict, (tmp_path / "swagger.json").as_uri())
+
+    assert str(excinfo.value) == (
+        "Definition of type array must define `items` property "
+        "(definition #/paths//pets0/post/parameters/0/schema)."
+    )
+
+
+def test_extra_rules(minimal_swagger_dict):
+    spec_dict = make_spec_with_shared_definition(
+        minimal_swagger_dict, {"type": "object"}
+    )
+
+    def require_description(node, spec_walker):
+        if "description" not in node.value:
+            raise SwaggerValidationError(f"Missing description in {node.def_name}")
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(spec_dict, extra_rules={"schema": [require_description]})
+
+    assert str(excinfo.value) == (
+        "Missing description in #/paths//pets0/post/parameters/0/schema"
+    )
+
+
+def test_referenced_responses_are_not_checked(minimal_swagger_dict):
+    minimal_swagger_dict["responses"] = {
+        "Items": {"description": "items", "schema": {"type": "array"}},
+    }
+    minimal_swagger_dict["paths"] = {
+        "/items": {
+            "get": {"responses": {"200": {"$ref": "#/responses/Items"}}},
+        },
+    }
+
+    # Like validate_apis, responses given by a $ref are not checked
+    validate_spec(minimal_swagger_dict)
+    validate_apis(minimal_swagger_dict["paths"], lambda value: value)
+
+
+def test_paths_are_checked_before_definitions(minimal_swagger_dict):
+    minimal_swagger_dict["definitions"] = {"Items": {"type": "array"}}
+    minimal_swagger_dict["paths"] = {
+        "/items/{id}": {"get": {"responses": {"200": {"description": "ok"}}}},
+    }
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(minimal_swagger_dict)
+
+    assert "Path parameter 'id' used is not documented" in str(excinfo.value)
+
+
+def test_spec_without_refs_is_not_dereferenced(minimal_swagger_dict):
+    minimal_swagger_dict["paths"]["/pets"] = {
+        "get": {
+            "parameters": [
+                {"name": "limit", "in": "query", "type": "integer", "default": 10},
+            ],
+            "responses": {"200": {"description": "OK"}},
+        },
+    }
+
+    with mock.patch(
+        "swagger_spec_validator.ref_validators.create_dereffing_validator"
+    ) as mock_create, mock.patch(
+        "swagger_spec_validator.validator20.prefetch_remote_refs"
+    ) as mock_prefetch:
+        resolver = validate_spec(minimal_swagger_dict)
+
+    assert not resolver.has_refs
+    assert not mock_create.called
+    assert not mock_prefetch.called
+
+
+def test_spec_without_refs_errors_are_reported(minimal_swagger_dict):
+    minimal_swagger_dict["paths"]["/pets"] = {
+        "get": {
+            "parameters": [
+                {"name": "limit", "in": "query", "type": "integer", "default": "a"},
+            ],
+            "responses": {"200": {"description": "OK"}},
+        },
+    }
+
+    with pytest.raises(SwaggerValidationError) as excinfo:
+        validate_spec(minimal_swagger_dict)
+
+    assert "'a' is not of type 'integer'" in str(excinfo.value)
+
+
+def test_ref_warnings_report_the_location_of_the_ref(minimal_swagger_dict):
+    minimal_swagger_dict["paths"] = {
+        "/items": {
+            "get": {
+                "responses": {
+                    "200": {
+                        "description": "ok",
+                        "schema": {"$ref": "#/definitions/Item"},
+                    },
+                },
+            },
+        },
+    }
+    minimal_swagger_dict["definitions"] = {
+        "Item": {"type": "object", "x-extends": {"$ref": None}},
+    }
+
+    with pytest.warns(SwaggerValidationWarning) as warninfo:
+        validate_spec(minimal_swagger_dict)
+
+    # Not the location of the response the definition was reached from
+    assert str(warninfo.list[0].message).endswith(
+        "(path: #/definitions/Item/x-extends)"
+    )
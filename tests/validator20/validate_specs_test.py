@@ -0,0 +1,46 @@
+import json
+from unittest import mock
+
+from jsonschema.validators import RefResolver
+
+from swagger_spec_validator.common import read_url
+from swagger_spec_validator.common import SwaggerValidationError
+from swagger_spec_validator.validator20 import validate_specs
+from tests.validator20.conftest import get_spec_json_and_url
+
+
+def test_success(petstore_dict):
+    results = validate_specs([(petstore_dict, "")])
+
+    assert len(results) == 1
+    assert results[0].is_valid
+    assert isinstance(results[0].resolver, RefResolver)
+
+
+def test_errors_are_returned_in_order(petstore_contents):
+    results = validate_specs(
+        [
+            (json.loads(petstore_contents), "first"),
+            ({}, "second"),
+            (json.loads(petstore_contents), "third"),
+        ]
+    )
+
+    assert [result.spec_url for result in results] == ["first", "second", "third"]
+    assert [result.is_valid for result in results] == [True, False, True]
+    assert isinstance(results[1].error, SwaggerValidationError)
+    assert "'swagger' is a required property" in str(results[1].error)
+    assert results[1].resolver is None
+
+
+def test_remote_documents_are_fetched_once():
+    file_path = "./tests/data/v2.0/test_complicated_refs/swagger.json"
+    specs = [get_spec_json_and_url(file_path), get_spec_json_and_url(file_path)]
+    handler = mock.Mock(side_effect=read_url)
+
+    results = validate_specs(specs, http_handlers={"file": handler})
+
+    assert all(result.is_valid for result in results)
+    # 5 json files and 1 yaml file referenced by swagger.json, fetched while
+    # validating the first spec only
+    assert handler.call_count == 6
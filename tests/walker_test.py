@@ -0,0 +1,183 @@
+import functools
+
+from swagger_spec_validator.ref_validators import IndexedRefResolver
+from swagger_spec_validator.validator20 import deref
+from swagger_spec_validator.walker import merge_rules
+from swagger_spec_validator.walker import OPERATION
+from swagger_spec_validator.walker import PARAMETER
+from swagger_spec_validator.walker import PATH_ITEM
+from swagger_spec_validator.walker import REF
+from swagger_spec_validator.walker import RESPONSE
+from swagger_spec_validator.walker import SCHEMA
+from swagger_spec_validator.walker import SpecWalker
+
+
+SPEC = {
+    "swagger": "2.0",
+    "info": {"title": "Test", "version": "1.0"},
+    "paths": {
+        "/pets/{id}": {
+            "parameters": [{"$ref": "#/parameters/id"}],
+            "get": {
+                "responses": {
+                    "200": {
+                        "description": "pet",
+                        "schema": {"$ref": "#/definitions/Pet"},
+                    },
+                },
+            },
+            "delete": {
+                "parameters": [
+                    {"name": "force", "in": "query", "type": "boolean"},
+                ],
+                "responses": {"204": {"description": "deleted"}},
+            },
+        },
+        "/pets": {
+            "post": {
+                "parameters": [
+                    {
+                        "name": "pet",
+                        "in": "body",
+                        "schema": {"$ref": "#/definitions/Pet"},
+                    },
+                ],
+                "responses": {"201": {"description": "created"}},
+            },
+        },
+    },
+    "definitions": {
+        "Pet": {
+            "allOf": [
+                {"$ref": "#/definitions/Named"},
+                {
+                    "type": "object",
+                    "properties": {
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+            ],
+        },
+        "Named": {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "additionalProperties": {"type": "string"},
+        },
+    },
+    "parameters": {
+        "id": {"name": "id", "in": "path", "required": True, "type": "string"},
+    },
+}
+
+
+def walk(spec_dict, rules):
+    resolver = IndexedRefResolver("", spec_dict)
+    spec_walker = SpecWalker(functools.partial(deref, resolver=resolver), rules)
+    spec_walker.walk(spec_dict)
+    return spec_walker
+
+
+def record_nodes(*kinds):
+    visited = []
+
+    def record(node, spec_walker):
+        visited.append(node)
+
+    walk(SPEC, {kind: [record] for kind in kinds})
+    return visited
+
+
+def test_schemas_are_visited_once_with_their_def_name():
+    # Paths are walked first, and schemas are reported where they are first
+    # reached
+    assert [node.def_name for node in record_nodes(SCHEMA)] == [
+        "#/paths//pets/{id}/get/responses/200",
+        "#/paths//pets/{id}/get/responses/200/0",
+        "#/paths//pets/{id}/get/responses/200/0/properties/name",
+        "#/paths//pets/{id}/get/responses/200/0/additionalProperties",
+        "#/paths//pets/{id}/get/responses/200/1",
+        "#/paths//pets/{id}/get/responses/200/1/properties/tags",
+        "#/paths//pets/{id}/get/responses/200/1/properties/tags/items",
+    ]
+
+
+def test_nodes_are_dereferenced():
+    schemas = record_nodes(SCHEMA)
+
+    assert schemas[1].value is SPEC["definitions"]["Named"]
+    # Nodes are located in their document, not where they were reached from
+    assert schemas[1].path.parts() == ("#", "definitions", "Named")
+    assert schemas[2].path.parts() == (
+        "#",
+        "definitions",
+        "Named",
+        "properties",
+        "name",
+    )
+    assert schemas[1].parent is schemas[0]
+
+
+def test_path_items_and_operations():
+    nodes = record_nodes(PATH_ITEM, OPERATION, PARAMETER, RESPONSE)
+
+    assert [(node.kind, node.def_name) for node in nodes] == [
+        (PATH_ITEM, "#/paths//pets/{id}"),
+        (PARAMETER, "#/paths//pets/{id}/parameters/0"),
+        (OPERATION, "#/paths//pets/{id}/get"),
+        (RESPONSE, "#/paths//pets/{id}/get/responses/200"),
+        (OPERATION, "#/paths//pets/{id}/delete"),
+        (PARAMETER, "#/paths//pets/{id}/delete/parameters/0"),
+        (RESPONSE, "#/paths//pets/{id}/delete/responses/204"),
+        (PATH_ITEM, "#/paths//pets"),
+        (OPERATION, "#/paths//pets/post"),
+        (PARAMETER, "#/paths//pets/post/parameters/0"),
+        (RESPONSE, "#/paths//pets/post/responses/201"),
+        (PARAMETER, "#/parameters/id"),
+    ]
+    assert nodes[2].parent is nodes[0]
+    # Parameters given by a $ref are visited as the $ref dict
+    assert nodes[1].value is SPEC["paths"]["/pets/{id}"]["parameters"][0]
+
+
+def test_shared_path_items_are_visited_for_each_path():
+    path_item = {"get": {"responses": {"200": {"description": "ok"}}}}
+    spec_dict = {"paths": {"/a": path_item, "/b": {"$ref": "#/paths/~1a"}}}
+    visited = []
+
+    walk(spec_dict, {OPERATION: [lambda node, _: visited.append(node.def_name)]})
+
+    assert visited == ["#/paths//a/get", "#/paths//b/get"]
+
+
+def test_refs_without_scope_are_not_followed_outside_of_the_checked_nodes():
+    spec_dict = {
+        "info": {"x-model": {"$ref": "#/x-models/Model"}},
+        "x-models": {"Model": {"$ref": None}},
+    }
+    visited = []
+
+    walk(spec_dict, {REF: [lambda node, _: visited.append(node.def_name)]})
+
+    assert visited == ["#/info/x-model", "#/x-models/Model"]
+
+
+def test_state_is_shared_by_the_rules():
+    def count_operations(node, spec_walker):
+        spec_walker.state["operations"] = spec_walker.state.get("operations", 0) + 1
+
+    spec_walker = walk(SPEC, {OPERATION: [count_operations]})
+
+    assert spec_walker.state["operations"] == 3
+
+
+def test_merge_rules():
+    def rule_a(node, spec_walker):
+        pass
+
+    def rule_b(node, spec_walker):
+        pass
+
+    assert merge_rules({SCHEMA: [rule_a]}, None, {SCHEMA: [rule_b], REF: [rule_a]}) == {
+        SCHEMA: [rule_a, rule_b],
+        REF: [rule_a],
+    }